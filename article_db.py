@@ -0,0 +1,506 @@
+# article_db.py
+# 🗄️ SQLite 기사 저장소
+# - 방송사별 기사/분류 확률/핵심어/t-SNE 좌표를 테이블로 보관하고 목록·조회에 쓰는 열에 인덱스
+# - 목록 페이지는 LIMIT/OFFSET, 기사 조회는 id 인덱스로 처리 → 요청 비용이 전체 기사 수가 아니라 결과 크기에 비례
+# - 원본 기사는 data 열에 JSON 그대로 두어 템플릿에서 쓰는 필드가 파일 기반과 똑같이 나옴
+# - 가져오기: python article_db.py [--data-dir DIR] [--db PATH] [방송사 ...]
+#   (방송사 단위로 지우고 다시 넣는 한 번의 트랜잭션, WAL 모드라 웹 서버는 가져오는 중에도 이전 데이터를 읽음)
+# - 가져온 시점의 원본 파일 서명(record_io.source_signature)을 companies.source에 기록
+#   → 파이프라인(utils/updated.py 병합, tsne_generate.py)이 파일과 함께 DB도 갱신하고 서명을 맞춤
+#   → 서명이 지금 파일과 다르면 웹(article_store)은 오래된 DB 대신 파일을 읽음
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+from article_store import SORT_KEYS, ArticlePage, ArticleStore, format_date
+from neighbors import TsneNeighbors
+from record_io import committed_size, iter_batches, read_records, source_signature
+from search_index import refresh
+from similarity import SimilarityEngine
+from trending import STOPWORDS, TrendingKeywords, _hour_of
+
+DEFAULT_DATA_DIR = "data/use/crawling"
+DEFAULT_DB_PATH = "data/use/articles.sqlite"
+INSERT_BATCH = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS companies (
+    company TEXT PRIMARY KEY,
+    version INTEGER NOT NULL,
+    imported_at REAL NOT NULL,
+    source TEXT,
+    article_count INTEGER,
+    topic_counts TEXT
+);
+CREATE TABLE IF NOT EXISTS articles (
+    row_id INTEGER PRIMARY KEY,
+    company TEXT NOT NULL,
+    id INTEGER,
+    topic TEXT,
+    upload_date_kst TEXT NOT NULL,
+    view_count INTEGER NOT NULL,
+    video_link TEXT,
+    title TEXT,
+    data TEXT NOT NULL
+);
+-- 예전 인덱스 (동점 순서까지 맞춘 아래 인덱스로 대체)
+DROP INDEX IF EXISTS idx_articles_topic_date;
+DROP INDEX IF EXISTS idx_articles_date;
+DROP INDEX IF EXISTS idx_articles_views;
+CREATE INDEX IF NOT EXISTS idx_articles_company ON articles(company);
+CREATE INDEX IF NOT EXISTS idx_articles_topic ON articles(company, topic);
+CREATE INDEX IF NOT EXISTS idx_articles_latest ON articles(company, upload_date_kst DESC, row_id);
+CREATE INDEX IF NOT EXISTS idx_articles_topic_latest ON articles(company, topic, upload_date_kst DESC, row_id);
+CREATE INDEX IF NOT EXISTS idx_articles_most_viewed ON articles(company, view_count DESC, row_id);
+CREATE INDEX IF NOT EXISTS idx_articles_topic_most_viewed ON articles(company, topic, view_count DESC, row_id);
+CREATE INDEX IF NOT EXISTS idx_articles_topic_order ON articles(company, (COALESCE(topic, '') = '기타'), COALESCE(topic, ''));
+CREATE INDEX IF NOT EXISTS idx_articles_id ON articles(company, id);
+CREATE INDEX IF NOT EXISTS idx_articles_video_link ON articles(video_link);
+CREATE TABLE IF NOT EXISTS probabilities (
+    row_id INTEGER NOT NULL REFERENCES articles(row_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    label TEXT NOT NULL,
+    prob REAL NOT NULL,
+    PRIMARY KEY (row_id, position)
+);
+CREATE TABLE IF NOT EXISTS keywords (
+    row_id INTEGER NOT NULL REFERENCES articles(row_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    keyword TEXT NOT NULL,
+    PRIMARY KEY (row_id, position)
+);
+CREATE TABLE IF NOT EXISTS tsne (
+    row_id INTEGER PRIMARY KEY,
+    company TEXT NOT NULL,
+    id INTEGER,
+    x REAL,
+    y REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tsne_id ON tsne(company, id);
+"""
+
+# article_store._sorted_articles와 같은 순서 (동점이면 원래 파일 순서 = row_id)
+# 정렬마다 같은 순서의 인덱스가 있어서 (방송사 전체/주제별) 페이지 크기만큼만 읽음, "topic"은 식 인덱스 idx_articles_topic_order
+ORDER_BY = {
+    "latest": "upload_date_kst DESC, row_id",
+    "topic": "(COALESCE(topic, '') = '기타'), COALESCE(topic, ''), row_id",
+    "views": "view_count DESC, row_id",
+    None: "row_id",
+}
+
+
+def _insert_articles(conn, company, articles):
+    # 빈 날짜/조회수는 ""/0으로 넣어서 인덱스 순서가 파일 기반 정렬(x or "", x or 0)과 같게 함
+    # 반환: 넣은 기사의 주제별 개수 (companies의 개수 갱신용)
+    topics = Counter()
+    for article in articles:
+        cursor = conn.execute(
+            "INSERT INTO articles (company, id, topic, upload_date_kst, view_count, video_link, title, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                company,
+                article.get("id"),
+                article.get("topic"),
+                article.get("upload_date_kst") or "",
+                article.get("view_count") or 0,
+                article.get("video_link"),
+                article.get("title"),
+                json.dumps(article, ensure_ascii=False),
+            ),
+        )
+        row_id = cursor.lastrowid
+        conn.executemany(
+            "INSERT INTO probabilities VALUES (?, ?, ?, ?)",
+            [(row_id, i, label, prob)
+             for i, (label, prob) in enumerate((article.get("probabilities") or {}).items())],
+        )
+        conn.executemany(
+            "INSERT INTO keywords VALUES (?, ?, ?)",
+            [(row_id, i, keyword) for i, keyword in enumerate(article.get("keywords") or [])],
+        )
+        topics[article.get("topic")] += 1
+    return topics
+
+
+def _insert_tsne(conn, company, tsne_data):
+    tsne_count = 0
+    for batch in iter_batches(tsne_data, INSERT_BATCH):
+        conn.executemany(
+            "INSERT INTO tsne (company, id, x, y, data) VALUES (?, ?, ?, ?, ?)",
+            [(company, p.get("id"), p.get("x"), p.get("y"), json.dumps(p, ensure_ascii=False)) for p in batch],
+        )
+        tsne_count += len(batch)
+    return tsne_count
+
+
+def _source_is(conn, company, source):
+    row = conn.execute("SELECT source FROM companies WHERE company = ?", (company,)).fetchone()
+    return row is not None and row[0] == source
+
+
+def _bump_version(conn, company, source):
+    conn.execute(
+        "INSERT INTO companies (company, version, imported_at, source) VALUES (?, 1, ?, ?) "
+        "ON CONFLICT(company) DO UPDATE SET version = version + 1, imported_at = excluded.imported_at,"
+        " source = excluded.source",
+        (company, time.time(), source),
+    )
+
+
+def _update_counts(conn, company, topics, reset=False):
+    # 목록 페이지 개수는 요청마다 COUNT(*) 하지 않고 companies에 보관한 값 사용 (가져오기는 새로, 추가는 더해서)
+    row = conn.execute("SELECT article_count, topic_counts FROM companies WHERE company = ?", (company,)).fetchone()
+    if reset or row[0] is None:
+        total, counts = 0, {}
+    else:
+        total, counts = row[0], json.loads(row[1])
+    for topic, count in topics.items():
+        total += count
+        if topic:
+            counts[topic] = counts.get(topic, 0) + count
+    conn.execute(
+        "UPDATE companies SET article_count = ?, topic_counts = ? WHERE company = ?",
+        (total, json.dumps(counts, ensure_ascii=False), company),
+    )
+    return total
+
+
+def _recount(conn, company):
+    topics = Counter(dict(conn.execute(
+        "SELECT topic, COUNT(*) FROM articles WHERE company = ? GROUP BY topic", (company,)
+    ).fetchall()))
+    _update_counts(conn, company, topics, reset=True)
+
+
+def _article(data):
+    article = json.loads(data)
+    article["formatted_date"] = format_date(article.get("upload_date_kst", ""))
+    return article
+
+
+class ArticleDB:
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.executescript(SCHEMA)
+        # 열이 없던 예전 DB
+        # - source: 서명이 없으면 파일이 있는 한 파일을 우선 사용 → 다시 가져오면 DB 사용
+        # - article_count, topic_counts: 한 번 세어서 채움
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(companies)")]
+        for column, column_type in (("source", "TEXT"), ("article_count", "INTEGER"), ("topic_counts", "TEXT")):
+            if column not in columns:
+                self._conn.execute(f"ALTER TABLE companies ADD COLUMN {column} {column_type}")
+        for (company,) in self._conn.execute("SELECT company FROM companies WHERE article_count IS NULL").fetchall():
+            _recount(self._conn, company)
+        self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _query(self, sql, params=()):
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # ───────────────────────────────────────────
+    # 📥 가져오기
+    def import_company(self, company, articles, tsne_data, source=None):
+        with self._lock:
+            conn = self._conn
+            with conn:
+                conn.execute("DELETE FROM articles WHERE company = ?", (company,))
+                conn.execute("DELETE FROM tsne WHERE company = ?", (company,))
+                topics = _insert_articles(conn, company, articles)
+                tsne_count = _insert_tsne(conn, company, tsne_data)
+                _bump_version(conn, company, source)
+                article_count = _update_counts(conn, company, topics, reset=True)
+        return article_count, tsne_count
+
+    # 파이프라인이 파일을 바꾼 뒤 DB도 같은 내용으로 맞춤
+    # - previous_source: 파일을 바꾸기 전 서명, DB가 그 시점과 같을 때만 반영
+    # - 가져온 적 없는 방송사거나 DB가 이미 오래됐으면 None (웹은 파일 사용, 다시 가져오면 DB로 돌아감)
+    def append_articles(self, company, articles, previous_source, source):
+        # 병합(utils/updated.py)으로 아카이브 끝에 붙인 새 기사만 추가
+        with self._lock:
+            conn = self._conn
+            with conn:
+                if not _source_is(conn, company, previous_source):
+                    return None
+                topics = _insert_articles(conn, company, articles)
+                _bump_version(conn, company, source)
+                _update_counts(conn, company, topics)
+        return sum(topics.values())
+
+    def replace_tsne(self, company, tsne_data, previous_source, source):
+        # t-SNE를 다시 계산하면(tsne_generate.py) 좌표만 통째로 교체
+        with self._lock:
+            conn = self._conn
+            with conn:
+                if not _source_is(conn, company, previous_source):
+                    return None
+                conn.execute("DELETE FROM tsne WHERE company = ?", (company,))
+                tsne_count = _insert_tsne(conn, company, tsne_data)
+                _bump_version(conn, company, source)
+        return tsne_count
+
+    # ───────────────────────────────────────────
+    # 🔎 조회
+    def companies(self):
+        return [row[0] for row in self._query("SELECT company FROM companies ORDER BY company")]
+
+    def version(self, company):
+        rows = self._query("SELECT version FROM companies WHERE company = ?", (company,))
+        return ("db", rows[0][0]) if rows else None
+
+    def source(self, company):
+        rows = self._query("SELECT source FROM companies WHERE company = ?", (company,))
+        return rows[0][0] if rows else None
+
+    def view(self, company, version, search, terms_path=None):
+        return ArticleDBView(self, company, version, search, terms_path)
+
+    def topics(self, company):
+        rows = self._query("SELECT DISTINCT COALESCE(topic, '기타') FROM articles WHERE company = ?", (company,))
+        return sorted((row[0] for row in rows), key=lambda x: (x == "기타", x))
+
+    def count(self, company, topic=None):
+        # 목록에 나오는 기사 수 (companies에 보관한 개수)
+        rows = self._query("SELECT article_count, topic_counts FROM companies WHERE company = ?", (company,))
+        if not rows:
+            return 0
+        if topic:
+            return json.loads(rows[0][1]).get(topic, 0)
+        return rows[0][0]
+
+    def page(self, company, sort=None, topic=None, page=1, limit=30):
+        if sort not in SORT_KEYS:
+            sort = None
+        where, params = "company = ?", [company]
+        if topic:
+            where += " AND topic = ?"
+            params.append(topic)
+            if sort == "topic":
+                sort = None  # 한 주제 안에서는 주제 순서 = 원래 순서
+        total = self.count(company, topic)
+        rows = self._query(
+            f"SELECT data FROM articles WHERE {where} ORDER BY {ORDER_BY[sort]} LIMIT ? OFFSET ?",
+            params + [limit, (page - 1) * limit],
+        )
+        return ArticlePage([_article(row[0]) for row in rows], page, limit, total)
+
+    def article(self, company, article_id):
+        # 같은 id가 여러 번 있으면 파일 기반과 마찬가지로 처음 것
+        rows = self._query(
+            "SELECT data FROM articles WHERE company = ? AND id = ? ORDER BY row_id LIMIT 1", (company, article_id)
+        )
+        return _article(rows[0][0]) if rows else None
+
+    def tsne_point(self, company, article_id):
+        rows = self._query(
+            "SELECT data FROM tsne WHERE company = ? AND id = ? ORDER BY row_id LIMIT 1", (company, article_id)
+        )
+        return json.loads(rows[0][0]) if rows else None
+
+    def tsne_data(self, company):
+        rows = self._query("SELECT data FROM tsne WHERE company = ? ORDER BY row_id", (company,))
+        return [json.loads(row[0]) for row in rows]
+
+    def search_rows(self, company):
+        # 검색 색인용: 기사 순서대로 명사 파일을 찾는 키와, 명사 파일에 없을 때 대신 쓰는 필드만
+        fields = ("id", "video_link", "title", "cleaned_title", "keywords")
+        articles = []
+        for (data,) in self._query("SELECT data FROM articles WHERE company = ? ORDER BY row_id", (company,)):
+            article = json.loads(data)
+            articles.append({field: article.get(field) for field in fields})
+        return articles
+
+    def probability_rows(self, company):
+        # 유사도 계산용: 기사 순서대로 {"id", "probabilities"}만
+        articles = {}
+        for row_id, article_id in self._query(
+            "SELECT row_id, id FROM articles WHERE company = ? ORDER BY row_id", (company,)
+        ):
+            articles[row_id] = {"id": article_id, "probabilities": {}}
+        for row_id, label, prob in self._query(
+            "SELECT p.row_id, p.label, p.prob FROM probabilities p JOIN articles a ON a.row_id = p.row_id"
+            " WHERE a.company = ? ORDER BY p.row_id, p.position", (company,)
+        ):
+            articles[row_id]["probabilities"][label] = prob
+        return list(articles.values())
+
+    def keyword_rows(self, company, since=""):
+        # 트렌드 계산용: since 이후 기사의 {"topic", "upload_date_kst", "keywords"}만
+        articles = {}
+        for row_id, topic, date, keyword in self._query(
+            "SELECT a.row_id, a.topic, a.upload_date_kst, k.keyword FROM articles a"
+            " JOIN keywords k ON k.row_id = a.row_id"
+            " WHERE a.company = ? AND a.upload_date_kst >= ? ORDER BY a.row_id, k.position", (company, since)
+        ):
+            article = articles.setdefault(row_id, {"topic": topic, "upload_date_kst": date, "keywords": []})
+            article["keywords"].append(keyword)
+        return list(articles.values())
+
+    def latest_keyword_date(self, company):
+        return self._trend_query(company, "MAX(a.upload_date_kst)")[0][0]
+
+    def keyword_topics(self, company):
+        # 처음 등장한 순서 (TrendingKeywords.topics와 같은 순서)
+        rows = self._trend_query(
+            company, "COALESCE(NULLIF(a.topic, ''), '기타') AS t, MIN(a.row_id)", " GROUP BY t ORDER BY MIN(a.row_id)"
+        )
+        return [row[0] for row in rows]
+
+    def _trend_query(self, company, select, tail=""):
+        # 날짜가 있고 불용어가 아닌 핵심어가 하나라도 있는 기사 (TrendingKeywords가 세는 기사)
+        marks = ",".join("?" * len(STOPWORDS))
+        return self._query(
+            f"SELECT {select} FROM articles a WHERE a.company = ? AND a.upload_date_kst != ''"
+            f" AND EXISTS (SELECT 1 FROM keywords k WHERE k.row_id = a.row_id AND k.keyword NOT IN ({marks})){tail}",
+            [company] + sorted(STOPWORDS),
+        )
+
+
+# ───────────────────────────────────────────────
+# 📰 CompanySnapshot과 같은 모양으로 DB를 감싼 방송사 뷰 (main.py는 어느 쪽인지 신경 쓰지 않음)
+# - 목록/조회/t-SNE 점은 매번 인덱스 쿼리
+# - 유사도 행렬, KD-트리, t-SNE 목록, 트렌드, 검색 색인은 처음 필요할 때 한 번만 만들고 이 버전 동안 재사용
+class ArticleDBView:
+    def __init__(self, db, company, version, search, terms_path=None):
+        self.db = db
+        self.company = company
+        self.version = version
+        self.topics = db.topics(company)
+        self._lock = threading.Lock()
+        self._search = search
+        self._terms_path = terms_path
+        self._search_ready = False
+        self._search_lock = threading.Lock()
+        self._tsne_data = None
+        self._neighbors = None
+        self._similarity = None
+        self._trending = None
+
+    def article(self, article_id):
+        return self.db.article(self.company, article_id)
+
+    def tsne_point(self, article_id):
+        return self.db.tsne_point(self.company, article_id)
+
+    def count(self, topic=None):
+        return self.db.count(self.company, topic)
+
+    def page(self, sort=None, topic=None, page=1, limit=30):
+        return self.db.page(self.company, sort, topic, page, limit)
+
+    def search_page(self, query, page=1, limit=30):
+        total, hits = self.search.search(query, limit, (page - 1) * limit)
+        items = [self.article(article_id) for _, article_id in hits]
+        return ArticlePage([a for a in items if a], page, limit, total)
+
+    @property
+    def search(self):
+        with self._search_lock:
+            if not self._search_ready:
+                self._search = refresh(self._search, self.company, self.db.search_rows(self.company), self._terms_path)
+                self._search_ready = True
+            return self._search
+
+    @property
+    def tsne_data(self):
+        with self._lock:
+            if self._tsne_data is None:
+                self._tsne_data = self.db.tsne_data(self.company)
+            return self._tsne_data
+
+    @property
+    def neighbors(self):
+        tsne_data = self.tsne_data
+        with self._lock:
+            if self._neighbors is None:
+                self._neighbors = TsneNeighbors(tsne_data)
+            return self._neighbors
+
+    @property
+    def similarity(self):
+        with self._lock:
+            if self._similarity is None:
+                self._similarity = SimilarityEngine(self.db.probability_rows(self.company))
+            return self._similarity
+
+    @property
+    def trending(self):
+        with self._lock:
+            if self._trending is None:
+                self._trending = DBTrending(self.db, self.company)
+            return self._trending
+
+
+class DBTrending:
+    # TrendingKeywords와 같은 top / top_by_topic, 창 안의 기사만 DB에서 읽어 창 크기별로 한 번 계산
+    def __init__(self, db, company):
+        self.db = db
+        self.company = company
+        self.topics = db.keyword_topics(company)
+        self._windows = {}
+        self._latest_hour = _hour_of(db.latest_keyword_date(company))
+
+    def _window(self, window_hours):
+        window = self._windows.get(window_hours)
+        if window is None:
+            since = ""
+            if self._latest_hour is not None:
+                first_hour = self._latest_hour - window_hours + 1
+                start = datetime.fromordinal(first_hour // 24) + timedelta(hours=first_hour % 24)
+                since = start.strftime("%Y-%m-%d %H:00:00")
+            window = TrendingKeywords(self.db.keyword_rows(self.company, since))
+            self._windows[window_hours] = window
+        return window
+
+    def top(self, topic, window_hours=24, k=10, half_life_hours=None):
+        return self._window(window_hours).top(topic, window_hours, k, half_life_hours)
+
+    def top_by_topic(self, window_hours=24, k=10, half_life_hours=None):
+        return {topic: self.top(topic, window_hours, k, half_life_hours) for topic in self.topics}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기사/t-SNE 파일을 SQLite 저장소로 가져오기")
+    parser.add_argument("companies", nargs="*", help="가져올 방송사 (기본: data 디렉토리의 전체)")
+    parser.add_argument("--data-dir", default=DEFAULT_DATA_DIR)
+    parser.add_argument("--db", default=DEFAULT_DB_PATH)
+    args = parser.parse_args()
+
+    files = ArticleStore(args.data_dir, None)
+    db = ArticleDB(args.db)
+    for company in args.companies or files.companies():
+        articles_path = files.articles_path(company)
+        if articles_path is None:
+            print(f"❌ {company} 기사 파일 없음. 건너뜁니다.")
+            continue
+        tsne_path = files.tsne_path(company)
+        started = time.time()
+        source = source_signature(articles_path, tsne_path)  # 읽기 전에 기록 (가져오는 중에 파일이 바뀌면 다음 요청부터 파일 사용)
+        article_count, tsne_count = db.import_company(
+            company, read_records(articles_path, committed_size(articles_path)),
+            read_records(tsne_path) if tsne_path else [], source
+        )
+        print(f"✅ {company}: 기사 {article_count}개, t-SNE {tsne_count}개 → {args.db} ({time.time() - started:.1f}초)")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+# article_store.py
+# 📦 웹 서버용 인메모리 기사 저장소
+# - 방송사별 기사/t-SNE 파일을 한 번만 읽어 메모리에 보관
+# - 요청마다 파일의 (mtime, size, 커밋된 크기)만 확인하고, 바뀌었을 때만 다시 로드
+#   (utils/updated.py가 제자리에 추가 중인 아카이브는 메타에 기록된 커밋 크기까지만 읽음)
+# - 새 스냅샷을 완성한 뒤 통째로 교체하므로 요청 중에 반쯤 바뀐 데이터를 볼 일이 없음
+# - 기사/t-SNE 파일은 record_io로 읽음 (.jsonl / .jsonl.gz / 예전 .json 중 있는 것)
+# - db(article_db.ArticleDB)를 넘기면 DB에 가져온 방송사는 파일 대신 DB 뷰를 사용
+# - 검색 색인은 파이프라인이 만든 명사 파일로 서버 시작 후 백그라운드에서(또는 처음 검색할 때) 만들고,
+#   파일이 바뀌면 이전 색인에 새 기사만 추가해서 이어 씀 (웹 서버는 MeCab 없이 동작)
+import json
+import math
+import os
+import threading
+from datetime import datetime
+
+from neighbors import TsneNeighbors
+from record_io import RECORD_SUFFIXES, committed_size, file_signature, read_records, resolve_records, source_signature
+from search_index import TERMS_SUFFIX, refresh
+from similarity import SimilarityEngine
+from trending import TrendingKeywords
+
+SORT_KEYS = ("latest", "topic", "views")
+
+
+def _load_json(path, default):
+    if not os.path.exists(path):
+        return default
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def format_date(date_str):
+    try:
+        dt = datetime.fromisoformat(date_str)
+        return dt.strftime("%Y-%m-%d %H:%M")
+    except Exception:
+        return date_str
+
+
+def _sorted_articles(articles, sort):
+    if sort == "latest":
+        return sorted(articles, key=lambda x: x.get("upload_date_kst") or "", reverse=True)
+    if sort == "topic":
+        return sorted(articles, key=lambda x: ((x.get("topic") or "") == "기타", x.get("topic") or ""))
+    if sort == "views":
+        return sorted(articles, key=lambda x: x.get("view_count") or 0, reverse=True)
+    return list(articles)
+
+
+# 🔢 id → 항목 인덱스
+# utils/updated.py가 id를 1부터 연속으로 부여하므로 보통은 리스트 인덱스로 바로 접근하고,
+# id가 너무 듬성듬성하면 dict로 대체
+class IdIndex:
+    def __init__(self, items):
+        ids = [item.get("id") for item in items]
+        int_ids = [i for i in ids if isinstance(i, int) and i >= 0]
+        max_id = max(int_ids) if int_ids else -1
+
+        if len(int_ids) == len(ids) and max_id < 2 * len(ids) + 1024:
+            self._slots = [None] * (max_id + 1)
+            self._map = None
+            for item in items:
+                if self._slots[item["id"]] is None:
+                    self._slots[item["id"]] = item
+        else:
+            self._slots = None
+            self._map = {}
+            for item in items:
+                self._map.setdefault(item.get("id"), item)
+
+    def get(self, item_id):
+        if self._map is not None:
+            return self._map.get(item_id)
+        if isinstance(item_id, int) and 0 <= item_id < len(self._slots):
+            return self._slots[item_id]
+        return None
+
+
+# 📄 목록 한 페이지 분량
+class ArticlePage:
+    def __init__(self, items, page, limit, total):
+        self.items = items
+        self.page = page
+        self.limit = limit
+        self.total = total
+        self.total_pages = max(1, math.ceil(total / limit))
+        self.has_prev = page > 1
+        self.has_next = page < self.total_pages
+
+
+# 📰 한 방송사의 특정 시점 데이터 (읽기 전용으로 취급)
+class CompanySnapshot:
+    def __init__(self, company, articles, tsne_data, version, search, terms_path=None):
+        self.company = company
+        self.articles = articles
+        self.tsne_data = tsne_data
+        self.version = version
+        self._search = search  # 이전 버전에서 이어받은 색인 (처음 검색할 때 이 버전에 맞춤)
+        self._terms_path = terms_path  # 파이프라인이 만든 명사 파일
+        self._search_ready = False
+        self._search_lock = threading.Lock()
+
+        for article in articles:
+            article["formatted_date"] = format_date(article.get("upload_date_kst", ""))
+
+        self._article_index = IdIndex(articles)
+        self._tsne_index = IdIndex(tsne_data)
+        self.neighbors = TsneNeighbors(tsne_data)
+        self.similarity = SimilarityEngine(articles)
+        self.trending = TrendingKeywords(articles)
+
+        self.topics = sorted(set(a.get("topic", "기타") for a in articles), key=lambda x: (x == "기타", x))
+
+        # 정렬 순서와 주제별 목록은 데이터 버전마다 한 번만 계산
+        self._views = {}
+        for sort in SORT_KEYS + (None,):
+            ordered = _sorted_articles(articles, sort)
+            self._views[(sort, None)] = ordered
+            for topic in self.topics:
+                self._views[(sort, topic)] = [a for a in ordered if a.get("topic") == topic]
+
+    def article(self, article_id):
+        return self._article_index.get(article_id)
+
+    def tsne_point(self, article_id):
+        return self._tsne_index.get(article_id)
+
+    def view(self, sort=None, topic=None):
+        if sort not in SORT_KEYS:
+            sort = None
+        return self._views.get((sort, topic or None), [])
+
+    def count(self, topic=None):
+        return len(self.view(None, topic))
+
+    def page(self, sort=None, topic=None, page=1, limit=30):
+        ordered = self.view(sort, topic)
+        start = (page - 1) * limit
+        return ArticlePage(ordered[start:start + limit], page, limit, len(ordered))
+
+    @property
+    def search(self):
+        # 색인을 만들 수 없으면 None (검색만 꺼짐)
+        with self._search_lock:
+            if not self._search_ready:
+                self._search = refresh(self._search, self.company, self.articles, self._terms_path)
+                self._search_ready = True
+            return self._search
+
+    def search_page(self, query, page=1, limit=30):
+        total, hits = self.search.search(query, limit, (page - 1) * limit)
+        items = [self.article(article_id) for _, article_id in hits]
+        return ArticlePage([a for a in items if a], page, limit, total)
+
+
+class ArticleStore:
+    def __init__(self, data_dir, hot_keywords_path, db=None):
+        self.data_dir = data_dir
+        self.hot_keywords_path = hot_keywords_path
+        self.db = db
+        self._snapshots = {}
+        self._hot_keywords = (None, {})
+        self._stale_db = set()  # DB가 파일보다 오래돼서 파일을 쓰고 있는 방송사 (안내는 한 번만)
+        self._lock = threading.Lock()
+
+    def articles_path(self, company):
+        return resolve_records(os.path.join(self.data_dir, f"{company}_crawling_with_summary"))
+
+    def tsne_path(self, company):
+        return resolve_records(os.path.join(self.data_dir, f"{company}_tsne"))
+
+    def terms_path(self, company):
+        # 검색용 명사 파일 (utils/updated.py가 아카이브 옆에 만듦, DB로 가져온 방송사도 같은 파일 사용)
+        return os.path.join(self.data_dir, f"{company}_crawling_with_summary{TERMS_SUFFIX}")
+
+    def _version(self, company):
+        # 파일 버전은 (기사, t-SNE 파일 서명), 형식이 바뀌어(.json → .jsonl) 경로가 달라져도 다시 읽도록 경로까지 포함
+        # DB 버전은 ("db", 가져온/추가한 횟수) → DB가 바뀌면 새 뷰로 교체
+        # 단, DB에 기록된 원본 파일 서명이 지금 파일과 다르면 (DB를 갱신하지 않고 파일만 바뀜) 파일이 우선
+        articles_path = self.articles_path(company)
+        tsne_path = self.tsne_path(company)
+        if self.db is not None:
+            version = self.db.version(company)
+            if version is not None:
+                if articles_path is None or self.db.source(company) == source_signature(articles_path, tsne_path):
+                    self._stale_db.discard(company)
+                    return version
+                if company not in self._stale_db:
+                    self._stale_db.add(company)
+                    print(f"↩️ {company}: DB로 가져온 뒤 기사/t-SNE 파일이 바뀌어 파일을 사용합니다 (python article_db.py {company})")
+        return (file_signature(articles_path), file_signature(tsne_path))
+
+    def companies(self):
+        # data 디렉토리에 있는 기사 파일에서 방송사 이름 추출
+        marker = "_crawling_with_summary"
+        companies = set(self.db.companies()) if self.db is not None else set()
+        if not os.path.isdir(self.data_dir):
+            return sorted(companies)
+        for name in os.listdir(self.data_dir):
+            for suffix in RECORD_SUFFIXES:
+                if name.endswith(marker + suffix):
+                    companies.add(name[:-len(marker + suffix)])
+        return sorted(companies)
+
+    def preload(self):
+        for company in self.companies():
+            self.get(company)
+        self.hot_keywords()
+
+    def preload_search(self):
+        # 검색 색인은 서버 시작을 막지 않도록 백그라운드 스레드에서 미리 만듦 (실패해도 검색만 꺼짐)
+        for company in self.companies():
+            snapshot = self.get(company)
+            if snapshot is not None:
+                snapshot.search
+
+    def get(self, company):
+        # 기사 파일이 없으면 None
+        version = self._version(company)
+        if version[0] is None:
+            return None
+
+        snapshot = self._snapshots.get(company)
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshots.get(company)
+            version = self._version(company)
+            if snapshot is None or snapshot.version != version:
+                snapshot = self._build(company, version)
+                self._snapshots[company] = snapshot
+        return snapshot
+
+    def _build(self, company, version):
+        previous = self._snapshots.get(company)
+        search = previous._search if previous is not None else None
+        if version[0] == "db":
+            return self.db.view(company, version, search, self.terms_path(company))
+        articles_path = self.articles_path(company)
+        tsne_path = self.tsne_path(company)
+        articles = list(read_records(articles_path, committed_size(articles_path))) if articles_path else []
+        tsne_data = list(read_records(tsne_path)) if tsne_path else []
+        return CompanySnapshot(company, articles, tsne_data, version, search, self.terms_path(company))
+
+    def hot_keywords_version(self):
+        # 핫 키워드 파일의 (경로, mtime, size), 페이지 캐시 키에 사용
+        self.hot_keywords()
+        return self._hot_keywords[0]
+
+    def hot_keywords(self):
+        # 🔥 핫 키워드 파일도 바뀌었을 때만 다시 읽음
+        signature = file_signature(self.hot_keywords_path)
+        cached_signature, data = self._hot_keywords
+        if signature == cached_signature:
+            return data
+        try:
+            data = _load_json(self.hot_keywords_path, {})
+        except Exception:
+            data = {}
+        self._hot_keywords = (signature, data)
+        return data
@@ -0,0 +1,79 @@
+# bench_article_lookup.py
+# ⏱️ 상세 페이지 조회 벤치마크: id → 기사 / t-SNE 점 (IdIndex)
+# - 기사 1천 / 10만 / 100만 개짜리 합성 스냅샷을 만들고 article(), tsne_point()를 반복 호출
+# - 비교용으로 예전 main.py 방식(next(... for a in articles if a["id"] == id))도 같이 측정
+# - 실행: python benchmarks/bench_article_lookup.py [기사 수 ...]
+#   (100만 개는 스냅샷을 만드는 데 메모리 1.5GB 정도와 10초쯤 걸림)
+import os
+import random
+import sys
+import time
+
+# 프로젝트 루트의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from article_store import CompanySnapshot
+
+SIZES = [1_000, 100_000, 1_000_000]
+LOOKUPS = 100_000      # 인덱스 조회 횟수
+LINEAR_LOOKUPS = 20    # 예전 선형 탐색은 느려서 적게
+TOPICS = ["정치", "경제", "스포츠", "연예", "IT_과학"]
+
+
+def synthetic(n):
+    # utils/updated.py처럼 id는 1부터 연속
+    rng = random.Random(n)
+    articles = []
+    tsne_data = []
+    for i in range(1, n + 1):
+        topic = TOPICS[i % len(TOPICS)]
+        articles.append({
+            "id": i,
+            "title": f"기사 {i}",
+            "upload_date_kst": f"2025-06-{1 + i % 28:02d} {i % 24:02d}:00:00",
+            "view_count": rng.randrange(100_000),
+            "topic": topic,
+            "probabilities": {topic: 0.9},
+            "keywords": [],
+        })
+        tsne_data.append({"id": i, "x": rng.uniform(-50, 50), "y": rng.uniform(-50, 50), "topic": topic})
+    return articles, tsne_data
+
+
+def per_call_us(func, ids):
+    started = time.perf_counter()
+    for article_id in ids:
+        func(article_id)
+    return (time.perf_counter() - started) / len(ids) * 1e6
+
+
+def bench(n):
+    articles, tsne_data = synthetic(n)
+    started = time.perf_counter()
+    snapshot = CompanySnapshot("BENCH", articles, tsne_data, None, None)
+    build_s = time.perf_counter() - started
+
+    rng = random.Random(0)
+    ids = [rng.randint(1, n) for _ in range(LOOKUPS)]
+    for article_id in ids[:1000]:
+        assert snapshot.article(article_id)["id"] == article_id
+        assert snapshot.tsne_point(article_id)["id"] == article_id
+
+    article_us = per_call_us(snapshot.article, ids)
+    tsne_us = per_call_us(snapshot.tsne_point, ids)
+    linear_us = per_call_us(lambda i: next((a for a in articles if a["id"] == i), None), ids[:LINEAR_LOOKUPS])
+    return build_s, article_us, tsne_us, linear_us
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    results = {}
+    print(f"{'기사 수':>10} {'스냅샷 생성':>12} {'article()':>12} {'tsne_point()':>14} {'선형 탐색':>12}")
+    for n in sizes:
+        build_s, article_us, tsne_us, linear_us = bench(n)
+        results[n] = article_us + tsne_us
+        print(f"{n:>10,} {build_s:>10.1f}s {article_us:>10.2f}µs {tsne_us:>12.2f}µs {linear_us:>10.0f}µs")
+
+    # 규모가 커져도 조회 시간이 거의 그대로인지 (가장 작은 규모 대비 배율)
+    smallest = min(results)
+    for n in sorted(results):
+        print(f"📈 {n:,}개: {results[n] / results[smallest]:.2f}배")
@@ -0,0 +1,71 @@
+# bench_neighbors.py
+# ⏱️ t-SNE 최근접 이웃 벤치마크: KD-트리(TsneNeighbors) vs 예전 전체 거리 계산 + 정렬
+# - 무작위 t-SNE 좌표로 두 방식의 상위 k개 id가 똑같은지 확인한 뒤 (다르면 AssertionError)
+# - 질의 한 번당 걸린 시간을 비교
+# - 실행: python benchmarks/bench_neighbors.py [점 개수 ...]
+import os
+import random
+import sys
+import time
+from math import sqrt
+
+# 프로젝트 루트의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from neighbors import TsneNeighbors
+
+SIZES = [1_000, 10_000, 100_000]
+KS = [5, 20]
+QUERIES = 50
+
+
+def synthetic(n):
+    rng = random.Random(n)
+    return [{"id": i, "x": rng.uniform(-50, 50), "y": rng.uniform(-50, 50)} for i in range(1, n + 1)]
+
+
+def old_loop(tsne_data, tsne_point, k):
+    # 예전 main.py article_detail의 계산 그대로
+    distances = []
+    for p in tsne_data:
+        if p["id"] == tsne_point["id"]:
+            continue
+        dist = sqrt((p["x"] - tsne_point["x"])**2 + (p["y"] - tsne_point["y"])**2)
+        distances.append((dist, p["id"]))
+    distances.sort(key=lambda x: x[0])
+    return distances[:k]
+
+
+def bench(n, k):
+    tsne_data = synthetic(n)
+    started = time.perf_counter()
+    neighbors = TsneNeighbors(tsne_data)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    rng = random.Random(k)
+    points = [tsne_data[rng.randrange(n)] for _ in range(QUERIES)]
+
+    started = time.perf_counter()
+    old = [old_loop(tsne_data, point, k) for point in points]
+    old_ms = (time.perf_counter() - started) / QUERIES * 1000
+
+    started = time.perf_counter()
+    new = [neighbors.query(point, k) for point in points]
+    new_ms = (time.perf_counter() - started) / QUERIES * 1000
+
+    for point, old_result, new_result in zip(points, old, new):
+        old_ids = [i for _, i in old_result]
+        new_ids = [i for _, i in new_result]
+        assert old_ids == new_ids, f"id {point['id']}: {old_ids} != {new_ids}"
+        for (old_dist, _), (new_dist, _) in zip(old_result, new_result):
+            assert abs(old_dist - new_dist) < 1e-9
+    return build_ms, old_ms, new_ms
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    print(f"{'점 개수':>10} {'k':>3} {'트리 생성':>10} {'예전 루프':>12} {'KD-트리':>10} {'배율':>8}")
+    for n in sizes:
+        for k in KS:
+            build_ms, old_ms, new_ms = bench(n, k)
+            print(f"{n:>10,} {k:>3} {build_ms:>8.1f}ms {old_ms:>10.3f}ms {new_ms:>8.3f}ms {old_ms / new_ms:>7.0f}x")
+    print("✅ 모든 질의에서 이웃 id와 거리가 예전 방식과 같음")
@@ -0,0 +1,201 @@
+# bench_text_cleaning.py
+# ⏱️ 제목/설명 전처리 벤치마크: text_cleaning (미리 컴파일 + 줄 잡음 패턴 하나로 합침) vs 예전 utils/FINAL.py 함수
+# - tests/fixtures/descriptions의 KBS/SBS/YTN 설명과 제목을 반복해서 만든 말뭉치로 두 방식 결과가 모두 같은지 확인한 뒤 (다르면 AssertionError)
+# - 건당 처리 시간을 비교하고, URL 뒤에 글자가 붙은 줄은 URL 길이별로 따로 측정
+# - 실행: python benchmarks/bench_text_cleaning.py [설명 개수]
+import json
+import os
+import re
+import sys
+import time
+
+# 프로젝트 루트의 공용 모듈 사용
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+from text_cleaning import clean_title, clean_text_full
+
+DESCRIPTIONS = os.path.join(ROOT, "tests", "fixtures", "descriptions")
+CORPUS_SIZE = 3000
+PATHOLOGICAL = "ytn_pathological_url.txt"  # 예전 방식은 이 파일 하나에 1초쯤 걸려서 일반 말뭉치에서는 뺌
+URL_RUNS = [8, 10, 12]  # 예전 방식은 URL 끝 영숫자가 1자 늘 때마다 2배씩 느려짐
+
+
+# ───────────────────────────────────────────────
+# 📌 예전 utils/FINAL.py의 clean_title / clean_text_full 그대로 (baseline)
+def old_clean_title(title): # title 전처리용
+    if not isinstance(title, str):
+        return ""
+
+    title = re.sub(r"\s*/\s*(KBS|SBS|YTN).*", "", title) 
+    title = re.sub(r"\([^)]*\)", "", title) 
+    title = re.sub(r"\[[^\]]*\]", "", title) 
+    title = re.sub(r"\{[^}]*\}", "", title) 
+    title = re.sub(r"【[^】]*】", "", title) 
+    title = re.sub(r'([가-힣ㅏ-ㅣ])\1{1,}', '', title) 
+    title = re.sub(r'[ㅋㅎㅠㅜ]{2,}', '', title) 
+    title = re.sub(r'앗|헉|윽|흥|풉|에구|읏|으음|아악|끼야|푸하하|하하하|히히히|헤헤헤|흐흐흐|낄낄|깔깔|콜록콜록|훌쩍|쉿', '', title) 
+    title = re.sub(r"[^\w\s가-힣.%]", " ", title) 
+    title = re.sub(r"[·•]{3,}|\.{3,}|…", " ", title) 
+    title = re.sub(r"\s+", " ", title) 
+
+    return title.strip()
+
+
+def old_clean_text_full(text): # description 전처리용
+    if not isinstance(text, str):
+        return ""
+    idx_ytn_info = text.find('※ \'당신의 제보가 뉴스가 됩니다\'')
+    if idx_ytn_info != -1:
+        text = text[:idx_ytn_info]
+    
+    idx_sbs_info = text.find('☞더 자세한 정보')
+    if idx_sbs_info != -1:
+        text = text[:idx_sbs_info]
+
+    match_news_end = re.search(r'(KBS\s*뉴스\s*[가-힣]{2,5}니다\.?)', text)
+    if match_news_end:
+        text = text[:match_news_end.start()] 
+        text = re.sub(r'\[[^\]]+:\s*["“][^"”]+["”]\s*\]', ' ', text) 
+        text = re.sub(r'[가-힣]{2,5}\s*기자(?:의)?\s*(?:보도(?:입니다)?|보돕니다)\.?', ' ', text) 
+        text = re.sub(r'\[\s*(?:리포트|앵커|취재|기자|특파원|논평|해설)\s*\]', ' ', text)
+        text = re.sub(r'\([^()]*\)', ' ', text) 
+        text = re.sub(r'\{[^{}]*\}', ' ', text) 
+        text = re.sub(r'\[[^\[\]]*\]', ' ', text) 
+        text = re.sub(r"#[\w가-힣]+", " ", text) 
+        text = re.sub(r'[^\w\s가-힣]', ' ', text) 
+        text = re.sub(r'([가-힣ㅏ-ㅣ])\1{1,}', '', text) 
+        text = re.sub(r'[ㅋㅎㅠㅜ]{2,}', '', text) 
+        text = re.sub(r'\s+', ' ', text).strip() 
+        
+        return text.strip() 
+
+    match_kbs_link = re.search(r'(KBS\s*기사\s*원문보기\s*[:：]\s*http[s]?://\S+)', text)
+    if match_kbs_link:
+        text = text[:match_kbs_link.start()] 
+        text = re.sub(r'\[[^\]]+:\s*["“][^"”]+["”]\s*\]', ' ', text) 
+        text = re.sub(r'[가-힣]{2,5}\s*기자(?:의)?\s*(?:보도(?:입니다)?|보돕니다)\.?', ' ', text) 
+        text = re.sub(r'\[\s*(?:리포트|앵커|취재|기자|특파원|논평|해설)\s*\]', ' ', text)
+        text = re.sub(r'\([^()]*\)', ' ', text) 
+        text = re.sub(r'\{[^{}]*\}', ' ', text) 
+        text = re.sub(r'\[[^\[\]]*\]', ' ', text) 
+        text = re.sub(r"#[\w가-힣]+", " ", text) 
+        text = re.sub(r'[^\w\s가-힣]', ' ', text) 
+        text = re.sub(r'([가-힣ㅏ-ㅣ])\1{1,}', '', text) 
+        text = re.sub(r'[ㅋㅎㅠㅜ]{2,}', '', text) 
+        text = re.sub(r'\s+', ' ', text).strip() 
+        
+        return text.strip() 
+
+    lines = text.splitlines()
+
+    cleaned_lines = []
+    common_junk_patterns = [
+        # 저작권 문구: 'Copyright', 'ⓒ', 'All rights reserved', '무단 전재', '재배포', 'AI학습' 등
+        r'^(?:Copyright\s*Ⓒ?\s*(?:KBS|SBS|YTN)\.?|ⓒ\s*(?:KBS|SBS|YTN))\s*\.?\s*All\s*rights\s*reserved\.?\s*(?:무단\s*전재(?:,)?\s*재배포\s*(?:및\s*(?:이용|AI학습\s*포함|AI학습\s*이용))?)?\s*(?:금지)?\s*$',
+        # 제보/연락처/소셜 미디어 정보 (전화번호, 이메일, 카톡, 홈페이지 등)
+        r'^\s*(?:홈페이지|애플리케이션|앱|카카오톡|페이스북|인스타그램|X|이메일|메일|문자|전화)[:：\s]*(?:[\'"]?(?:KBS|SBS|YTN)?\s*뉴스[\'"]?)?(?:.*(?:제보|친구\s*맺고\s*채팅|메시지\s*전송|@(?:sbs|kbs|ytn)\.co\.kr|누르고\s*\d+|.*-\d{3,4}-\d{4}|앱\s*설치|채널\s*추가|구독).*)?$',
+        # 기자/제작진 정보: (영상취재:이상욱), 촬영기자:xxx/영상편집:yyy, 영상편집 : xxx 디자인 : zzz, 촬영 : xxx
+        r'^\s*(?:영상취재|촬영기자|촬영|영상편집|편집|그래픽|디자인|화면제공|기자|앵커|특파원|기상캐스터|진행|리포터|논설위원|구성|제작|CG|자막뉴스)\s*[:：\|]?\s*(?:[^/\n]+(?:[/·]\s*[^/\n]+)*)?(?:\s*[:：]\s*.*)?$', # '|' 추가 및 뒤에 올 수 있는 이름 처리 강화
+        # 기자 이름+이메일/소속: YTN 유투권 (r2kwon@ytn.co.kr)
+        r'^\s*[A-Z]{2,4}\s*[가-힣]{2,4}\s*\([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\)\s*$',
+        # 짧은 기자 이름만 있는 경우 (일반 텍스트와 겹칠 수 있으므로 주의)
+        r'^\s*[가-힣]{2,4}\s*[기자앵커|특파원|기상캐스터]\s*$', # "이름 기자" 패턴 (단독 줄)
+        # 홍보/안내 문구 시작: ☞, ▶, ♨, ▣, ※ 등의 특수문자 시작
+        r'^(?:☞|▶|♨|#|▣|※)\s*(?:더\s*자세한\s*정보|트럼프\s*2기|기사\s*모아보기|지금\s*뜨거운\s*이슈|기사\s*원문|제보\s*하기|YTN\s*검색해\s*채널\s*추가|KBS제보\s*검색|당신의\s*제보가\s*뉴스가\s*됩니다|SBS뉴스\s*채널\s*구독|SBS뉴스\s*라이브|함께\s*토론하기|스프\s*구독|뉴스\s*채널\s*구독|채널\s*추가|클릭|보기|누르세요)?(?:.*(?:http[s]?://|n\.sbs\.co\.kr|news\.kbs\.co\.kr|ytn\.co\.kr|goo\.gl|premium\.sbs\.co\.kr|pf\.kakao\.com|www\.facebook\.com|www\.twitter\.com|www\.instagram\.com|ncd=\d+).*)?$', 
+        # 일반적인 URL 단독 줄 (http/https 없는 경우도 포함)
+        r'^\s*\b(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}(?:/[^\s]*)?\s*$',
+        # 완벽한 URL 단독 줄
+        r'^\s*http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+\s*$',
+        # 해시태그 단독 줄 (쉼표로 구분된 여러 해시태그 포함)
+        r'^\s*(?:#[\w가-힣\s]+(?:,\s*#[\w가-힣\s]+)*)\s*$',
+    ]
+    for line in lines:
+        stripped_line = line.strip()
+        is_junk = False
+        for pattern in common_junk_patterns:
+            if re.search(pattern, stripped_line, re.IGNORECASE):
+                is_junk = True
+                break
+        if is_junk:
+            continue
+        cleaned_lines.append(stripped_line) 
+    text = ' '.join(cleaned_lines) 
+
+    # 줄 결합 후 후처리 단계에서 잔여 패턴 제거 (가장 중요)
+    # YTN 기자/앵커의 끝맺음 문구 제거 강화
+    text = re.sub(r'^(?:대담\s*발췌\s*:\s*이선\s*디지털뉴스팀\s*에디터|\s*지금까지\s*(?:[가-힣]{2,5}부에서\s*)?YTN\s*[가-힣]{2,5}입니다\.?)\s*', ' ', text, flags=re.MULTILINE)
+    text = re.sub(r'YTN\s*[가-힣]{2,5}\s*입니다\.?', ' ', text) # "YTN 기자이름입니다."
+    text = re.sub(r'\<앵커\>|\<기자\>', ' ', text) # <앵커>, <기자> 제거
+    # 인터뷰 인용 구조 제거 ([인물명 직책 : "내용"])
+    text = re.sub(r'\[[^\]]+:\s*["“][^"”]+["”]\s*\]', ' ', text)
+    # 직업명 및 보도 관련 문구 제거 (황다예 기자의 보돕니다, [리포트] 등)
+    text = re.sub(r'[가-힣]{2,5}\s*기자(?:의)?\s*(?:보도(?:입니다)?|보돕니다)\.?', ' ', text)
+    text = re.sub(r'\[\s*(?:리포트|앵커|취재|기자|특파원|논평|해설)\s*\]', ' ', text)
+
+    text = re.sub(
+        r'(?:KBS|SBS|YTN)\s*(?:오톡|뉴스)?\s*(?:KBS제보|SBS뉴스|YTN 검색해)?\s*(?:검색)?\s*(?:전화)?\s*\d{2,4}[-\s]?\d{3,4}[-\s]?\d{4}\s*(?:홈페이지)?\s*https?://\S+\s*(?:이메일)?\s*[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[A-Z|a-z]{2,}\s*(?:Copyright\s*Ⓒ?\s*(?:KBS|SBS|YTN)\. All rights reserved\. 무단 전재, 재배포 및 이용\(AI 학습 포함\) 금지)?', 
+        ' ', text, flags=re.IGNORECASE
+    )
+    # 기자/앵커의 끝맺음 문구 (다른 방송사나, 첫 번째 if 블록에서 처리되지 않은 경우 대비)
+    text = re.sub(r'([가-힣]{2,7}(?:특파원|기자|앵커|리포터)?입니다\.?)', ' ', text)
+    # 이름: 발언 형식 (정규식 강화: 콜론 앞뒤 공백 및 다양한 문자 허용)
+    text = re.sub(r'[가-힣A-Z\s]{2,15}\s*[:：]\s*[가-힣\s]{2,200}', ' ', text)
+    # 괄호 안 내용 제거 (이전에 줄 단위에서 제거되지 않은 경우를 대비)
+    text = re.sub(r'\([^()]*\)', ' ', text)
+    text = re.sub(r'\{[^{}]*\}', ' ', text)
+    text = re.sub(r'\[[^\[\]]*\]', ' ', text) 
+    # 해시태그 제거 (줄 단위에서 제거되지 않은 경우를 대비)
+    text = re.sub(r"#[\w가-힣]+", " ", text)
+    # 숫자 및 단위 제거 (한글 단위 포함)
+    text = re.sub(r'\b\d{1,3}(?:,\d{3})*(?:\.\d+)?[가-힣a-zA-Z%℃]+\b', ' ', text)
+    text = re.sub(r'\b\d{1,3}(?:,\d{3})*(?:\.\d+)?\b', ' ', text)
+    text = re.sub(r'#\s*\d+', ' ', text) 
+    # 따옴표 및 불필요한 기호 제거
+    text = re.sub(r'["“”‘’\'`]', ' ', text)
+    text = re.sub(r'([가-힣ㅏ-ㅣ])\1{1,}', '', text) 
+    text = re.sub(r'[ㅋㅎㅠㅜ]{2,}', '', text) 
+    text = re.sub(r"[^\w\s가-힣]", " ", text) 
+    # 다중 공백을 단일 공백으로 변환하고 양 끝 공백 제거
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text.strip()
+
+
+def load_corpus(size):
+    with open(os.path.join(DESCRIPTIONS, "expected.json"), "r", encoding="utf-8") as f:
+        titles = [title for title, _ in json.load(f)["titles"]]
+    texts = []
+    for name in sorted(os.listdir(DESCRIPTIONS)):
+        if name.endswith(".txt") and name != PATHOLOGICAL:
+            with open(os.path.join(DESCRIPTIONS, name), "r", encoding="utf-8") as f:
+                texts.append(f.read())
+    # 같은 문자열만 반복되지 않게 번호를 붙임
+    return ([f"{titles[i % len(titles)]} {i}" for i in range(size)],
+            [f"{i}번째 영상\n{texts[i % len(texts)]}" for i in range(size)])
+
+
+def timed(func, values):
+    started = time.perf_counter()
+    result = [func(value) for value in values]
+    return result, (time.perf_counter() - started) / len(values) * 1e6
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else CORPUS_SIZE
+    titles, texts = load_corpus(size)
+
+    print(f"{'':>10} {'예전':>10} {'text_cleaning':>14} {'배율':>6}")
+    for label, old, new, values in [("제목", old_clean_title, clean_title, titles),
+                                    ("설명", old_clean_text_full, clean_text_full, texts)]:
+        old_result, old_us = timed(old, values)
+        new_result, new_us = timed(new, values)
+        assert old_result == new_result, f"{label} 결과가 예전 방식과 다름"
+        print(f"{label:>10} {old_us:>8.1f}µs {new_us:>12.1f}µs {old_us / new_us:>5.1f}x")
+
+    print(f"\n{'URL 끝 영숫자':>12} {'예전':>10} {'text_cleaning':>14}")
+    for run in URL_RUNS:
+        text = f"해외 증시가 반등했습니다.\nhttps://www.ytn.co.kr/_ln/{'0123456789ABCDEF'[:run]} 원문 보기"
+        old_result, old_us = timed(old_clean_text_full, [text])
+        new_result, new_us = timed(clean_text_full, [text])
+        assert old_result == new_result
+        print(f"{run:>12} {old_us / 1000:>8.1f}ms {new_us / 1000:>12.3f}ms")
+    print("✅ 모든 입력에서 결과가 예전 방식과 같음")
@@ -0,0 +1,92 @@
+# bench_tile_extraction.py
+# ⏱️ 1단계 스크롤 타일 추출 벤치마크: soup 모드(매 스크롤 page_source 전체 재파싱) vs incremental 모드(새 타일만 받음)
+# - tests/fixtures/youtube/channel_videos.html 타일을 video id만 바꿔 복제해서 타일 N개짜리 동영상 탭을 만들고
+#   스크롤마다 PER_SCROLL개씩 붙는다고 보고 마지막 타일까지 읽는 동안의 Python 쪽 시간과 WebDriver로 넘어오는 바이트를 측정
+# - incremental 모드의 브라우저 안 querySelectorAll 시간은 Chrome 없이 잴 수 없어 제외 (전달되는 JSON 크기로 비교)
+# - 픽스처 타일은 실제 페이지보다 마크업이 훨씬 작아서 soup 모드 수치는 하한에 가까움
+# - 실행: python benchmarks/bench_tile_extraction.py [타일 수 ...]
+import json
+import os
+import re
+import sys
+import time
+
+# 프로젝트 루트의 공용 모듈 사용
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+sys.path.append(os.path.join(ROOT, "utils"))
+from FINAL import extract_tiles_from_soup, IncrementalTileReader
+
+FIXTURE = os.path.join(ROOT, "tests", "fixtures", "youtube", "channel_videos.html")
+SIZES = [150, 600, 1500]
+PER_SCROLL = 30  # 동영상 탭이 스크롤 한 번에 더 불러오는 타일 수
+
+
+def synthetic_tiles(n):
+    with open(FIXTURE, "r", encoding="utf-8") as f:
+        html = f.read()
+    tiles = re.findall(r"<ytd-rich-item-renderer.*?</ytd-rich-item-renderer>", html, re.S)
+    result = []
+    for i in range(n):
+        tile = tiles[i % len(tiles)]
+        result.append(re.sub(r"(/watch\?v=|/shorts/|/vi/)([\w-]{11})", lambda m: f"{m.group(1)}{i:011d}", tile))
+    return result
+
+
+def page(tiles):
+    return '<html><body><div id="contents">' + "\n".join(tiles) + "</div></body></html>"
+
+
+class ReplayDriver:
+    # 브라우저가 돌려줬을 결과(새 타일 + 재시도 타일)를 JSON으로 직렬화/역직렬화해서 그대로 전달
+    def __init__(self, tiles):
+        self.tiles = tiles
+        self.shown = 0
+        self.payload_bytes = 0
+
+    def execute_script(self, script, start, retry, *selectors):
+        indexes = [i for i in retry if i < start] + list(range(start, self.shown))
+        items = [dict(self.tiles[i], index=i) for i in indexes]
+        payload = json.dumps({"total": self.shown, "items": items}, ensure_ascii=False)
+        self.payload_bytes += len(payload.encode("utf-8"))
+        return json.loads(payload)
+
+
+def bench(n):
+    tiles = synthetic_tiles(n)
+    parsed = extract_tiles_from_soup(page(tiles))
+    scrolls = range(PER_SCROLL, n + PER_SCROLL, PER_SCROLL)
+
+    soup_s = 0.0
+    soup_last_ms = 0.0
+    page_bytes = 0
+    for shown in scrolls:
+        source = page(tiles[:shown])
+        page_bytes += len(source.encode("utf-8"))
+        started = time.perf_counter()
+        result = extract_tiles_from_soup(source)
+        soup_last_ms = (time.perf_counter() - started) * 1000
+        soup_s += soup_last_ms / 1000
+    assert result == parsed
+
+    driver = ReplayDriver(parsed)
+    reader = IncrementalTileReader(driver)
+    read = []
+    started = time.perf_counter()
+    for shown in scrolls:
+        driver.shown = min(shown, n)
+        read.extend(reader.read())
+    incremental_s = time.perf_counter() - started
+    # 덜 렌더링된 타일(실시간/예정 영상 등)은 재시도로 두세 번 읽히므로 인덱스별 마지막 값끼리 비교
+    latest = {tile["index"]: {key: tile[key] for key in ("href", "upload_time", "duration")} for tile in read}
+    assert [latest[i] for i in range(n)] == parsed
+    return len(scrolls), soup_s, soup_last_ms, page_bytes, incremental_s, driver.payload_bytes
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    print(f"{'타일 수':>8} {'스크롤':>6} {'soup 합계':>10} {'soup 마지막':>12} {'page_source':>12} {'incremental':>12} {'전달 JSON':>10}")
+    for n in sizes:
+        scrolls, soup_s, soup_last_ms, page_bytes, incremental_s, payload_bytes = bench(n)
+        print(f"{n:>8,} {scrolls:>6} {soup_s:>9.2f}s {soup_last_ms:>10.1f}ms {page_bytes / 1e6:>10.1f}MB "
+              f"{incremental_s * 1000:>10.2f}ms {payload_bytes / 1e3:>8.0f}KB")
@@ -0,0 +1,114 @@
+# disk_cache.py
+# 💾 SQLite 기반 영속 캐시
+# - 키: 입력값들을 JSON으로 직렬화한 뒤 SHA-256 해시 (내용 주소 방식)
+# - 값: JSON으로 저장
+# - 최대 개수를 넘으면 가장 오래 안 쓰인 항목부터 삭제 (LRU)
+# - max_age_days를 주면 그 기간 동안 한 번도 안 쓰인 항목도 삭제
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+EVICT_EVERY = 1000  # 이만큼 쓸 때마다 개수 확인
+
+
+class DiskCache:
+    def __init__(self, path, max_entries=None, max_age_days=None):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache(accessed)")
+        self._conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @staticmethod
+    def make_key(*parts):
+        raw = json.dumps(parts, ensure_ascii=False, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key, default=None):
+        return self.get_many([key]).get(key, default)
+
+    def get_many(self, keys):
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        with self._lock:
+            # SQLite 변수 개수 제한 때문에 나눠서 조회
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                marks = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"SELECT key, value FROM cache WHERE key IN ({marks})", chunk)
+                for key, value in rows:
+                    found[key] = json.loads(value)
+            if found:
+                now = time.time()
+                self._conn.executemany("UPDATE cache SET accessed = ? WHERE key = ?", [(now, k) for k in found])
+                self._conn.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set(self, key, value):
+        self.set_many([(key, value)])
+
+    def set_many(self, items):
+        now = time.time()
+        rows = [(key, json.dumps(value, ensure_ascii=False), now, now) for key, value in items]
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)", rows)
+            self._conn.commit()
+            self._writes += len(rows)
+            if self._writes >= EVICT_EVERY:
+                self._evict()
+
+    def _evict(self):
+        self._writes = 0
+        if self.max_age_days:
+            cutoff = time.time() - self.max_age_days * 86400
+            self._conn.execute("DELETE FROM cache WHERE accessed < ?", (cutoff,))
+            self._conn.commit()
+        if not self.max_entries:
+            return
+        count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed LIMIT ?)", (excess,)
+            )
+            self._conn.commit()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            if self._conn is None:
+                return
+            self._evict()
+            self._conn.close()
+            self._conn = None
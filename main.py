@@ -1,11 +1,16 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-import json
-import os
 from collections import Counter, defaultdict
-from datetime import datetime
+import math
+import os
+import threading
+
+from article_db import ArticleDB
+from article_store import SORT_KEYS, ArticleStore
+from page_cache import PageCache
+from trending import WINDOWS, valid_half_life
 
 app = FastAPI()
 
@@ -16,13 +21,29 @@ templates = Jinja2Templates(directory="templates")
 # 데이터 디렉토리
 DATA_DIR = "data/use/crawling"
 HOT_KEYWORDS_PATH = "data/use/hot_keyword/hot_keywords_by_company.json"
+DB_PATH = "data/use/articles.sqlite"  # python article_db.py로 만든 SQLite 저장소 (없으면 파일만 사용)
+
+# 📦 기사/t-SNE/핫 키워드를 메모리에 올려두고 파일이 바뀔 때만 다시 읽음
+# SQLite 저장소가 있으면 거기 가져온 방송사는 인덱스 쿼리로 페이지/기사만 읽음
+store = ArticleStore(DATA_DIR, HOT_KEYWORDS_PATH, db=ArticleDB(DB_PATH) if os.path.exists(DB_PATH) else None)
+
+# 🗃️ 렌더링한 목록/상세/시각화 페이지 캐시 (데이터 버전이 바뀌면 자동으로 새로 렌더링)
+PAGE_CACHE_BYTES = 64 * 1024 * 1024
+page_cache = PageCache(PAGE_CACHE_BYTES)
 
-def format_date(date_str):
-    try:
-        dt = datetime.fromisoformat(date_str)
-        return dt.strftime("%Y-%m-%d %H:%M")
-    except Exception:
-        return date_str
+@app.on_event("startup")
+def load_articles():
+    store.preload()
+    # 검색 색인은 시작을 막지 않도록 백그라운드에서 (그 사이 검색 요청은 색인이 끝날 때까지 기다림)
+    threading.Thread(target=store.preload_search, daemon=True).start()
+
+# 목록 페이지 크기
+DEFAULT_PAGE_SIZE = 30
+MAX_PAGE_SIZE = 100
+
+# 상세 페이지 추천 기사 최대 개수 / 방식 (확률 코사인 유사도, t-SNE 거리)
+MAX_SIMILAR = 20
+SIMILAR_METHODS = ("prob", "tsne")
 
 # 1차: 방송사 선택
 @app.get("/")
@@ -31,127 +52,213 @@ def index(request: Request):
 
 # 2차: 뉴스 목록 페이지
 @app.get("/news/{company}", response_class=HTMLResponse)
-async def news_list(request: Request, company: str, sort: str = "latest", filter: str = None):
-    filepath = os.path.join(DATA_DIR, f"{company}_crawling_with_summary.json")
-    with open(filepath, "r", encoding="utf-8") as f:
-        all_articles = json.load(f)
-
-    topics = sorted(set(a.get("topic", "기타") for a in all_articles), key=lambda x: (x == "기타", x))
-    articles = all_articles.copy()
-
-    # 날짜 포맷 적용
-    for article in articles:
-        raw_date = article.get("upload_date_kst", "")
-        article["formatted_date"] = format_date(raw_date)
-
-    # 정렬
-    if sort == "latest":
-        articles.sort(key=lambda x: x.get("upload_date_kst") or "", reverse=True)
-    elif sort == "topic":
-        articles.sort(key=lambda x: ((x.get("topic") or "") == "기타", x.get("topic") or ""))
-    elif sort == "views":
-        articles.sort(key=lambda x: x.get("view_count") or 0, reverse=True)
-
-    # 필터
-    if filter:
-        articles = [a for a in articles if a.get("topic") == filter]
-        wordcloud_url = f"/static/wordclouds/{filter}.png"
-    else:
-        wordcloud_url = None
+async def news_list(request: Request, company: str, sort: str = "latest", filter: str = None,
+                    page: int = 1, limit: int = DEFAULT_PAGE_SIZE, window: str = "24h"):
+    snapshot = store.get(company)
+    if snapshot is None:
+        return HTMLResponse("❌ 기사 데이터 없음", status_code=404)
+    if window not in WINDOWS:
+        return HTMLResponse(f"❌ window는 {', '.join(WINDOWS)} 중 하나", status_code=400)
+    filter = filter or None
+    if filter is not None and filter not in snapshot.topics:
+        return HTMLResponse(f"❌ filter는 {', '.join(snapshot.topics)} 중 하나", status_code=400)
+
+    # 페이지 캐시 키에는 정리/검증한 값만 사용 (임의의 값마다 따로 렌더링/캐시되지 않게)
+    # 모르는 정렬은 원래 순서, 페이지 번호는 1 ~ 마지막 페이지
+    sort = sort if sort in SORT_KEYS else None
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
+    page = min(max(page, 1), max(1, math.ceil(snapshot.count(filter) / limit)))
 
-    # 🔥 실시간 핫 키워드 로딩
-    try:
-        with open(HOT_KEYWORDS_PATH, "r", encoding="utf-8") as f:
-            all_hot_keywords = json.load(f)
-        hot_keywords = all_hot_keywords.get(company, {})
-    except Exception:
-        hot_keywords = {}
+    def render():
+        # 미리 정렬/필터링된 목록에서 현재 페이지만 잘라옴
+        article_page = snapshot.page(sort, filter, page, limit)
+
+        if filter:
+            wordcloud_url = f"/static/wordclouds/{filter}.png"
+        else:
+            wordcloud_url = None
+
+        # 🔥 실시간 핫 키워드: 메모리의 시간대별 트렌드에서 계산, 비어 있는 토픽은 배치 결과 파일로 대체
+        hot_keywords = dict(store.hot_keywords().get(company, {}))
+        trending = snapshot.trending.top_by_topic(WINDOWS[window])
+        hot_keywords.update({topic: words for topic, words in trending.items() if words})
+
+        return templates.TemplateResponse("article_list.html", {
+            "request": request,
+            "company": company,
+            "articles": article_page.items,
+            "pagination": article_page,
+            "topics": snapshot.topics,
+            "current_topic": filter,
+            "sort": sort,
+            "wordcloud_url": wordcloud_url,
+            "hot_keywords": hot_keywords
+        })
+
+    # 핫 키워드 파일도 목록 페이지 내용에 들어가므로 데이터 버전에 포함
+    version = (snapshot.version, store.hot_keywords_version())
+    return page_cache.serve(request, (company, "news_list"), version, (sort, filter, page, limit, window), render)
+
+# 🔎 검색: 제목/설명/요약/핵심어 BM25 순위
+@app.get("/news/{company}/search", response_class=HTMLResponse)
+def news_search(request: Request, company: str, q: str = "", page: int = 1, limit: int = DEFAULT_PAGE_SIZE):
+    snapshot = store.get(company)
+    if snapshot is None:
+        return HTMLResponse("❌ 기사 데이터 없음", status_code=404)
+
+    if snapshot.search is None:
+        return HTMLResponse("❌ 지금은 검색을 사용할 수 없습니다", status_code=503)
+
+    page = max(page, 1)
+    limit = min(max(limit, 1), MAX_PAGE_SIZE)
+    article_page = snapshot.search_page(q, page, limit)
 
     return templates.TemplateResponse("article_list.html", {
         "request": request,
         "company": company,
-        "articles": articles,
-        "topics": topics,
-        "current_topic": filter,
-        "sort": sort,
-        "wordcloud_url": wordcloud_url,
-        "hot_keywords": hot_keywords
+        "articles": article_page.items,
+        "pagination": article_page,
+        "topics": snapshot.topics,
+        "current_topic": None,
+        "sort": None,
+        "query": q,
+        "wordcloud_url": None,
+        "hot_keywords": {}
     })
 
+def find_similar_articles(snapshot, article_id, method="prob", k=5):
+    similar_articles = []
+
+    if method == "tsne":
+        # t-SNE 좌표의 유클리디안 거리 기준 (KD-트리로 상위 k개만 조회)
+        tsne_point = snapshot.tsne_point(article_id)
+        if not tsne_point:
+            return similar_articles
+        for dist, sim_id in snapshot.neighbors.query(tsne_point, k):
+            matched = snapshot.article(sim_id)
+            if matched:
+                enriched = matched.copy()
+                enriched["distance"] = round(dist * 10, 1)
+                similar_articles.append(enriched)
+    else:
+        # 분류 확률 벡터의 코사인 유사도 기준
+        for score, sim_id in snapshot.similarity.query(article_id, k):
+            matched = snapshot.article(sim_id)
+            if matched:
+                enriched = matched.copy()
+                enriched["similarity"] = round(score, 4)
+                enriched["distance"] = round((1 - score) * 100, 1)
+                similar_articles.append(enriched)
+
+    return similar_articles
+
 # 3차: 뉴스 상세
 @app.get("/news/{company}/article/{article_id}", response_class=HTMLResponse)
-async def article_detail(request: Request, company: str, article_id: int):
-    data_path = os.path.join(DATA_DIR, f"{company}_crawling_with_summary.json")
-    tsne_path = os.path.join(DATA_DIR, f"{company}_tsne.json")
+async def article_detail(request: Request, company: str, article_id: int, k: int = 5, method: str = "prob"):
+    snapshot = store.get(company)
+    if snapshot is None:
+        return HTMLResponse("❌ 기사를 찾을 수 없습니다", status_code=404)
 
-    with open(data_path, "r", encoding="utf-8") as f:
-        articles = json.load(f)
+    if method not in SIMILAR_METHODS:
+        return HTMLResponse(f"❌ method는 {', '.join(SIMILAR_METHODS)} 중 하나", status_code=400)
 
-    with open(tsne_path, "r", encoding="utf-8") as f:
-        tsne_data = json.load(f)
+    article = snapshot.article(article_id)
+    if not article or (method == "tsne" and not snapshot.tsne_point(article_id)):
+        return HTMLResponse("❌ 기사를 찾을 수 없습니다", status_code=404)
 
-    article = next((a for a in articles if a["id"] == article_id), None)
-    tsne_point = next((p for p in tsne_data if p["id"] == article_id), None)
+    k = min(max(k, 1), MAX_SIMILAR)  # 캐시 키에 쓰기 전에 자름 (k=20, 21, 500이 같은 페이지)
 
-    if not article or not tsne_point:
-        return HTMLResponse("❌ 기사를 찾을 수 없습니다", status_code=404)
+    def render():
+        similar_articles = find_similar_articles(snapshot, article_id, method, k)
 
-    # ✅ 유사도 계산 (간단히 유클리디안 거리 기준)
-    from math import sqrt
-    distances = []
-    for p in tsne_data:
-        if p["id"] == article_id:
-            continue
-        dist = sqrt((p["x"] - tsne_point["x"])**2 + (p["y"] - tsne_point["y"])**2)
-        distances.append((dist, p["id"]))
-
-    # 거리순으로 정렬
-    distances.sort(key=lambda x: x[0])
-    similar_articles = []
+        return templates.TemplateResponse("article_detail.html", {
+            "request": request,
+            "company": company,
+            "article": article,
+            "similar_articles": similar_articles
+        })
 
-    for dist, sim_id in distances[:5]:
-        matched = next((a for a in articles if a["id"] == sim_id), None)
-        if matched:
-            enriched = matched.copy()
-            enriched["distance"] = round(dist * 10, 1)
-            similar_articles.append(enriched)
+    return page_cache.serve(request, (company, "article_detail"), snapshot.version, (article_id, k, method), render)
 
-    return templates.TemplateResponse("article_detail.html", {
-        "request": request,
-        "company": company,
-        "article": article,
-        "similar_articles": similar_articles
+# 🔌 유사 기사 JSON API
+@app.get("/api/news/{company}/article/{article_id}/similar")
+async def similar_articles_api(company: str, article_id: int, k: int = 5, method: str = "prob"):
+    snapshot = store.get(company)
+    if snapshot is None or not snapshot.article(article_id):
+        return JSONResponse({"error": "기사를 찾을 수 없습니다"}, status_code=404)
+    if method not in SIMILAR_METHODS:
+        return JSONResponse({"error": f"method는 {', '.join(SIMILAR_METHODS)} 중 하나"}, status_code=400)
+
+    k = min(max(k, 1), MAX_SIMILAR)
+    similar_articles = find_similar_articles(snapshot, article_id, method, k)
+    return JSONResponse({
+        "id": article_id,
+        "method": method,
+        "similar": [
+            {
+                "id": a.get("id"),
+                "title": a.get("title"),
+                "topic": a.get("topic"),
+                "similarity": a.get("similarity"),
+                "distance": a.get("distance"),
+            }
+            for a in similar_articles
+        ]
     })
 
+# 🔌 트렌드 키워드 JSON API
+@app.get("/api/news/{company}/trending")
+async def trending_keywords_api(company: str, window: str = "24h", topic: str = None,
+                                k: int = 10, half_life: float = None):
+    snapshot = store.get(company)
+    if snapshot is None:
+        return JSONResponse({"error": "기사 데이터 없음"}, status_code=404)
+    if window not in WINDOWS:
+        return JSONResponse({"error": f"window는 {', '.join(WINDOWS)} 중 하나"}, status_code=400)
+    if half_life is not None and not valid_half_life(half_life):
+        return JSONResponse({"error": "half_life는 0보다 큰 시간(시)"}, status_code=400)
+
+    k = min(max(k, 1), 50)
+    hours = WINDOWS[window]
+    if topic:
+        keywords = {topic: snapshot.trending.top(topic, hours, k, half_life)}
+    else:
+        keywords = snapshot.trending.top_by_topic(hours, k, half_life)
+    return JSONResponse({"company": company, "window": window, "keywords": keywords})
+
 # 4차: t-SNE 시각화
 @app.get("/news/{company}/visualization", response_class=HTMLResponse)
 def tsne_visualization(request: Request, company: str, highlight: int = None):
-    tsne_path = os.path.join(DATA_DIR, f"{company}_tsne.json")
-    if not os.path.exists(tsne_path):
+    snapshot = store.get(company)
+    if snapshot is None or not snapshot.tsne_data:
         return HTMLResponse("❌ 시각화 데이터 없음", status_code=404)
+    if highlight is not None and not snapshot.tsne_point(highlight):
+        highlight = None  # 없는 점은 강조할 것도 없으므로 같은 페이지
 
-    with open(tsne_path, "r", encoding="utf-8") as f:
-        tsne_data = json.load(f)
+    def render():
+        tsne_data = snapshot.tsne_data
 
-    topic_counts = Counter(item.get("topic") or "기타" for item in tsne_data)
+        topic_counts = Counter(item.get("topic") or "기타" for item in tsne_data)
 
-    TOPIC_COLOR = {
-        "정치": "#e11d48",
-        "경제": "#f59e0b",
-        "스포츠": "#10b981",
-        "연예": "#a855f7",
-        "IT_과학": "#3b82f6",
-        "기타": "#6b7280"
-    }
+        TOPIC_COLOR = {
+            "정치": "#e11d48",
+            "경제": "#f59e0b",
+            "스포츠": "#10b981",
+            "연예": "#a855f7",
+            "IT_과학": "#3b82f6",
+            "기타": "#6b7280"
+        }
 
-    for item in tsne_data:
-        item["topic_color"] = TOPIC_COLOR.get(item.get("topic"), "#6b7280")
+        for item in tsne_data:
+            item["topic_color"] = TOPIC_COLOR.get(item.get("topic"), "#6b7280")
 
-    return templates.TemplateResponse("tsne_visualization.html", {
-        "request": request,
-        "company": company,
-        "tsne_data_json": tsne_data,
-        "topic_counts": topic_counts,
-        "topic_colors": TOPIC_COLOR,
-        "highlight_id": highlight if highlight is not None else None
-    })
+        return templates.TemplateResponse("tsne_visualization.html", {
+            "request": request,
+            "company": company,
+            "tsne_data_json": tsne_data,
+            "topic_counts": topic_counts,
+            "topic_colors": TOPIC_COLOR,
+            "highlight_id": highlight if highlight is not None else None
+        })
+
+    return page_cache.serve(request, (company, "tsne_visualization"), snapshot.version, (highlight,), render)
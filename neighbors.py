@@ -0,0 +1,28 @@
+# neighbors.py
+# 🗺️ t-SNE 좌표 기반 최근접 이웃 검색
+# - t-SNE 파일을 읽을 때 KD-트리를 한 번 만들어 두고
+# - 상세 페이지에서는 전체 거리 계산/정렬 없이 상위 k개만 조회
+import numpy as np
+from sklearn.neighbors import KDTree
+
+
+class TsneNeighbors:
+    def __init__(self, tsne_data):
+        points = [p for p in tsne_data if "x" in p and "y" in p]
+        self.ids = [p.get("id") for p in points]
+        self.coords = np.array([[p["x"], p["y"]] for p in points], dtype=float).reshape(-1, 2)
+        self.tree = KDTree(self.coords) if len(points) else None
+
+    def query(self, point, k=5):
+        # 자기 자신은 제외하고 (거리, id) 목록을 가까운 순으로 반환
+        if self.tree is None or k <= 0:
+            return []
+        n = min(k + 1, len(self.ids))
+        dist, idx = self.tree.query([[point["x"], point["y"]]], k=n)
+
+        result = []
+        for d, i in zip(dist[0], idx[0]):
+            if self.ids[i] == point.get("id"):
+                continue
+            result.append((float(d), self.ids[i]))
+        return result[:k]
@@ -1,4 +1,29 @@
 # news_classifier.py
+import numpy as np
+
+
+# 📌 분류 결과 한 건: 라벨, 최고 확률, 확률 벡터(NumPy 행)
+# dict 변환은 JSON으로 저장할 때만 수행
+class Classification:
+    __slots__ = ("label", "top_prob", "probs", "classes")
+
+    def __init__(self, label, top_prob, probs, classes):
+        self.label = label
+        self.top_prob = top_prob
+        self.probs = probs
+        self.classes = classes
+
+    def probabilities(self):
+        return dict(zip(self.classes, map(float, self.probs)))
+
+    def to_dict(self):
+        return {
+            "topic": self.label,
+            "max_prob": float(self.top_prob),
+            "probabilities": self.probabilities(),
+        }
+
+
 class NewsClassifier:
     def __init__(self, model, vectorizer, label_encoder, threshold=0.5):
         self.model = model
@@ -7,15 +32,34 @@ class NewsClassifier:
         self.threshold = threshold
 
     def predict(self, text):
-        X = self.vectorizer.transform([text])
-        probs = self.model.predict_proba(X)[0]
-        max_prob = max(probs)
-        pred_index = probs.argmax()
-        if max_prob < self.threshold:
-            return "기타"
-        return self.label_encoder.inverse_transform([pred_index])[0]
+        return self.classify(text).label
 
     def predict_proba(self, text):
-        X = self.vectorizer.transform([text])
-        probs = self.model.predict_proba(X)[0]
-        return dict(zip(self.label_encoder.classes_, map(float, probs)))
+        return self.classify(text).probabilities()
+
+    # 📦 여러 문서를 한 번에: TF-IDF 변환 1번 + predict_proba 1번
+    def predict_proba_many(self, texts):
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, len(self.label_encoder.classes_)))
+        X = self.vectorizer.transform(texts)
+        return self.model.predict_proba(X)
+
+    def predict_many(self, texts):
+        # (라벨 리스트, 확률 행렬) 반환, 임계값 미만은 "기타"
+        probs = self.predict_proba_many(texts)
+        if len(probs) == 0:
+            return [], probs
+        labels = self.label_encoder.inverse_transform(probs.argmax(axis=1)).astype(object)
+        labels[probs.max(axis=1) < self.threshold] = "기타"
+        return labels.tolist(), probs
+
+    # 🔍 라벨과 확률을 한 번의 추론으로 함께 계산
+    def classify(self, text):
+        return self.classify_many([text])[0]
+
+    def classify_many(self, texts):
+        labels, probs = self.predict_many(texts)
+        top_probs = probs.max(axis=1) if len(probs) else []
+        classes = self.label_encoder.classes_
+        return [Classification(label, top, row, classes) for label, top, row in zip(labels, top_probs, probs)]
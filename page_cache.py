@@ -0,0 +1,114 @@
+# page_cache.py
+# 🗃️ 렌더링한 HTML 페이지 캐시 (ETag / Last-Modified / 304)
+# - 키: 범위(방송사, 라우트) + 데이터 버전 + 정리된 쿼리 파라미터
+# - 범위의 데이터 버전(기사/t-SNE 파일, 핫 키워드 파일)이 바뀌면 그 범위의 이전 버전 페이지를 한꺼번에 버림
+# - 본문 바이트 합계가 상한을 넘으면 가장 오래 안 쓰인 페이지부터 삭제 (OrderedDict LRU)
+# - 응답에 ETag(본문 해시)와 Last-Modified(렌더링 시각)를 붙이고, 조건부 요청이 맞으면 본문 없이 304
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+
+from fastapi.responses import Response
+
+ENTRY_OVERHEAD = 512  # 키/헤더 등 본문 외에 드는 대략적인 크기
+
+
+class CachedPage:
+    def __init__(self, body, media_type):
+        self.body = body
+        self.media_type = media_type
+        self.etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self.last_modified = int(time.time())
+        self.size = len(body) + ENTRY_OVERHEAD
+
+
+def _etag_matches(header, etag):
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*" or (tag[2:] if tag.startswith("W/") else tag) == etag:
+            return True
+    return False
+
+
+def _not_modified_since(header, last_modified):
+    try:
+        since = parsedate_to_datetime(header).timestamp()
+    except (TypeError, ValueError):
+        return False
+    return last_modified <= since
+
+
+class PageCache:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._pages = OrderedDict()  # (범위, 버전, 파라미터) → CachedPage
+        self._versions = {}          # 범위 → 마지막으로 본 데이터 버전
+        self._lock = threading.Lock()
+
+    def _set_version(self, scope, version):
+        if self._versions.get(scope) == version:
+            return
+        self._versions[scope] = version
+        for key in [key for key in self._pages if key[0] == scope and key[1] != version]:
+            self.size -= self._pages.pop(key).size
+
+    def get(self, scope, version, params):
+        key = (scope, version, params)
+        with self._lock:
+            self._set_version(scope, version)
+            page = self._pages.get(key)
+            if page is None:
+                self.misses += 1
+                return None
+            self._pages.move_to_end(key)
+            self.hits += 1
+            return page
+
+    def put(self, scope, version, params, body, media_type="text/html"):
+        page = CachedPage(body, media_type)
+        key = (scope, version, params)
+        with self._lock:
+            # 렌더링하는 사이 데이터가 바뀌었으면 (또는 혼자서 상한을 넘으면) 저장하지 않고 이번 응답에만 사용
+            if self._versions.get(scope) != version or page.size > self.max_bytes:
+                return page
+            old = self._pages.pop(key, None)
+            if old is not None:
+                self.size -= old.size
+            self._pages[key] = page
+            self.size += page.size
+            while self.size > self.max_bytes:
+                _, evicted = self._pages.popitem(last=False)
+                self.size -= evicted.size
+        return page
+
+    def respond(self, page, request):
+        # If-None-Match가 있으면 그것만 보고, 없을 때만 If-Modified-Since 확인 (RFC 9110)
+        headers = {
+            "ETag": page.etag,
+            "Last-Modified": formatdate(page.last_modified, usegmt=True),
+            "Cache-Control": "no-cache",  # 저장은 하되 쓸 때마다 재검증 → 데이터가 바뀌면 바로 반영
+        }
+        if_none_match = request.headers.get("if-none-match")
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_none_match is not None:
+            not_modified = _etag_matches(if_none_match, page.etag)
+        else:
+            not_modified = if_modified_since is not None and _not_modified_since(if_modified_since, page.last_modified)
+        if not_modified:
+            return Response(status_code=304, headers=headers)
+        return Response(page.body, media_type=page.media_type, headers=headers)
+
+    def serve(self, request, scope, version, params, render):
+        # 캐시에 있으면 그대로, 없으면 render()로 만들어서 200 응답만 저장
+        page = self.get(scope, version, params)
+        if page is None:
+            response = render()
+            if response.status_code != 200:
+                return response
+            page = self.put(scope, version, params, response.body)
+        return self.respond(page, request)
@@ -0,0 +1,233 @@
+# record_io.py
+# 📜 파이프라인 공용 레코드 입출력 (크롤링 → 분류 → 요약 → 병합 → 웹)
+# - 기본 형식은 JSONL: 한 줄에 레코드(기사) 하나, 경로가 .gz로 끝나면 gzip 압축
+# - 읽기/쓰기 모두 제너레이터 기반이라 파일 전체를 메모리에 올리지 않음
+# - 예전 JSON 배열 파일(.json)도 읽을 수 있어서 기존 데이터는 그대로 두고 옮겨갈 수 있음
+# - 쓰기는 임시 파일에 쓴 뒤 os.replace로 교체 → 중간에 죽어도 기존 파일은 그대로
+# - 제자리에 추가하는 아카이브(utils/updated.py)는 {이름}.meta.json에 기록된 크기까지만 커밋된 데이터로 봄
+import gzip
+import io
+import json
+import os
+from itertools import islice
+
+# 같은 이름의 파일이 여러 형식으로 있으면 앞쪽을 우선 사용
+RECORD_SUFFIXES = (".jsonl", ".jsonl.gz", ".json")
+META_SUFFIX = ".meta.json"
+
+
+def _open(path, mode, compress=None):
+    if compress is None:
+        compress = path.endswith(".gz")
+    if compress:
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def strip_suffix(path):
+    for suffix in RECORD_SUFFIXES:
+        if path.endswith(suffix):
+            return path[:-len(suffix)]
+    return path
+
+
+def record_path(path, compress=False):
+    # 확장자와 상관없이 같은 이름의 JSONL 경로 (쓰기용)
+    return strip_suffix(path) + (".jsonl.gz" if compress else ".jsonl")
+
+
+def resolve_records(path):
+    # 확장자와 상관없이 실제로 존재하는 파일 경로, 없으면 None (읽기용)
+    base = strip_suffix(path)
+    for suffix in RECORD_SUFFIXES:
+        candidate = base + suffix
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+
+def file_signature(path):
+    # (경로, mtime, 크기, 커밋된 크기): 파일이 바뀌었는지 비교용, 파일이 없으면 None
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (path, st.st_mtime_ns, st.st_size, committed_size(path))
+
+
+def source_signature(*paths):
+    # SQLite로 가져온 시점의 원본 파일들 (작업 디렉터리가 달라도 비교되도록 경로 대신 파일 이름만)
+    signatures = []
+    for path in paths:
+        signature = file_signature(path)
+        signatures.append(None if signature is None else [os.path.basename(signature[0])] + list(signature[1:]))
+    return json.dumps(signatures)
+
+
+def meta_path(path):
+    # 제자리 추가 아카이브의 사이드카 (마지막 id, 기사 수, 커밋된 크기 archive_size 등)
+    return strip_suffix(path) + META_SUFFIX
+
+
+def committed_size(path):
+    # 사이드카에 기록된 커밋 크기
+    # 사이드카가 없거나 다른 도구가 파일을 다시 쓴 경우 (다른 파일로 교체됨 / 기록보다 작음 / JSONL 줄 경계가 아님) None → 파일 전체
+    try:
+        with open(meta_path(path), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        size = meta.get("archive_size")
+        st = os.stat(path)
+        if not isinstance(size, int) or not 0 <= size <= st.st_size:
+            return None
+        if meta.get("archive_inode", st.st_ino) != st.st_ino:
+            return None
+        if path.endswith(".jsonl") and size:
+            with open(path, "rb") as f:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    return None
+    except (OSError, ValueError, AttributeError):
+        return None
+    return size
+
+
+class _Limited(io.RawIOBase):
+    # 현재 위치부터 left 바이트까지만 읽히는 파일 객체 (None이면 끝까지)
+    def __init__(self, f, left):
+        self._f = f
+        self._left = left
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._left is None:
+            return self._f.readinto(b)
+        n = self._f.readinto(memoryview(b)[:max(0, min(len(b), self._left))])
+        self._left -= n
+        return n
+
+
+def _lines(path, limit, start):
+    if limit is None and not start:
+        with _open(path, "r") as f:
+            yield from f
+        return
+    with open(path, "rb") as raw:
+        raw.seek(start)
+        binary = io.BufferedReader(_Limited(raw, None if limit is None else limit - start))
+        if path.endswith(".gz"):
+            binary = gzip.GzipFile(fileobj=binary, mode="rb")
+        yield from io.TextIOWrapper(binary, encoding="utf-8")
+
+
+def read_records(path, limit=None, start=0):
+    # limit: 앞에서부터 이 바이트까지만 읽음 (추가 중인 아카이브의 커밋되지 않은 꼬리 무시, 보통 committed_size(path))
+    # start: 이 바이트부터 읽음 (지난번에 읽은 커밋 크기, 줄 경계/gzip 멤버 경계여야 함, .json은 지원 안 함)
+    if path.endswith(".json"):
+        if start:
+            raise ValueError(f"JSON 배열 파일은 중간부터 읽을 수 없음: {path}")
+        # 예전 형식: 배열 전체를 한 번에 읽을 수밖에 없음
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = [data]
+        yield from data
+        return
+
+    for line_no, line in enumerate(_lines(path, limit, start), start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{path}:{line_no} JSONL 파싱 실패: {e}") from e
+
+
+def iter_batches(records, size):
+    # 레코드 스트림을 size개씩 묶어서 반환 (배치 추론/요청용)
+    records = iter(records)
+    while True:
+        batch = list(islice(records, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _dump(record):
+    return json.dumps(record, ensure_ascii=False)
+
+
+class RecordWriter:
+    # with RecordWriter(path) as writer: writer.write(record)
+    # 정상 종료 시에만 임시 파일을 원래 경로로 교체, 예외가 나면 임시 파일 삭제
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.count = 0
+        self._tmp_path = path + ".tmp"
+        self._legacy = path.endswith(".json")  # JSON 배열로 써야 하는 경우
+        self._f = _open(self._tmp_path, "w", compress=path.endswith(".gz"))
+        if self._legacy:
+            self._f.write("[")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, record):
+        if self._legacy:
+            self._f.write(("," if self.count else "") + "\n" + _dump(record))
+        else:
+            self._f.write(_dump(record) + "\n")
+        self.count += 1
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def close(self):
+        if self._f is None:
+            return
+        if self._legacy:
+            self._f.write("\n]" if self.count else "]")
+        self._f.close()
+        self._f = None
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        if self._f is None:
+            return
+        self._f.close()
+        self._f = None
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+def write_records(path, records):
+    # 레코드 스트림을 파일 하나로 저장, 저장한 개수 반환
+    with RecordWriter(path) as writer:
+        writer.write_many(records)
+    return writer.count
+
+
+def append_records(path, records):
+    # 기존 JSONL 파일 끝에 추가 (gzip은 멤버가 이어 붙여지고, 읽을 때 하나로 이어서 읽힘)
+    if path.endswith(".json"):
+        raise ValueError(f"JSON 배열 파일에는 추가할 수 없음: {path}")
+    count = 0
+    with _open(path, "a") as f:
+        for record in records:
+            f.write(_dump(record) + "\n")
+            count += 1
+    return count
@@ -0,0 +1,238 @@
+# search_index.py
+# 🔎 기사 전문 검색 (BM25 역색인)
+# - 문서 = cleaned_title / description / summary의 MeCab 명사(2글자 이상) + keywords
+# - 단어 → (문서 번호, 빈도) 역색인, 질의 단어의 목록만 훑으므로 비용이 전체 기사 수가 아니라 매칭 수에 비례
+# - 목록은 array로 보관(기사 10만 개 이상도 메모리 부담이 작음), 점수는 numpy로 한 번에 계산, 상위 k개는 partition
+# - 명사 추출은 파이프라인(utils/updated.py)이 병합할 때 해서 아카이브 옆 {이름}.terms.jsonl에 기록 (article_terms)
+#   → 웹 서버는 이 파일을 읽기만 하고 MeCab을 쓰지 않음, 파일에 없는 기사는 제목 단어 + 핵심어로 색인 (fallback_terms)
+# - 질의도 MeCab 없이 색인의 명사 목록에 맞춰 나눔 (조사 떼기, 붙여 쓴 명사 나누기 → query_terms)
+# - utils/updated.py가 아카이브/명사 파일 뒤에 추가만 하므로 새 스냅샷은 이전 색인을 이어받아 새 기사만 추가
+import json
+import math
+import os
+import re
+import threading
+from array import array
+from collections import Counter
+
+import numpy as np
+
+from record_io import iter_batches, strip_suffix
+
+# BM25 파라미터
+K1 = 1.2
+B = 0.75
+
+TEXT_FIELDS = ("cleaned_title", "description", "summary")
+INDEX_BATCH = 2000  # 한 번에 형태소 분석하는 기사 수
+FAILED_SUMMARY = "요약 실패"  # utils/summarize.py가 요약에 실패했을 때 넣는 값
+TERMS_SUFFIX = ".terms.jsonl"
+
+# MeCab 없이 쓰는 단어 분리 (질의, 명사 파일에 없는 기사의 제목)
+_WORD = re.compile(r"[0-9A-Za-z가-힣]{2,}")
+
+# 질의 단어 끝의 조사 (색인은 명사라서 "반도체가" → "반도체"로 맞춰야 찾음), 긴 것부터 시도
+JOSA = sorted((
+    "이", "가", "은", "는", "을", "를", "의", "에", "와", "과", "도", "만", "로", "으로", "에서", "에게", "한테",
+    "까지", "부터", "보다", "처럼", "이나", "나", "랑", "이랑", "께서", "에서의", "으로의", "로의", "과의", "와의",
+    "이다", "이고", "이며", "들", "들이", "들은", "들을", "들의",
+), key=len, reverse=True)
+MAX_SEGMENT_LENGTH = 30  # 이보다 긴 질의 단어는 명사로 나누지 않음 (나누는 비용이 길이 제곱)
+
+
+def terms_path(archive_path):
+    # 아카이브 옆 명사 파일 (한 줄에 {"id", "video_link", "terms"} 하나, 아카이브와 같은 순서로 추가만 함)
+    return strip_suffix(archive_path) + TERMS_SUFFIX
+
+
+def _inode(path):
+    try:
+        return os.stat(path).st_ino
+    except (OSError, TypeError):
+        return None
+
+
+def _doc_key(article):
+    return (article.get("id"), article.get("video_link"))
+
+
+def _texts(article):
+    for field in TEXT_FIELDS:
+        text = article.get(field) or ""
+        if field == "summary" and text == FAILED_SUMMARY:
+            text = ""
+        yield text
+
+
+def article_terms(tokenizer, articles):
+    # 파이프라인용: 기사마다 명사 파일 레코드 생성 (tokenizer는 tokenizer.TokenizerPool)
+    for batch in iter_batches(articles, INDEX_BATCH):
+        nouns = list(tokenizer.nouns([text for article in batch for text in _texts(article)]))
+        per_doc = len(TEXT_FIELDS)
+        for i, article in enumerate(batch):
+            terms = [n for field_nouns in nouns[i * per_doc:(i + 1) * per_doc] for n in field_nouns if len(n) > 1]
+            yield {"id": article.get("id"), "video_link": article.get("video_link"),
+                   "terms": terms + (article.get("keywords") or [])}
+
+
+def fallback_terms(article):
+    # 명사 파일에 없는 기사 (아직 분석 전이거나 MeCab 없이 병합됨): 제목 단어 + 핵심어
+    title = article.get("cleaned_title") or article.get("title") or ""
+    return _WORD.findall(title) + (article.get("keywords") or [])
+
+
+def _segment(word, vocabulary):
+    # 색인에 있는 명사(2글자 이상)로만 word 전체를 가장 적은 조각으로 나눔 ("반도체수출" → 반도체, 수출), 안 되면 None
+    if word in vocabulary:
+        return [word]
+    if len(word) > MAX_SEGMENT_LENGTH:
+        return None
+    best = [None] * (len(word) + 1)  # best[i]: word[:i]를 나눈 조각들
+    best[0] = []
+    for end in range(2, len(word) + 1):
+        for start in range(end - 1):
+            if best[start] is not None and word[start:end] in vocabulary:
+                if best[end] is None or len(best[start]) + 1 < len(best[end]):
+                    best[end] = best[start] + [word[start:end]]
+    return best[-1]
+
+
+def query_terms(query, vocabulary=()):
+    # 질의는 MeCab 없이 띄어쓰기/기호로 나눈 뒤 색인에 쓰인 명사에 맞춤:
+    # 그대로 있으면 그대로 → 명사로 나뉘면 조각들 → 끝의 조사를 떼고 다시 (맞는 게 없으면 원래 단어, 검색 결과에는 영향 없음)
+    terms = []
+    for word in _WORD.findall(query):
+        candidates = [word] + [word[:-len(josa)] for josa in JOSA if word.endswith(josa) and len(word) - len(josa) >= 2]
+        for candidate in candidates:
+            pieces = _segment(candidate, vocabulary)
+            if pieces:
+                terms += pieces
+                break
+        else:
+            terms.append(word)
+    return list(dict.fromkeys(terms))
+
+
+class SearchIndex:
+    def __init__(self):
+        self.ids = []            # 문서 번호 → 기사 id
+        self._keys = []          # 문서 번호 → (id, video_link), 이어받을 수 있는지 확인용
+        self._lengths = array("i")
+        self._total_length = 0
+        self._postings = {}      # 단어 → (문서 번호 array, 빈도 array)
+        self._terms_read = (None, 0)  # 명사 파일을 어디까지 읽었는지 (inode, 바이트)
+        self._lock = threading.Lock()
+        self._update_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _read_terms(self, path, keys):
+        # 명사 파일에서 keys에 해당하는 기사의 명사만 (지난번에 읽은 곳부터, 파일이 교체됐으면 처음부터)
+        found = {}
+        if path is None or not keys:
+            return found
+        try:
+            st = os.stat(path)
+        except OSError:
+            return found
+        inode, offset = self._terms_read
+        if inode != st.st_ino or offset > st.st_size:
+            offset = 0
+        # 다음에는 마지막으로 찾은 줄 뒤부터 읽음 (파이프라인은 아카이브 커밋 전에 명사를 쓰므로,
+        # 그 뒤의 줄은 아직 안 보이는 기사일 수 있음 → 다음 버전에서 다시 확인)
+        read_until = offset
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # 파이프라인이 쓰는 중인 마지막 줄
+                offset += len(line)
+                try:
+                    record = json.loads(line)
+                    key = (record.get("id"), record.get("video_link"))
+                except (ValueError, AttributeError):
+                    continue
+                if key in keys:
+                    found[key] = record.get("terms") or []
+                    read_until = offset
+        self._terms_read = (st.st_ino, read_until)
+        return found
+
+    def add(self, articles, terms_path=None):
+        terms_by_key = self._read_terms(terms_path, {_doc_key(a) for a in articles})
+        with self._lock:
+            for article in articles:
+                key = _doc_key(article)
+                terms = terms_by_key.get(key)
+                if terms is None:
+                    terms = fallback_terms(article)
+
+                doc = len(self.ids)
+                self.ids.append(article.get("id"))
+                self._keys.append(key)
+                self._lengths.append(len(terms))
+                self._total_length += len(terms)
+                for term, tf in Counter(terms).items():
+                    postings = self._postings.get(term)
+                    if postings is None:
+                        postings = self._postings[term] = (array("i"), array("i"))
+                    postings[0].append(doc)
+                    postings[1].append(tf)
+
+    def updated(self, articles, terms_path=None):
+        # 기존 문서가 articles의 앞부분과 그대로 같으면 뒤에 붙은 새 기사만 추가하고 이 색인을 계속 사용,
+        # 중간이 바뀌었거나 (아카이브를 다시 만든 경우) 명사 파일이 새로 생기거나 다시 쓰였으면 새로 만듦
+        with self._update_lock:
+            n = len(self._keys)
+            if _inode(terms_path) == self._terms_read[0] and len(articles) >= n and all(_doc_key(a) == key for a, key in zip(articles, self._keys)):
+                if len(articles) > n:
+                    self.add(articles[n:], terms_path)
+                return self
+        index = SearchIndex()
+        index.add(articles, terms_path)
+        return index
+
+    def search(self, query, limit=30, offset=0):
+        # (매칭된 문서 수, [(점수, 기사 id)]) 점수 높은 순, 동점이면 아카이브 순서
+        if not query or not query.strip() or limit <= 0:
+            return 0, []
+
+        with self._lock:
+            terms = query_terms(query, self._postings)
+            n = len(self.ids)
+            if n == 0:
+                return 0, []
+            avg_length = self._total_length / n or 1.0
+            scores = np.zeros(n, dtype=np.float64)
+            lengths = np.array(self._lengths, dtype=np.float64)
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+                docs = np.array(postings[0], dtype=np.int64)
+                tfs = np.array(postings[1], dtype=np.float64)
+                df = len(docs)
+                idf = math.log(1 + (n - df + 0.5) / (df + 0.5))
+                scores[docs] += idf * tfs * (K1 + 1) / (tfs + K1 * (1 - B + B * lengths[docs] / avg_length))
+            ids = self.ids  # 추가만 되므로 n 이전 번호는 그대로
+
+        matched = np.flatnonzero(scores > 0)
+        total = len(matched)
+        need = offset + limit
+        if need < total:
+            # need번째 점수 이상만 남긴 뒤 정렬 (경계의 동점도 아카이브 순서대로 자르기 위해)
+            cutoff = -np.partition(-scores[matched], need - 1)[need - 1]
+            matched = matched[scores[matched] >= cutoff]
+        order = matched[np.lexsort((matched, -scores[matched]))]
+        return total, [(float(scores[doc]), ids[doc]) for doc in order[offset:need]]
+
+
+def refresh(index, company, articles, terms_path):
+    # 스냅샷이 처음 검색할 때 색인을 이 버전에 맞춤
+    # 실패하면 검색만 끄고 (None) 목록/상세 등 다른 페이지는 그대로 동작, 다음 데이터 버전에서 다시 시도
+    try:
+        return (index or SearchIndex()).updated(articles, terms_path)
+    except Exception as e:
+        print(f"⚠️ {company} 검색 색인 실패, 검색을 끕니다: {e}")
+        return None
@@ -0,0 +1,47 @@
+# similarity.py
+# 🧮 분류 확률 벡터 기반 유사 기사 검색
+# - 기사마다 저장된 probabilities(토픽별 확률)를 행렬로 모아 L2 정규화해 두고
+# - 코사인 유사도를 행렬-벡터 곱 한 번으로 계산한 뒤 상위 k개만 argpartition으로 추림
+import numpy as np
+
+
+class SimilarityEngine:
+    def __init__(self, articles):
+        # 라벨 순서는 처음 등장한 순서대로 고정
+        labels = {}
+        for article in articles:
+            for label in (article.get("probabilities") or {}):
+                labels.setdefault(label, len(labels))
+        self.labels = list(labels)
+
+        self.ids = [a.get("id") for a in articles]
+        self.row_of = {}
+        for row, article_id in enumerate(self.ids):
+            self.row_of.setdefault(article_id, row)
+
+        matrix = np.zeros((len(articles), len(labels)), dtype=np.float32)
+        for row, article in enumerate(articles):
+            for label, prob in (article.get("probabilities") or {}).items():
+                matrix[row, labels[label]] = prob
+
+        norms = np.linalg.norm(matrix, axis=1)
+        self.valid = norms > 0
+        norms[~self.valid] = 1.0
+        self.matrix = matrix / norms[:, None]
+
+    def query(self, article_id, k=5):
+        # (코사인 유사도, id) 목록을 유사도 높은 순으로 반환, 자기 자신 제외
+        row = self.row_of.get(article_id)
+        if row is None or not self.valid[row] or k <= 0:
+            return []
+
+        scores = self.matrix @ self.matrix[row]
+        scores[~self.valid] = -np.inf
+        scores[row] = -np.inf
+
+        n = min(k, int(self.valid.sum()) - 1)
+        if n <= 0:
+            return []
+        top = np.argpartition(-scores, n - 1)[:n]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(float(scores[i]), self.ids[i]) for i in top]
@@ -0,0 +1,59 @@
+# 테스트에서 프로젝트 루트 모듈과 utils 스크립트(FINAL.py 등)를 import 할 수 있게 경로 추가
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "utils"))
+
+FIXTURES = os.path.join(ROOT, "tests", "fixtures")
+
+
+def make_article(n, **fields):
+    # 병합/웹 테스트용 SBS 기사 (fields로 덮어씀, None을 주면 그 필드는 뺌)
+    article = {"title": f"기사 {n}", "upload_date_kst": f"2025-06-02 {n:02d}:00:00", "topic": "경제",
+               "video_link": f"https://www.youtube.com/watch?v=v{n}", "probabilities": {"경제": 0.9, "정치": 0.1},
+               "keywords": ["반도체"]}
+    article.update(fields)
+    return {key: value for key, value in article.items() if value is not None}
+
+
+class Pipeline:
+    # utils/updated.py 병합을 tmp_path 안에서 실행 (아카이브/새 파일/SQLite/형태소 캐시 모두 tmp_path 아래)
+    def __init__(self, tmp_path):
+        self.crawling = tmp_path / "crawling"
+        self.process = tmp_path / "process"
+        self.db_path = str(tmp_path / "articles.sqlite")
+        self.token_cache_path = str(tmp_path / "mecab_tokens.sqlite")
+        self.crawling.mkdir()
+        self.process.mkdir()
+
+    def archive(self, suffix=".jsonl"):
+        return str(self.crawling / f"SBS_crawling_with_summary{suffix}")
+
+    def meta(self):
+        with open(self.crawling / "SBS_crawling_with_summary.meta.json", "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def new_file(self, records):
+        from record_io import write_records
+        write_records(str(self.process / "SBS_processing_summary.jsonl"), records)
+
+    def merge(self, records):
+        import updated
+        self.new_file(records)
+        updated.merge("SBS")
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    import updated
+    pipeline = Pipeline(tmp_path)
+    monkeypatch.setattr(updated, "crawling_dir", str(pipeline.crawling))
+    monkeypatch.setattr(updated, "process_dir", str(pipeline.process))
+    monkeypatch.setattr(updated, "db_path", pipeline.db_path)
+    monkeypatch.setattr(updated, "token_cache_path", pipeline.token_cache_path)
+    return pipeline
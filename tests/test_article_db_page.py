@@ -0,0 +1,91 @@
+# article_db 목록 페이지: 파일 기반(CompanySnapshot)과 같은 순서/개수, 개수는 companies에 보관, 정렬은 인덱스로만
+import sqlite3
+
+import pytest
+
+from article_db import ORDER_BY, ArticleDB
+from article_store import SORT_KEYS, CompanySnapshot
+
+
+def articles(n, start=1):
+    # 날짜/조회수 동점, 주제 없는 기사, "기타"가 섞인 기사
+    topics = ["정치", "경제", "기타", None, "연예"]
+    rows = []
+    for i in range(start, start + n):
+        row = {"id": i, "title": f"기사 {i}", "upload_date_kst": f"2025-06-{i % 7 + 1:02d} 10:00:00",
+               "view_count": i % 4 * 10, "video_link": f"https://www.youtube.com/watch?v=v{i}"}
+        if topics[i % 5]:
+            row["topic"] = topics[i % 5]
+        rows.append(row)
+    return rows
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = ArticleDB(str(tmp_path / "articles.sqlite"))
+    yield db
+    db.close()
+
+
+def ids(page):
+    return [a["id"] for a in page.items]
+
+
+@pytest.mark.parametrize("sort", SORT_KEYS + (None,))
+@pytest.mark.parametrize("topic", [None, "정치", "기타", "없는주제"])
+def test_page_matches_file_snapshot(db, sort, topic):
+    rows = articles(60)
+    db.import_company("SBS", rows, [])
+    snapshot = CompanySnapshot("SBS", articles(60), [], None, None)
+
+    for page in (1, 2, 5):
+        expected = snapshot.page(sort, topic, page, 7)
+        actual = db.page("SBS", sort, topic, page, 7)
+        assert ids(actual) == ids(expected)
+        assert actual.total == expected.total
+
+
+def test_counts_follow_import_and_append(db):
+    db.import_company("SBS", articles(10), [], "source-1")
+    db.import_company("KBS", articles(3), [])
+    db.append_articles("SBS", articles(5, start=11), "source-1", "source-2")
+
+    assert db.page("SBS").total == 15
+    assert db.page("SBS", topic="정치").total == 3
+    assert db.page("KBS").total == 3
+    assert db.count("SBS") == 15 and db.count("SBS", "정치") == 3 and db.count("YTN") == 0
+
+    db.import_company("SBS", articles(2), [])
+    assert db.page("SBS").total == 2 and db.page("SBS", topic="정치").total == 0
+
+
+@pytest.mark.parametrize("sort", list(ORDER_BY))
+@pytest.mark.parametrize("topic", [None, "정치"])
+def test_page_query_does_not_sort(db, sort, topic):
+    db.import_company("SBS", articles(200), [])
+    queries = []
+    db._conn.set_trace_callback(queries.append)
+    db.page("SBS", sort, topic, 3, 10)
+    db._conn.set_trace_callback(None)
+
+    select = next(q for q in queries if "LIMIT" in q)
+    plan = " ".join(row[3] for row in db._conn.execute("EXPLAIN QUERY PLAN " + select))
+    assert "TEMP B-TREE" not in plan and "SCAN" not in plan
+    assert not any("COUNT(*)" in q for q in queries)
+
+
+def test_old_database_is_migrated(tmp_path):
+    path = str(tmp_path / "old.sqlite")
+    db = ArticleDB(path)
+    db.import_company("SBS", articles(10), [])
+    db.close()
+    # 개수 열이 생기기 전의 DB
+    conn = sqlite3.connect(path)
+    conn.execute("ALTER TABLE companies DROP COLUMN article_count")
+    conn.execute("ALTER TABLE companies DROP COLUMN topic_counts")
+    conn.commit()
+    conn.close()
+
+    db = ArticleDB(path)
+    assert db.page("SBS").total == 10 and db.page("SBS", topic="경제").total == 2
+    db.close()
@@ -0,0 +1,65 @@
+# SQLite 저장소와 아카이브 파일 동기화
+# - 가져온 뒤 파일만 바뀌면 웹(ArticleStore)은 오래된 DB 대신 파일을 읽음
+# - utils/updated.py 병합은 DB에도 새 기사를 추가하고 서명을 맞춤 → 다시 DB 사용
+import pytest
+
+from article_db import ArticleDB
+from article_store import ArticleStore
+from conftest import make_article
+from record_io import committed_size, read_records, source_signature, write_records
+
+
+@pytest.fixture
+def setup(pipeline):
+    pipeline.merge([make_article(1), make_article(2)])  # DB가 아직 없으므로 아카이브만 생성
+
+    archive = pipeline.archive()
+    db = ArticleDB(pipeline.db_path)
+    db.import_company("SBS", read_records(archive, committed_size(archive)), [], source_signature(archive, None))
+    store = ArticleStore(str(pipeline.crawling), None, db=db)
+    yield store, db, archive
+    db.close()
+
+
+def test_imported_db_is_used(setup):
+    store, db, archive = setup
+
+    snapshot = store.get("SBS")
+
+    assert snapshot.version[0] == "db"
+    assert snapshot.article(2)["title"] == "기사 2"
+
+
+def test_newer_file_beats_stale_import(setup):
+    store, db, archive = setup
+    before = store.get("SBS").version
+
+    # DB를 거치지 않고 파일만 바뀜 (다른 도구가 아카이브를 다시 씀)
+    write_records(archive, [make_article(1, id=1), make_article(2, id=2), make_article(3, id=3, title="파일에만 있는 기사")])
+
+    snapshot = store.get("SBS")
+    assert snapshot.version != before and snapshot.version[0] != "db"
+    assert snapshot.article(3)["title"] == "파일에만 있는 기사"
+
+
+def test_merge_appends_to_db(setup, pipeline):
+    store, db, archive = setup
+    before = store.get("SBS").version
+
+    pipeline.merge([make_article(2), make_article(3)])
+
+    snapshot = store.get("SBS")
+    assert snapshot.version[0] == "db" and snapshot.version != before
+    assert snapshot.article(3)["title"] == "기사 3"
+    assert snapshot.page("latest").total == 3
+
+
+def test_merge_does_not_refresh_an_already_stale_db(setup, pipeline):
+    store, db, archive = setup
+    write_records(archive, [make_article(n, id=n) for n in (1, 2, 3)])  # DB에 반영 안 된 변경
+
+    pipeline.merge([make_article(4)])
+
+    snapshot = store.get("SBS")
+    assert snapshot.version[0] != "db"
+    assert db.version("SBS") == ("db", 1)
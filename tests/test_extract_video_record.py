@@ -0,0 +1,150 @@
+# utils/FINAL.py 2단계 (yt-dlp 메타데이터 → 저장 레코드)
+# - fixtures/ytdlp/*.json: yt-dlp extract_info 결과와 같은 필드/구조로 줄인 메타데이터, 네트워크 없이 실행
+# - 현재 시각은 고정해서 24시간 필터 결과가 실행 시점에 따라 달라지지 않게 함
+import copy
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+import FINAL
+from conftest import FIXTURES
+
+# SBS 영상 업로드 시각(2025-06-02 12:00 KST) 기준
+UPLOADED_KST = pytz.timezone("Asia/Seoul").localize(datetime(2025, 6, 2, 12, 0, 0))
+
+
+def load_info(name):
+    with open(os.path.join(FIXTURES, "ytdlp", name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def freeze_now(monkeypatch, hours_after_upload):
+    # FINAL.datetime.now()만 업로드 시각 + hours_after_upload로 고정
+    moment = UPLOADED_KST + timedelta(hours=hours_after_upload)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return moment.astimezone(tz) if tz else moment.replace(tzinfo=None)
+
+    monkeypatch.setattr(FINAL, "datetime", FrozenDatetime)
+
+
+@pytest.fixture(autouse=True)
+def fresh_language_cache(monkeypatch):
+    monkeypatch.setattr(FINAL, "language_gate", FINAL.LanguageGate())
+
+
+def test_record_fields(monkeypatch):
+    freeze_now(monkeypatch, 2)
+    info = load_info("sbs_news_info.json")
+
+    record = FINAL.extract_video_record(info, "https://www.youtube.com//watch?v=Qx7v2LmN0aE")
+
+    assert record == {
+        "title": info["title"],
+        "cleaned_title": "반도체 수출 석 달 연속 증가 하반기도 호조 2025.06.02",
+        "upload_date_kst": "2025-06-02 12:00:00",
+        "description": "반도체 수출이 석 달 연속 늘었습니다 산업통상자원부는 지난달 반도체 수출액이 달러로 "
+                       "전보다 늘었다고 밝혔습니다",
+        "video_link": "https://www.youtube.com/watch?v=Qx7v2LmN0aE",
+        "thumbnail_link": "https://i.ytimg.com/vi_webp/Qx7v2LmN0aE/maxresdefault.webp",
+        "view_count": 15342,
+    }
+
+
+def test_fallbacks_when_fields_missing(monkeypatch):
+    freeze_now(monkeypatch, 2)
+    info = load_info("sbs_news_info.json")
+    for key in ("timestamp", "thumbnails", "webpage_url"):
+        del info[key]
+
+    record = FINAL.extract_video_record(info, "https://www.youtube.com//watch?v=Qx7v2LmN0aE")
+
+    # 업로드 시각을 모르면 필터링하지 않고 포함
+    assert record["upload_date_kst"] is None
+    assert record["thumbnail_link"] == info["thumbnail"]
+    assert record["video_link"] == "https://www.youtube.com//watch?v=Qx7v2LmN0aE"
+
+
+@pytest.mark.parametrize("hours, kept", [(0, True), (23.9, True), (24, False), (30, False)])
+def test_age_filter(monkeypatch, hours, kept):
+    freeze_now(monkeypatch, hours)
+    info = load_info("sbs_news_info.json")
+
+    record = FINAL.extract_video_record(info, info["webpage_url"])
+
+    assert (record is not None) == kept
+
+
+def test_english_video_rejected(monkeypatch):
+    freeze_now(monkeypatch, 2)
+    info = load_info("english_news_info.json")
+
+    assert FINAL.extract_video_record(info, info["webpage_url"]) is None
+
+
+def test_english_title_with_korean_description_kept(monkeypatch):
+    # 제목과 설명이 모두 영어일 때만 제외
+    freeze_now(monkeypatch, 2)
+    info = load_info("english_news_info.json")
+    info["description"] = load_info("sbs_news_info.json")["description"]
+
+    assert FINAL.extract_video_record(info, info["webpage_url"]) is not None
+
+
+class FakeYDL:
+    def __init__(self, infos=None, error=None):
+        self.infos = infos or {}
+        self.error = error
+        self.calls = []
+
+    def extract_info(self, url, download=True):
+        self.calls.append((url, download))
+        if self.error is not None:
+            raise self.error
+        return copy.deepcopy(self.infos[url])
+
+
+def test_process_video_data_uses_given_ydl(monkeypatch):
+    freeze_now(monkeypatch, 2)
+    info = load_info("sbs_news_info.json")
+    url = "https://www.youtube.com//watch?v=Qx7v2LmN0aE"
+    ydl = FakeYDL({url: info})
+
+    fetched_at, record = FINAL.process_video_data({"url": url, "upload_time_summary": "2시간 전"}, ydl)
+
+    assert ydl.calls == [(url, False)]
+    assert fetched_at == "2025-06-02 14:00:00"
+    assert record["video_link"] == info["webpage_url"]
+
+
+def test_process_video_data_rejected_video_still_fetched(monkeypatch):
+    # 제외된 영상도 메타데이터는 받았으므로 수집 시각을 돌려줌 → 확인 기록에 남아 다음 실행에서 다시 요청하지 않음
+    freeze_now(monkeypatch, 30)
+    info = load_info("sbs_news_info.json")
+    ydl = FakeYDL({info["webpage_url"]: info})
+
+    fetched_at, record = FINAL.process_video_data({"url": info["webpage_url"]}, ydl)
+
+    assert fetched_at == "2025-06-03 18:00:00"
+    assert record is None
+
+
+def test_process_video_data_download_error(monkeypatch):
+    # 수집 실패는 기록하지 않아야 다음 실행에서 다시 시도
+    ydl = FakeYDL(error=FINAL.yt_dlp.utils.DownloadError("Video unavailable"))
+
+    assert FINAL.process_video_data({"url": "https://www.youtube.com//watch?v=gone"}, ydl) == (None, None)
+
+
+def test_registry_mark_keeps_fetch_time(tmp_path):
+    registry = FINAL.SeenVideoRegistry(str(tmp_path / "seen.json"))
+
+    registry.mark("Qx7v2LmN0aE", "2025-06-02 14:00:00")
+    registry.mark(None, "2025-06-02 14:00:00")
+
+    assert registry.videos == {"Qx7v2LmN0aE": "2025-06-02 14:00:00"}
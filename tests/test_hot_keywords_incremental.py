@@ -0,0 +1,65 @@
+# utils/hot_keywords.py 증분 읽기: 지난번에 읽은 커밋 크기부터 새 기사만 읽음, 아카이브가 교체되면 처음부터
+import json
+import os
+
+import pytest
+
+from hot_keywords import read_new_articles
+from record_io import append_records, meta_path, write_records
+
+
+def article(n):
+    return {"id": n, "topic": "경제", "cleaned_title": f"기사 {n}", "cleaned_description": "설명", "summary": "안 읽음"}
+
+
+def commit(path):
+    # utils/updated.py가 병합 뒤 남기는 메타처럼 지금 크기를 커밋
+    with open(meta_path(path), "w", encoding="utf-8") as f:
+        json.dump({"archive_size": os.path.getsize(path), "archive_inode": os.stat(path).st_ino}, f)
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz"])
+def test_reads_only_appended_articles(tmp_path, suffix):
+    path = str(tmp_path / f"SBS_crawling_with_summary{suffix}")
+    write_records(path, [article(1), article(2)])
+    commit(path)
+
+    first, position, resumed = read_new_articles(path, {})
+    assert [a["id"] for a in first] == [1, 2] and not resumed
+    assert "summary" not in first[0]
+
+    append_records(path, [article(3)])
+    commit(path)
+    append_records(path, [article(4)])  # 병합 중 (메타 저장 전) 꼬리
+
+    second, position, resumed = read_new_articles(path, position)
+    assert [a["id"] for a in second] == [3] and resumed
+
+    third, position, resumed = read_new_articles(path, position)
+    assert third == [] and resumed
+
+
+def test_does_not_parse_already_counted_lines(tmp_path):
+    path = str(tmp_path / "SBS_crawling_with_summary.jsonl")
+    write_records(path, [article(1)])
+    _, position, _ = read_new_articles(path, {})
+
+    # 이미 센 줄을 같은 길이의 깨진 내용으로 덮어써도 새 줄만 읽으므로 실패하지 않음
+    size = os.path.getsize(path)
+    with open(path, "r+b") as f:
+        f.write(b"{" * (size - 1))
+    append_records(path, [article(2)])
+
+    new_articles, _, resumed = read_new_articles(path, position)
+    assert [a["id"] for a in new_articles] == [2] and resumed
+
+
+def test_rewritten_archive_is_counted_from_zero(tmp_path):
+    path = str(tmp_path / "SBS_crawling_with_summary.jsonl")
+    write_records(path, [article(1), article(2), article(3)])
+    _, position, _ = read_new_articles(path, {})
+
+    write_records(path, [article(1), article(2)])  # 다른 파일로 교체 (더 작음)
+
+    new_articles, _, resumed = read_new_articles(path, position)
+    assert [a["id"] for a in new_articles] == [1, 2] and not resumed
@@ -0,0 +1,62 @@
+# main.py 페이지 캐시 키: 정리/검증한 파라미터만 키에 들어가는지
+# - k는 1~MAX_SIMILAR로 자른 값, page는 1~마지막 페이지, 모르는 method는 400, 모르는 sort는 기본 순서, 없는 highlight는 없는 것과 같음
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from article_store import ArticleStore
+from conftest import make_article
+from page_cache import PageCache
+from record_io import write_records
+
+
+def article(n, topic):
+    return make_article(n, id=n, topic=topic, probabilities={"경제": 0.1 * n, "정치": 1 - 0.1 * n})
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    write_records(str(tmp_path / "SBS_crawling_with_summary.jsonl"),
+                  [article(n, "경제" if n % 2 else "정치") for n in range(1, 6)])
+    write_records(str(tmp_path / "SBS_tsne.jsonl"),
+                  [{"id": n, "x": float(n), "y": 0.0, "topic": "경제"} for n in range(1, 6)])
+    monkeypatch.setattr(main, "store", ArticleStore(str(tmp_path), None))
+    monkeypatch.setattr(main, "page_cache", PageCache(1024 * 1024))
+    return TestClient(main.app)
+
+
+def cached_pages():
+    return len(main.page_cache._pages)
+
+
+def test_k_is_clamped_before_caching(client):
+    for k in (20, 21, 500):
+        assert client.get(f"/news/SBS/article/1?k={k}").status_code == 200
+
+    assert cached_pages() == 1 and main.page_cache.hits == 2
+
+
+@pytest.mark.parametrize("url", ["/news/SBS/article/1?method=xyz", "/news/SBS?window=7y", "/news/SBS?filter=없는주제",
+                                 "/api/news/SBS/article/1/similar?method=xyz"])
+def test_unknown_values_are_rejected_without_caching(client, url):
+    assert client.get(url).status_code == 400
+    assert cached_pages() == 0
+
+
+def test_unknown_sort_and_highlight_share_the_default_page(client):
+    for url in ("/news/SBS?sort=abc", "/news/SBS?sort=def", "/news/SBS?sort="):
+        assert client.get(url).status_code == 200
+    for url in ("/news/SBS/visualization", "/news/SBS/visualization?highlight=999", "/news/SBS/visualization?highlight=-1"):
+        assert client.get(url).status_code == 200
+
+    assert cached_pages() == 2
+
+
+def test_page_is_clamped_to_last_page(client):
+    for page in (1, 2, 3, 10 ** 9):
+        response = client.get(f"/news/SBS?page={page}")
+        assert response.status_code == 200 and "기사 5" in response.text
+    for page in (3, 4, 99):
+        assert client.get(f"/news/SBS?page={page}&limit=2").status_code == 200  # 5개 / 2 → 마지막은 3쪽
+
+    assert cached_pages() == 2
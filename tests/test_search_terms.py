@@ -0,0 +1,98 @@
+# 검색용 명사 파일 ({이름}.terms.jsonl)
+# - utils/updated.py 병합이 MeCab 명사를 아카이브 옆에 기록, 웹(ArticleStore)은 이 파일만 읽고 MeCab을 쓰지 않음
+# - MeCab이 없으면 병합은 그대로 커밋되고 명사 파일만 건너뜀 → 웹은 제목 단어/핵심어로 검색, 다음 병합에서 따라잡음
+# - 색인을 만들다 실패하면 검색만 꺼지고 다른 페이지는 그대로
+import sys
+
+import pytest
+
+import search_index
+import updated
+from article_store import ArticleStore
+from conftest import make_article
+
+
+class FakeTokenizer:
+    # 띄어쓰기 단위를 명사로 취급하는 TokenizerPool 대용 (이 환경에는 MeCab이 없음)
+    def __init__(self, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def nouns(self, texts):
+        for text in texts:
+            yield text.split()
+
+
+def article(n, title, summary=""):
+    # 검색 테스트용: 제목/요약만 다르고 핵심어는 기사마다 다름
+    return make_article(n, title=title, cleaned_title=title, summary=summary, keywords=[f"핵심어{n}"])
+
+
+def search_ids(store, query):
+    snapshot = store.get("SBS")
+    return [a["id"] for a in snapshot.search_page(query).items]
+
+
+def test_merge_writes_terms_and_web_reads_them(pipeline, monkeypatch):
+    monkeypatch.setattr(updated, "TokenizerPool", FakeTokenizer)
+    pipeline.merge([article(1, "국회 본회의", "예산안 통과"), article(2, "반도체 수출", "역대 최대")])
+
+    store = ArticleStore(str(pipeline.crawling), None)
+    assert search_ids(store, "예산안") == [1]  # 요약의 명사는 명사 파일에만 있음
+
+    pipeline.merge([article(3, "환율 급등", "예산안 재검토")])
+    assert search_ids(store, "예산안") == [1, 3]  # 이전 색인을 이어받아 새 기사만 추가
+    assert pipeline.meta()["terms_records"] == 3
+    assert "konlpy" not in sys.modules
+
+
+@pytest.mark.parametrize("query", ["반도체가", "수출이", "반도체수출", "반도체의 수출", "수출에서"])
+def test_query_with_particles_or_compounds_matches_nouns(pipeline, monkeypatch, query):
+    monkeypatch.setattr(updated, "TokenizerPool", FakeTokenizer)
+    pipeline.merge([article(1, "국회 본회의", "예산안 통과"), article(2, "반도체 수출", "역대 최대")])
+
+    assert search_ids(ArticleStore(str(pipeline.crawling), None), query) == [2]
+
+
+def test_query_terms_prefers_indexed_words():
+    vocabulary = {"반도체", "수출", "국가", "국가대표"}
+
+    assert search_index.query_terms("국가대표가 반도체수출", vocabulary) == ["국가대표", "반도체", "수출"]
+    assert search_index.query_terms("국가가", vocabulary) == ["국가"]     # "국가" 자체가 명사
+    assert search_index.query_terms("없는단어를", vocabulary) == ["없는단어를"]
+
+
+def test_merge_without_mecab_commits_and_catches_up_later(pipeline, monkeypatch):
+    pipeline.merge([article(1, "국회 본회의", "예산안 통과")])  # konlpy 없음 → 명사 파일 건너뜀
+
+    assert pipeline.meta()["records"] == 1 and pipeline.meta()["terms_records"] is None
+    store = ArticleStore(str(pipeline.crawling), None)
+    store.preload()
+    assert search_ids(store, "국회") == [1]   # 제목 단어로 대신 색인
+    assert search_ids(store, "예산안") == []
+
+    monkeypatch.setattr(updated, "TokenizerPool", FakeTokenizer)
+    pipeline.merge([article(2, "반도체 수출", "예산안 영향")])
+
+    assert pipeline.meta()["terms_records"] == 2
+    assert search_ids(store, "예산안") == [1, 2]  # 명사 파일을 다시 썼으므로 색인도 새로 만듦
+
+
+def test_broken_index_only_disables_search(pipeline, monkeypatch):
+    pipeline.merge([article(1, "국회 본회의")])
+
+    def broken(self, articles, terms_path=None):
+        raise RuntimeError("색인 실패")
+
+    monkeypatch.setattr(search_index.SearchIndex, "updated", broken)
+    store = ArticleStore(str(pipeline.crawling), None)
+    store.preload_search()
+
+    snapshot = store.get("SBS")
+    assert snapshot.search is None
+    assert snapshot.page("latest").total == 1
@@ -0,0 +1,76 @@
+# utils/summarize.py 동시 요약: 429 재시도, 입력 순서 유지, 체크포인트로 이어서 할 때 실패한 기사만 다시 요청
+# - 실제 API 대신 chat.completions.create만 흉내 내는 가짜 AsyncOpenAI 사용
+import asyncio
+import re
+
+import httpx
+import pytest
+from openai import RateLimitError
+
+import summarize
+
+
+class FakeCompletions:
+    # fail(title, 시도 횟수) 가 True면 429, 아니면 "요약 {제목}" 반환 (늦게 끝나는 요청을 섞어서 완료 순서를 뒤섞음)
+    def __init__(self, fail):
+        self.fail = fail
+        self.calls = []
+
+    async def create(self, messages, **kwargs):
+        title = re.search(r"제목: (.*)", messages[-1]["content"]).group(1)
+        self.calls.append(title)
+        number = int(title.split()[-1])
+        await asyncio.sleep(0.001 * (number % 3))
+        if self.fail(title, self.calls.count(title)):
+            request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+            raise RateLimitError("rate limited", response=httpx.Response(429, request=request), body=None)
+        message = type("Message", (), {"content": f" 요약 {title} "})
+        return type("Response", (), {"choices": [type("Choice", (), {"message": message})]})
+
+
+class FakeClient:
+    def __init__(self, fail=lambda title, attempt: False):
+        self.completions = FakeCompletions(fail)
+        self.chat = type("Chat", (), {"completions": self.completions})
+
+
+def articles(n):
+    return [{"title": f"기사 {i}", "description": f"본문 {i}", "keywords": ["반도체"]} for i in range(1, n + 1)]
+
+
+@pytest.fixture(autouse=True)
+def no_waiting(monkeypatch):
+    monkeypatch.setattr(summarize, "BACKOFF_BASE", 0)
+    monkeypatch.setattr(summarize, "REQUESTS_PER_SECOND", 1000)
+
+
+def test_rate_limited_requests_are_retried_in_order():
+    # 홀수 기사는 처음 두 번 429
+    client = FakeClient(lambda title, attempt: int(title.split()[-1]) % 2 == 1 and attempt <= 2)
+
+    summaries = asyncio.run(summarize.summarize_articles(client, articles(10), "테스트"))
+
+    assert summaries == [f"요약 기사 {i}" for i in range(1, 11)]
+    calls = client.completions.calls
+    assert all(calls.count(f"기사 {i}") == (3 if i % 2 else 1) for i in range(1, 11))
+
+
+def test_resume_requests_only_failed_articles(tmp_path, monkeypatch):
+    monkeypatch.setattr(summarize, "MAX_RETRIES", 1)
+    checkpoint_path = tmp_path / "SBS_summary_checkpoint.jsonl"
+
+    # 첫 실행: 3의 배수 기사는 계속 429 → 재시도 후 "요약 실패"
+    client = FakeClient(lambda title, attempt: int(title.split()[-1]) % 3 == 0)
+    with open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+        first = asyncio.run(summarize.summarize_articles(client, articles(10), "테스트", checkpoint=checkpoint))
+    assert [i for i, summary in enumerate(first, start=1) if summary == "요약 실패"] == [3, 6, 9]
+
+    # 다시 실행: 체크포인트에서 성공한 요약을 복원하고 실패한 기사만 요청
+    client = FakeClient()
+    done = summarize.load_checkpoint(str(checkpoint_path))
+    with open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+        second = asyncio.run(summarize.summarize_articles(client, articles(10), "테스트", done=done, checkpoint=checkpoint))
+
+    assert sorted(client.completions.calls) == ["기사 3", "기사 6", "기사 9"]
+    assert second == [f"요약 기사 {i}" for i in range(1, 11)]
+    assert len(summarize.load_checkpoint(str(checkpoint_path))) == 10
@@ -0,0 +1,81 @@
+# text_cleaning.py 제목/설명 전처리 골든 테스트
+# - fixtures/descriptions/*.txt: KBS(끝맺음 "KBS 뉴스 OOO입니다." / "KBS 기사 원문보기: http..." 링크), SBS, YTN 형식의 설명
+# - fixtures/descriptions/expected.json: 위 입력을 baseline(3d7bbd6) utils/FINAL.py의 clean_title / clean_text_full에 넣은 결과
+import json
+import os
+import random
+import re
+import time
+
+import pytest
+
+from conftest import FIXTURES
+from text_cleaning import clean_text_full, clean_text_full_many, clean_title, clean_title_many
+
+DESCRIPTIONS = os.path.join(FIXTURES, "descriptions")
+
+# baseline의 "완벽한 URL 단독 줄" 패턴 (선택지가 겹쳐서 URL 뒤에 다른 글자가 오면 역추적이 폭발함)
+OLD_URL_LINE = re.compile(
+    r'^\s*http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+\s*$', re.IGNORECASE)
+NEW_URL_LINE = re.compile(r'^\s*http[s]?://[a-zA-Z0-9$-_@.&+!*\\(\\),]+\s*$', re.IGNORECASE)
+
+
+def load_expected():
+    with open(os.path.join(DESCRIPTIONS, "expected.json"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+EXPECTED = load_expected()
+
+
+@pytest.mark.parametrize("title, cleaned", EXPECTED["titles"])
+def test_clean_title_matches_baseline(title, cleaned):
+    assert clean_title(title) == cleaned
+
+
+@pytest.mark.parametrize("name", sorted(EXPECTED["descriptions"]))
+def test_clean_text_full_matches_baseline(name):
+    with open(os.path.join(DESCRIPTIONS, name), "r", encoding="utf-8") as f:
+        text = f.read()
+
+    assert clean_text_full(text) == EXPECTED["descriptions"][name]
+
+
+def test_batch_api_matches_single_calls():
+    names = sorted(EXPECTED["descriptions"])
+    texts = []
+    for name in names:
+        with open(os.path.join(DESCRIPTIONS, name), "r", encoding="utf-8") as f:
+            texts.append(f.read())
+    titles = [title for title, _ in EXPECTED["titles"]]
+
+    assert clean_text_full_many(texts + [None]) == [EXPECTED["descriptions"][name] for name in names] + [""]
+    assert clean_title_many(titles) == [cleaned for _, cleaned in EXPECTED["titles"]]
+    assert clean_title_many([]) == [] and clean_text_full_many(iter([])) == []
+
+
+@pytest.mark.parametrize("value", [None, 123, ["제목"]])
+def test_non_string_input(value):
+    assert clean_title(value) == ""
+    assert clean_text_full(value) == ""
+
+
+def test_url_line_pattern_accepts_same_strings():
+    # 두 패턴이 같은 문자열을 받는지 무작위 줄로 비교 (baseline 패턴이 느려지지 않게 짧은 길이만)
+    rng = random.Random(18)
+    alphabet = "aZ09%$-_@.&+!*(),/\\:? 가#"
+    for _ in range(5000):
+        line = rng.choice(["http://", "https://", " https://", "htp://"]) + \
+            "".join(rng.choice(alphabet) for _ in range(rng.randrange(1, 9)))
+        assert bool(OLD_URL_LINE.search(line)) == bool(NEW_URL_LINE.search(line)), line
+
+
+def test_long_url_followed_by_text_is_fast():
+    # baseline은 이 줄 하나에 사실상 끝나지 않음 (영숫자 12자에 1~2초, 1자 늘 때마다 2배)
+    text = "해외 증시가 반등했습니다.\nhttps://www.ytn.co.kr/_ln/0104_202506021200ABCDEF1234567890 원문 보기"
+
+    started = time.perf_counter()
+    cleaned = clean_text_full(text)
+
+    assert time.perf_counter() - started < 1
+    assert cleaned.startswith("해외 증시가 반등했습니다 https www ytn co kr")
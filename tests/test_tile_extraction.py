@@ -0,0 +1,216 @@
+# utils/FINAL.py 1단계 (채널 동영상 탭 스크롤 → 후보 영상)
+# - fixtures/youtube/channel_videos.html: 동영상 탭 마크업(ytd-rich-item-renderer 타일)과 같은 구조로 줄인 페이지
+#   (숏츠/실시간/최초 공개/예정 영상/중복 타일/길이 범위 밖 영상/"1일 전" 종료 지점 포함)
+# - FakeChannelDriver: 스크롤할 때마다 타일을 CHUNK개씩 붙이고, 일부 타일은 몇 번의 스크롤 동안 렌더링이 덜 된 상태로 보여줌
+# - incremental 모드의 EXTRACT_NEW_TILES_JS는 node로 실제 스크립트를 실행 (DOM 대신 타일별 querySelector 결과를 미리 계산해서 전달)
+import copy
+import json
+import os
+import shutil
+import subprocess
+
+import pytest
+from bs4 import BeautifulSoup
+
+import FINAL
+from conftest import FIXTURES
+
+NODE = shutil.which("node")
+CHUNK = 8
+TILE_HEIGHT = 100
+
+# EXTRACT_NEW_TILES_JS가 쓰는 DOM API(querySelectorAll/querySelector/getAttribute/textContent)만 흉내
+NODE_SHIM = """
+const input = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+const element = (found) => found && {
+    getAttribute: (name) => (name in found.attrs ? found.attrs[name] : null),
+    textContent: found.text
+};
+const nodes = input.tiles.map((tile) => ({querySelector: (selector) => element(tile[selector])}));
+const document = {
+    querySelectorAll: (selector) => {
+        if (selector !== input.tile_selector) throw new Error('unexpected selector ' + selector);
+        return nodes;
+    }
+};
+const result = (function () {
+%s
+}).apply(null, input.args);
+process.stdout.write(JSON.stringify(result));
+"""
+
+# 스크롤 다음에 바로 보이는 영상 중 조건(60~300초, 상대시간, /watch 링크, 중복 아님)을 통과하는 타일 번호 ("1일 전" 33번에서 중단)
+EXPECTED_INDEXES = [0, 2, 4, 6, 7, 10, 13, 14, 16, 17, 19, 20, 22, 23, 24, 25, 26, 28, 29, 30, 31, 32]
+
+
+def load_channel_html():
+    with open(os.path.join(FIXTURES, "youtube", "channel_videos.html"), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def drop_part(tile, part):
+    # 렌더링이 덜 된 타일: 길이 배지 / 링크 href / 업로드 시간이 아직 없음
+    if part == "duration":
+        tile.select_one(FINAL.DURATION_SELECTOR).decompose()
+    elif part == "href":
+        del tile.select_one(FINAL.LINK_SELECTOR)["href"]
+    elif part == "upload_time":  # 메타데이터 줄(dom-repeat)이 아직 안 채워져 조회수/업로드 시간 span이 모두 없음
+        for span in tile.select("div#metadata-line span"):
+            span.decompose()
+
+
+def element_json(element):
+    if element is None:
+        return None
+    attrs = {name: " ".join(value) if isinstance(value, list) else value for name, value in element.attrs.items()}
+    return {"attrs": attrs, "text": element.get_text()}
+
+
+class FakeChannelDriver:
+    # late: {타일 번호: (덜 렌더링된 부분, 보이기 시작한 뒤 덜 렌더링된 상태로 남는 스크롤 수)}
+    def __init__(self, html, late=None):
+        soup = BeautifulSoup(html, "html.parser")
+        self.tiles = soup.select(FINAL.VIDEO_TILE_SELECTOR)
+        self.late = late or {}
+        self.shown = 0
+        self.step = 0
+        self.revealed_at = {}
+        self.page_source_reads = 0
+
+    def get(self, url):
+        self.url = url
+
+    def find_element(self, by, value):
+        return object()
+
+    def visible_tiles(self):
+        tiles = []
+        for index, tile in enumerate(self.tiles[:self.shown]):
+            if index in self.late:
+                part, scrolls = self.late[index]
+                if self.step < self.revealed_at[index] + scrolls:
+                    tile = copy.copy(tile)
+                    drop_part(tile, part)
+            tiles.append(tile)
+        return tiles
+
+    @property
+    def page_source(self):
+        self.page_source_reads += 1
+        body = "\n".join(str(tile) for tile in self.visible_tiles())
+        return f'<html><body><div id="contents">{body}</div></body></html>'
+
+    def execute_script(self, script, *args):
+        if script == "return document.documentElement.scrollHeight":
+            return self.shown * TILE_HEIGHT
+        if script.startswith("window.scrollTo"):
+            self.step += 1
+            for index in range(self.shown, min(self.shown + CHUNK, len(self.tiles))):
+                self.revealed_at[index] = self.step
+            self.shown = min(self.shown + CHUNK, len(self.tiles))
+            return None
+        if script == FINAL.EXTRACT_NEW_TILES_JS:
+            return self.run_extract_js(script, args)
+        raise AssertionError(f"unexpected script: {script[:40]}")
+
+    def run_extract_js(self, script, args):
+        selectors = args[3:6]
+        payload = {
+            "tile_selector": args[2],
+            "args": list(args),
+            "tiles": [{selector: element_json(tile.select_one(selector)) for selector in selectors}
+                      for tile in self.visible_tiles()],
+        }
+        result = subprocess.run([NODE, "-e", NODE_SHIM % script], input=json.dumps(payload),
+                                capture_output=True, text=True, encoding="utf-8", check=True)
+        return json.loads(result.stdout)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(FINAL.time, "sleep", lambda seconds: None)
+
+
+def crawl(monkeypatch, mode, late=None, registry=None):
+    monkeypatch.setattr(FINAL, "EXTRACTION_MODE", mode)
+    driver = FakeChannelDriver(load_channel_html(), late)
+    return FINAL.crawl_main_page_and_filter_videos(driver, "https://www.youtube.com/@sbsnews8/videos", registry), driver
+
+
+def expected_candidates():
+    tiles = FINAL.extract_tiles_from_soup(load_channel_html())
+    return [{"url": FINAL.BASE_YOUTUBE_URL + tiles[i]["href"], "upload_time_summary": tiles[i]["upload_time"]}
+            for i in EXPECTED_INDEXES]
+
+
+def test_soup_reads_fixture_tiles():
+    tiles = FINAL.extract_tiles_from_soup(load_channel_html())
+
+    assert len(tiles) == 36
+    assert tiles[0]["upload_time"] == "12분 전" and tiles[0]["duration"] == "2:05"
+    assert tiles[0]["href"].startswith("/watch?v=")
+    assert tiles[5]["duration"] is None               # 실시간 배지는 길이 배지 셀렉터에 안 걸림
+    assert tiles[9]["upload_time"] == "대기 중 12명"    # 예정 영상은 업로드 시간이 없어 조회수 자리만 남음
+    assert tiles[15]["href"] == tiles[6]["href"]      # 중복 타일
+    assert tiles[18]["href"].startswith("/shorts/")
+
+
+def test_soup_mode_candidates(monkeypatch):
+    candidates, driver = crawl(monkeypatch, "soup")
+
+    assert candidates == expected_candidates()
+    assert driver.page_source_reads == 5  # 8개씩 5번 스크롤한 뒤 "1일 전" 타일에서 중단
+
+
+@pytest.mark.skipif(NODE is None, reason="node 없음 (EXTRACT_NEW_TILES_JS 실행 불가)")
+@pytest.mark.parametrize("late", [
+    None,
+    {2: ("duration", 1), 10: ("href", 2), 13: ("upload_time", 1), 20: ("duration", 2)},
+])
+def test_incremental_matches_soup(monkeypatch, late):
+    soup_candidates, _ = crawl(monkeypatch, "soup", late)
+    incremental_candidates, driver = crawl(monkeypatch, "incremental", late)
+
+    # 늦게 렌더링된 타일은 뒤 스크롤에서 추가되므로 순서까지 같은지는 두 모드끼리만 비교
+    assert incremental_candidates == soup_candidates
+    assert sorted(soup_candidates, key=str) == sorted(expected_candidates(), key=str)
+    assert driver.page_source_reads == 0
+
+
+@pytest.mark.skipif(NODE is None, reason="node 없음 (EXTRACT_NEW_TILES_JS 실행 불가)")
+def test_incremental_gives_up_after_max_retries(monkeypatch):
+    # MAX_TILE_RETRIES(2)번 다시 읽어도 덜 렌더링된 타일은 incremental 모드에서만 빠짐 (soup 모드는 매번 전체를 다시 읽음)
+    late = {2: ("duration", FINAL.MAX_TILE_RETRIES + 1)}
+    soup_candidates, _ = crawl(monkeypatch, "soup", late)
+    incremental_candidates, _ = crawl(monkeypatch, "incremental", late)
+
+    missing = [c for c in soup_candidates if c not in incremental_candidates]
+    assert sorted(soup_candidates, key=str) == sorted(expected_candidates(), key=str)
+    assert missing == [expected_candidates()[EXPECTED_INDEXES.index(2)]]
+
+
+def registry_of(tmp_path, candidates):
+    registry = FINAL.SeenVideoRegistry(str(tmp_path / "seen.json"))
+    for candidate in candidates:
+        registry.mark(FINAL.video_id_from_url(candidate["url"]))
+    return registry
+
+
+@pytest.mark.parametrize("mode", ["soup", pytest.param("incremental", marks=pytest.mark.skipif(
+    NODE is None, reason="node 없음 (EXTRACT_NEW_TILES_JS 실행 불가)"))])
+def test_known_feed_stops_early(monkeypatch, tmp_path, mode):
+    # 지난 실행에서 후보 22개를 모두 수집한 뒤 다시 실행: 조건에서 걸러지는 타일(숏츠/실시간/길이 밖)은 연속 횟수를 끊지 않음
+    registry = registry_of(tmp_path, expected_candidates())
+    candidates, driver = crawl(monkeypatch, mode, registry=registry)
+
+    assert candidates == []
+    assert driver.step == 3  # 10번째 기수집 영상(17번 타일)이 있는 3번째 스크롤에서 중단 (전체는 5번)
+
+
+def test_new_videos_above_known_ones_are_collected(monkeypatch, tmp_path):
+    # 위쪽 새 영상 2개(0, 2번)만 후보, 그 아래는 기수집 영상 10개 연속이라 중단
+    registry = registry_of(tmp_path, expected_candidates()[2:])
+    candidates, driver = crawl(monkeypatch, "soup", registry=registry)
+
+    assert candidates == expected_candidates()[:2]
+    assert driver.step == 3
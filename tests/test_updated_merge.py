@@ -0,0 +1,87 @@
+# utils/updated.py 병합 (아카이브 제자리 추가 + 메타의 커밋 크기) / record_io 커밋 크기까지 읽기
+import json
+import os
+
+import pytest
+
+import updated
+from conftest import make_article
+from record_io import append_records, committed_size, read_records, write_records
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz"])
+def test_read_records_stops_at_limit(tmp_path, suffix):
+    path = str(tmp_path / f"records{suffix}")
+    write_records(path, [make_article(1), make_article(2)])
+    size = os.path.getsize(path)
+    append_records(path, [make_article(3)])
+
+    assert [r["title"] for r in read_records(path, size)] == ["기사 1", "기사 2"]
+    assert len(list(read_records(path))) == 3
+
+
+@pytest.mark.parametrize("suffix", [".jsonl", ".jsonl.gz"])
+def test_merge_appends_in_place(pipeline, suffix):
+    path = pipeline.archive(suffix)
+    write_records(path, [make_article(1, id=1), make_article(2, id=2)])
+    inode = os.stat(path).st_ino
+
+    pipeline.merge([make_article(2), make_article(3), make_article(4)])
+
+    assert os.stat(path).st_ino == inode
+    assert [(r["id"], r["title"]) for r in read_records(path)] == [(1, "기사 1"), (2, "기사 2"), (3, "기사 3"), (4, "기사 4")]
+    meta = pipeline.meta()
+    assert meta["last_id"] == 4 and meta["records"] == 4
+    assert meta["archive_size"] == os.path.getsize(path) == committed_size(path)
+
+
+def test_uncommitted_tail_is_hidden_then_truncated(pipeline):
+    path = pipeline.archive()
+    pipeline.merge([make_article(1), make_article(2)])
+    committed = os.path.getsize(path)
+
+    # 다음 병합이 추가 도중(메타 저장 전)에 죽은 상태: 반쪽 줄 + 색인 한 줄
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(make_article(3, id=3), ensure_ascii=False) + "\n" + '{"title": "기사')
+    with open(pipeline.crawling / "SBS_crawling_with_summary.links", "a", encoding="utf-8") as f:
+        f.write("https://www.youtube.com/watch?v=v3\n")
+
+    assert committed_size(path) == committed
+    assert [r["id"] for r in read_records(path, committed_size(path))] == [1, 2]
+
+    pipeline.merge([make_article(3), make_article(4)])
+
+    assert [(r["id"], r["title"]) for r in read_records(path)] == [(1, "기사 1"), (2, "기사 2"), (3, "기사 3"), (4, "기사 4")]
+    assert updated.load_links(str(pipeline.crawling / "SBS_crawling_with_summary.links")) == {
+        f"https://www.youtube.com/watch?v=v{n}" for n in range(1, 5)}
+
+
+def test_failed_append_is_rolled_back(pipeline):
+    path = pipeline.archive()
+    pipeline.merge([make_article(1)])
+    before = open(path, "rb").read()
+
+    with open(pipeline.process / "SBS_processing_summary.jsonl", "w", encoding="utf-8") as f:
+        f.write(json.dumps(make_article(2), ensure_ascii=False) + "\n{깨진 줄\n")
+    with pytest.raises(ValueError):
+        updated.merge("SBS")
+
+    assert open(path, "rb").read() == before
+    assert pipeline.meta()["archive_size"] == len(before)
+
+
+def test_rewritten_archive_is_rebuilt_not_truncated(pipeline):
+    path = pipeline.archive()
+    pipeline.merge([make_article(1)])
+
+    # 다른 도구가 아카이브를 더 길게 다시 씀 → 다른 파일로 교체됐고 기록된 크기가 줄 경계도 아니므로 잘라내지 않고 다시 만듦
+    write_records(path, [make_article(n, video_link=f"https://www.youtube.com/watch?v=longer{n}", id=n) for n in (1, 2)])
+    pipeline.merge([make_article(3)])
+
+    assert [r["id"] for r in read_records(path)] == [1, 2, 3]
+
+
+def test_merge_without_db_does_not_create_one(pipeline):
+    pipeline.merge([make_article(1)])
+
+    assert not os.path.exists(pipeline.db_path)
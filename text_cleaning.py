@@ -0,0 +1,157 @@
+# text_cleaning.py
+# 🧹 제목/설명 전처리 엔진
+# - 정규식은 import 시점에 한 번만 컴파일
+# - 줄 단위 잡음 패턴(저작권, 제보 안내, 기자 정보 등)은 하나의 alternation으로 합쳐 줄마다 1번만 검사
+# - KBS 두 분기(뉴스 끝맺음 / 기사 원문 링크)는 같은 파이프라인을 공유
+# - utils/FINAL.py의 기존 clean_title / clean_text_full 과 결과가 같아야 함
+# - 설명/제목 목록은 clean_text_full_many / clean_title_many로 한 번에 처리
+import re
+
+# ───────────────────────────────────────────────
+# 📌 제목 전처리
+_TITLE_STEPS = [
+    (re.compile(r"\s*/\s*(KBS|SBS|YTN).*"), ""),
+    (re.compile(r"\([^)]*\)"), ""),
+    (re.compile(r"\[[^\]]*\]"), ""),
+    (re.compile(r"\{[^}]*\}"), ""),
+    (re.compile(r"【[^】]*】"), ""),
+    (re.compile(r'([가-힣ㅏ-ㅣ])\1{1,}'), ""),
+    (re.compile(r'[ㅋㅎㅠㅜ]{2,}'), ""),
+    (re.compile(r'앗|헉|윽|흥|풉|에구|읏|으음|아악|끼야|푸하하|하하하|히히히|헤헤헤|흐흐흐|낄낄|깔깔|콜록콜록|훌쩍|쉿'), ""),
+    (re.compile(r"[^\w\s가-힣.%]"), " "),
+    (re.compile(r"[·•]{3,}|\.{3,}|…"), " "),
+    (re.compile(r"\s+"), " "),
+]
+
+# ───────────────────────────────────────────────
+# 📌 설명 전처리
+_YTN_INFO_MARKER = '※ \'당신의 제보가 뉴스가 됩니다\''
+_SBS_INFO_MARKER = '☞더 자세한 정보'
+_KBS_NEWS_END = re.compile(r'(KBS\s*뉴스\s*[가-힣]{2,5}니다\.?)')
+_KBS_ARTICLE_LINK = re.compile(r'(KBS\s*기사\s*원문보기\s*[:：]\s*http[s]?://\S+)')
+
+# KBS 본문: 끝맺음/원문 링크 앞부분만 남긴 뒤 적용
+_KBS_STEPS = [
+    (re.compile(r'\[[^\]]+:\s*["“][^"”]+["”]\s*\]'), ' '),
+    (re.compile(r'[가-힣]{2,5}\s*기자(?:의)?\s*(?:보도(?:입니다)?|보돕니다)\.?'), ' '),
+    (re.compile(r'\[\s*(?:리포트|앵커|취재|기자|특파원|논평|해설)\s*\]'), ' '),
+    (re.compile(r'\([^()]*\)'), ' '),
+    (re.compile(r'\{[^{}]*\}'), ' '),
+    (re.compile(r'\[[^\[\]]*\]'), ' '),
+    (re.compile(r"#[\w가-힣]+"), " "),
+    (re.compile(r'[^\w\s가-힣]'), ' '),
+    (re.compile(r'([가-힣ㅏ-ㅣ])\1{1,}'), ''),
+    (re.compile(r'[ㅋㅎㅠㅜ]{2,}'), ''),
+    (re.compile(r'\s+'), ' '),
+]
+
+_JUNK_LINE_PATTERNS = [
+    # 저작권 문구: 'Copyright', 'ⓒ', 'All rights reserved', '무단 전재', '재배포', 'AI학습' 등
+    r'^(?:Copyright\s*Ⓒ?\s*(?:KBS|SBS|YTN)\.?|ⓒ\s*(?:KBS|SBS|YTN))\s*\.?\s*All\s*rights\s*reserved\.?\s*(?:무단\s*전재(?:,)?\s*재배포\s*(?:및\s*(?:이용|AI학습\s*포함|AI학습\s*이용))?)?\s*(?:금지)?\s*$',
+    # 제보/연락처/소셜 미디어 정보 (전화번호, 이메일, 카톡, 홈페이지 등)
+    r'^\s*(?:홈페이지|애플리케이션|앱|카카오톡|페이스북|인스타그램|X|이메일|메일|문자|전화)[:：\s]*(?:[\'"]?(?:KBS|SBS|YTN)?\s*뉴스[\'"]?)?(?:.*(?:제보|친구\s*맺고\s*채팅|메시지\s*전송|@(?:sbs|kbs|ytn)\.co\.kr|누르고\s*\d+|.*-\d{3,4}-\d{4}|앱\s*설치|채널\s*추가|구독).*)?$',
+    # 기자/제작진 정보: (영상취재:이상욱), 촬영기자:xxx/영상편집:yyy, 영상편집 : xxx 디자인 : zzz, 촬영 : xxx
+    r'^\s*(?:영상취재|촬영기자|촬영|영상편집|편집|그래픽|디자인|화면제공|기자|앵커|특파원|기상캐스터|진행|리포터|논설위원|구성|제작|CG|자막뉴스)\s*[:：\|]?\s*(?:[^/\n]+(?:[/·]\s*[^/\n]+)*)?(?:\s*[:：]\s*.*)?$',
+    # 기자 이름+이메일/소속: YTN 유투권 (r2kwon@ytn.co.kr)
+    r'^\s*[A-Z]{2,4}\s*[가-힣]{2,4}\s*\([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\)\s*$',
+    # 짧은 기자 이름만 있는 경우 (일반 텍스트와 겹칠 수 있으므로 주의)
+    r'^\s*[가-힣]{2,4}\s*[기자앵커|특파원|기상캐스터]\s*$',
+    # 홍보/안내 문구 시작: ☞, ▶, ♨, ▣, ※ 등의 특수문자 시작
+    r'^(?:☞|▶|♨|#|▣|※)\s*(?:더\s*자세한\s*정보|트럼프\s*2기|기사\s*모아보기|지금\s*뜨거운\s*이슈|기사\s*원문|제보\s*하기|YTN\s*검색해\s*채널\s*추가|KBS제보\s*검색|당신의\s*제보가\s*뉴스가\s*됩니다|SBS뉴스\s*채널\s*구독|SBS뉴스\s*라이브|함께\s*토론하기|스프\s*구독|뉴스\s*채널\s*구독|채널\s*추가|클릭|보기|누르세요)?(?:.*(?:http[s]?://|n\.sbs\.co\.kr|news\.kbs\.co\.kr|ytn\.co\.kr|goo\.gl|premium\.sbs\.co\.kr|pf\.kakao\.com|www\.facebook\.com|www\.twitter\.com|www\.instagram\.com|ncd=\d+).*)?$',
+    # 일반적인 URL 단독 줄 (http/https 없는 경우도 포함)
+    r'^\s*\b(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}(?:/[^\s]*)?\s*$',
+    # 완벽한 URL 단독 줄
+    # 원래 (?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+ 였으나
+    # 선택지가 서로 겹쳐서([$-_]에 숫자/대문자/% 포함) 긴 URL 뒤에 다른 글자가 오면 역추적이 폭발함
+    # → 같은 문자열만 매칭하는 문자 클래스 하나로 합침
+    r'^\s*http[s]?://[a-zA-Z0-9$-_@.&+!*\\(\\),]+\s*$',
+    # 해시태그 단독 줄 (쉼표로 구분된 여러 해시태그 포함)
+    r'^\s*(?:#[\w가-힣\s]+(?:,\s*#[\w가-힣\s]+)*)\s*$',
+]
+_JUNK_LINE = re.compile("|".join(f"(?:{p})" for p in _JUNK_LINE_PATTERNS), re.IGNORECASE)
+
+# 줄 결합 후 후처리 단계에서 잔여 패턴 제거
+_POST_STEPS = [
+    # YTN 기자/앵커의 끝맺음 문구 제거 강화
+    (re.compile(r'^(?:대담\s*발췌\s*:\s*이선\s*디지털뉴스팀\s*에디터|\s*지금까지\s*(?:[가-힣]{2,5}부에서\s*)?YTN\s*[가-힣]{2,5}입니다\.?)\s*', re.MULTILINE), ' '),
+    (re.compile(r'YTN\s*[가-힣]{2,5}\s*입니다\.?'), ' '),  # "YTN 기자이름입니다."
+    (re.compile(r'\<앵커\>|\<기자\>'), ' '),  # <앵커>, <기자> 제거
+    # 인터뷰 인용 구조 제거 ([인물명 직책 : "내용"])
+    (re.compile(r'\[[^\]]+:\s*["“][^"”]+["”]\s*\]'), ' '),
+    # 직업명 및 보도 관련 문구 제거 (황다예 기자의 보돕니다, [리포트] 등)
+    (re.compile(r'[가-힣]{2,5}\s*기자(?:의)?\s*(?:보도(?:입니다)?|보돕니다)\.?'), ' '),
+    (re.compile(r'\[\s*(?:리포트|앵커|취재|기자|특파원|논평|해설)\s*\]'), ' '),
+    (re.compile(
+        r'(?:KBS|SBS|YTN)\s*(?:오톡|뉴스)?\s*(?:KBS제보|SBS뉴스|YTN 검색해)?\s*(?:검색)?\s*(?:전화)?\s*\d{2,4}[-\s]?\d{3,4}[-\s]?\d{4}\s*(?:홈페이지)?\s*https?://\S+\s*(?:이메일)?\s*[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[A-Z|a-z]{2,}\s*(?:Copyright\s*Ⓒ?\s*(?:KBS|SBS|YTN)\. All rights reserved\. 무단 전재, 재배포 및 이용\(AI 학습 포함\) 금지)?',
+        re.IGNORECASE), ' '),
+    # 기자/앵커의 끝맺음 문구
+    (re.compile(r'([가-힣]{2,7}(?:특파원|기자|앵커|리포터)?입니다\.?)'), ' '),
+    # 이름: 발언 형식
+    (re.compile(r'[가-힣A-Z\s]{2,15}\s*[:：]\s*[가-힣\s]{2,200}'), ' '),
+    # 괄호 안 내용 제거
+    (re.compile(r'\([^()]*\)'), ' '),
+    (re.compile(r'\{[^{}]*\}'), ' '),
+    (re.compile(r'\[[^\[\]]*\]'), ' '),
+    # 해시태그 제거
+    (re.compile(r"#[\w가-힣]+"), " "),
+    # 숫자 및 단위 제거 (한글 단위 포함)
+    (re.compile(r'\b\d{1,3}(?:,\d{3})*(?:\.\d+)?[가-힣a-zA-Z%℃]+\b'), ' '),
+    (re.compile(r'\b\d{1,3}(?:,\d{3})*(?:\.\d+)?\b'), ' '),
+    (re.compile(r'#\s*\d+'), ' '),
+    # 따옴표 및 불필요한 기호 제거
+    (re.compile(r'["“”‘’\'`]'), ' '),
+    (re.compile(r'([가-힣ㅏ-ㅣ])\1{1,}'), ''),
+    (re.compile(r'[ㅋㅎㅠㅜ]{2,}'), ''),
+    (re.compile(r"[^\w\s가-힣]"), " "),
+    # 다중 공백을 단일 공백으로 변환
+    (re.compile(r'\s+'), ' '),
+]
+
+
+def _apply(steps, text):
+    for pattern, repl in steps:
+        text = pattern.sub(repl, text)
+    return text
+
+
+def clean_title(title):  # title 전처리용
+    if not isinstance(title, str):
+        return ""
+    return _apply(_TITLE_STEPS, title).strip()
+
+
+def clean_text_full(text):  # description 전처리용
+    if not isinstance(text, str):
+        return ""
+    idx_ytn_info = text.find(_YTN_INFO_MARKER)
+    if idx_ytn_info != -1:
+        text = text[:idx_ytn_info]
+
+    idx_sbs_info = text.find(_SBS_INFO_MARKER)
+    if idx_sbs_info != -1:
+        text = text[:idx_sbs_info]
+
+    # KBS: 끝맺음 문구 또는 기사 원문 링크 앞까지만 사용
+    match_kbs = _KBS_NEWS_END.search(text) or _KBS_ARTICLE_LINK.search(text)
+    if match_kbs:
+        return _apply(_KBS_STEPS, text[:match_kbs.start()]).strip()
+
+    cleaned_lines = []
+    for line in text.splitlines():
+        stripped_line = line.strip()
+        if _JUNK_LINE.search(stripped_line):
+            continue
+        cleaned_lines.append(stripped_line)
+    text = ' '.join(cleaned_lines)
+
+    return _apply(_POST_STEPS, text).strip()
+
+
+
+# 📦 여러 건을 한 번에 처리 (설명 목록 등, 입력 순서 그대로)
+def clean_title_many(titles):
+    return [clean_title(title) for title in titles]
+
+
+def clean_text_full_many(texts):
+    return [clean_text_full(text) for text in texts]
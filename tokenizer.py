@@ -0,0 +1,103 @@
+# tokenizer.py
+# 🔠 MeCab 형태소 분석 병렬 처리
+# - 문서를 프로세스 풀에 나눠 보내고, 워커마다 자기 Mecab 인스턴스를 하나씩 생성
+# - imap(chunksize)으로 입력 순서를 유지한 채 결과를 청크 단위로 흘려보냄
+# - cache_path를 주면 텍스트 해시 기준으로 분석 결과를 디스크에 캐시해서 새/변경된 텍스트만 분석
+# - 사용하는 스크립트는 반드시 if __name__ == "__main__": 아래에서 실행 (macOS spawn 대비)
+from multiprocessing import Pool, cpu_count
+
+from disk_cache import DiskCache
+
+_mecab = None
+
+
+def _get_mecab():
+    global _mecab
+    if _mecab is None:
+        from konlpy.tag import Mecab
+        _mecab = Mecab()
+    return _mecab
+
+
+def _nouns(text):
+    return _get_mecab().nouns(text)
+
+
+def _pos(text):
+    return _get_mecab().pos(text)
+
+
+class TokenizerPool:
+    def __init__(self, processes=None, chunksize=64, cache_path=None, cache_size=500_000):
+        self.processes = processes or cpu_count()
+        self.chunksize = chunksize
+        self.cache = DiskCache(cache_path, max_entries=cache_size) if cache_path else None
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+        if self.cache is not None:
+            stats = self.cache.stats()
+            print(f"💾 형태소 캐시: 적중 {stats['hits']}건, 미적중 {stats['misses']}건")
+            self.cache.close()
+            self.cache = None
+
+    def _run(self, func, texts):
+        # 프로세스 1개면 풀 없이 현재 프로세스에서 처리
+        if self.processes <= 1:
+            for text in texts:
+                yield func(text)
+            return
+        if self._pool is None:
+            self._pool = Pool(processes=self.processes, initializer=_get_mecab)
+        yield from self._pool.imap(func, texts, chunksize=self.chunksize)
+
+    def _map(self, op, func, texts):
+        if self.cache is None:
+            yield from self._run(func, texts)
+            return
+
+        # 일정 크기씩 모아서 캐시 조회 → 없는 것만 분석 → 원래 순서대로 반환
+        batch_size = self.chunksize * max(self.processes, 1) * 4
+        batch = []
+        for text in texts:
+            batch.append(text)
+            if len(batch) >= batch_size:
+                yield from self._cached_batch(op, func, batch)
+                batch = []
+        if batch:
+            yield from self._cached_batch(op, func, batch)
+
+    def _cached_batch(self, op, func, texts):
+        keys = [DiskCache.make_key(op, text) for text in texts]
+        found = self.cache.get_many(keys)
+
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in found:
+                missing.setdefault(key, text)
+        if missing:
+            results = list(self._run(func, list(missing.values())))
+            new_items = list(zip(missing.keys(), results))
+            self.cache.set_many(new_items)
+            found.update(new_items)
+
+        for key in keys:
+            yield found[key]
+
+    def nouns(self, texts):
+        return self._map("nouns", _nouns, texts)
+
+    def pos(self, texts):
+        # JSON 캐시를 거치면 튜플이 리스트가 되므로 (단어, 품사) 튜플로 맞춰서 반환
+        for tagged in self._map("pos", _pos, texts):
+            yield [tuple(pair) for pair in tagged]
@@ -0,0 +1,73 @@
+# trending.py
+# 🔥 시간대별 트렌드 키워드
+# - 기사별 keywords(MeCab 명사 상위 5개)를 upload_date_kst 기준 1시간 단위 버킷에 누적
+# - 최근 N시간 창(window)의 버킷만 합산하고, half_life를 주면 오래된 버킷일수록 지수적으로 감쇠
+# - 상위 k개는 전체 정렬 대신 힙(heapq.nlargest)으로 추림
+# - 기준 시각은 데이터의 가장 최신 버킷 (크롤링이 하루 단위라 실제 현재 시각을 쓰면 창이 비기 쉬움)
+import heapq
+import math
+from collections import Counter, defaultdict
+from datetime import datetime
+
+WINDOWS = {"1h": 1, "6h": 6, "24h": 24}
+
+STOPWORDS = set([
+    "것", "있다", "없다", "입니다", "대한", "한다", "하며", "수", "합니다", "겁니다", "되다",
+    "기자", "영상", "뉴스", "보도", "앵커", "말하다", "통해", "위해", "에서", "으로", "이다", "하는",
+    "같다", "그리고", "하지만", "그러나"
+])
+
+
+def valid_half_life(half_life_hours):
+    return half_life_hours > 0 and math.isfinite(half_life_hours)
+
+
+def _hour_of(date_str):
+    try:
+        dt = datetime.fromisoformat(date_str)
+    except (TypeError, ValueError):
+        return None
+    return dt.toordinal() * 24 + dt.hour
+
+
+class TrendingKeywords:
+    def __init__(self, articles):
+        # {토픽: {시간 버킷: Counter}}
+        self.buckets = defaultdict(dict)
+        self.latest_hour = None
+
+        for article in articles:
+            hour = _hour_of(article.get("upload_date_kst"))
+            if hour is None:
+                continue
+            words = [w for w in article.get("keywords") or [] if w not in STOPWORDS]
+            if not words:
+                continue
+            topic = article.get("topic") or "기타"
+            self.buckets[topic].setdefault(hour, Counter()).update(words)
+            if self.latest_hour is None or hour > self.latest_hour:
+                self.latest_hour = hour
+
+        self.topics = list(self.buckets)
+
+    def top(self, topic, window_hours=24, k=10, half_life_hours=None):
+        # half_life는 None(감쇠 없음) 또는 양수만 (0이나 음수면 오래된 버킷이 더 무거워지거나 감쇠가 꺼짐)
+        if half_life_hours is not None and not valid_half_life(half_life_hours):
+            raise ValueError(f"half_life_hours는 양수여야 함: {half_life_hours}")
+        if self.latest_hour is None or topic not in self.buckets:
+            return []
+
+        topic_buckets = self.buckets[topic]
+        scores = defaultdict(float)
+        for age in range(window_hours):
+            counts = topic_buckets.get(self.latest_hour - age)
+            if not counts:
+                continue
+            weight = 0.5 ** (age / half_life_hours) if half_life_hours is not None else 1.0
+            for word, count in counts.items():
+                scores[word] += count * weight
+
+        return [word for word, _ in heapq.nlargest(k, scores.items(), key=lambda x: x[1])]
+
+    def top_by_topic(self, window_hours=24, k=10, half_life_hours=None):
+        return {topic: self.top(topic, window_hours, k, half_life_hours) for topic in self.topics}
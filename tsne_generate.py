@@ -1,13 +1,15 @@
 import os
-import json
 import joblib
 import numpy as np
 from sklearn.manifold import TSNE
 from news_classifier import NewsClassifier
+from article_db import ArticleDB
+from record_io import committed_size, read_records, record_path, resolve_records, source_signature, write_records
 
 # 📁 경로 설정
 BASE_DIR = "/Users/sseung/Documents/study/python_class/project_root"
 MODEL_PATH = os.path.join(BASE_DIR, "model/news_classifier_allinone.pkl")
+DB_PATH = os.path.join(BASE_DIR, "data/use/articles.sqlite")  # 웹 서버용 SQLite 저장소 (있으면 좌표도 교체)
 
 # 📰 대상 언론사
 companies = ["kbs", "sbs", "ytn"]
@@ -27,23 +29,28 @@ model: NewsClassifier = joblib.load(MODEL_PATH)
 
 # 🔁 각 언론사별 처리
 for company in companies:
-    input_path = os.path.join(BASE_DIR, f"data/use/crawling/{company}_crawling_with_summary.json")
-    output_path = os.path.join(BASE_DIR, f"data/use/crawling/{company.upper()}_tsne.json")
-
-    # ✅ 데이터 로딩
-    with open(input_path, "r", encoding="utf-8") as f:
-        articles = json.load(f)
+    # 아카이브는 utils/updated.py가 대문자 방송사 이름으로 만듦 (웹의 DB/파일 서명 비교도 같은 파일 이름 기준)
+    input_path = resolve_records(os.path.join(BASE_DIR, f"data/use/crawling/{company.upper()}_crawling_with_summary"))
+    output_path = record_path(os.path.join(BASE_DIR, f"data/use/crawling/{company.upper()}_tsne"))
+    if input_path is None:
+        print(f"⚠️ {company.upper()} 기사 파일 없음. 건너뜀.")
+        continue
 
-    # ✅ 확률 벡터 기반 X 생성
+    # ✅ 확률 벡터 기반 X 생성 (기사는 한 줄씩 읽고, 출력에 필요한 필드만 보관)
     X = []
     filtered_articles = []
 
-    for article in articles:
+    for article in read_records(input_path, committed_size(input_path)):  # 병합 중인 꼬리는 제외
         probs = article.get("probabilities", {})
         if not probs:
             continue
         X.append(list(probs.values()))
-        filtered_articles.append(article)
+        filtered_articles.append({
+            "id": article.get("id", len(filtered_articles)),
+            "title": article.get("title", "")[:50],
+            "topic": article.get("topic", "기타"),
+            "max_prob": max(probs.values()),
+        })
 
     if not X:
         print(f"⚠️ {company.upper()} 확률 데이터 없음. 건너뜀.")
@@ -62,23 +69,28 @@ for company in companies:
     )
     X_embedded = tsne.fit_transform(X)
 
-    # ✅ 결과 변환
-    output = []
-    for i, article in enumerate(filtered_articles):
-        topic = article.get("topic", "기타")
-        max_prob = max(article.get("probabilities", {}).values())
-        output.append({
-            "id": article.get("id", i),
-            "title": article.get("title", "")[:50],
-            "topic": topic,
-            "max_prob": float(max_prob),
+    # ✅ 결과 변환 + 저장 (한 줄씩 씀)
+    output = (
+        {
+            "id": article["id"],
+            "title": article["title"],
+            "topic": article["topic"],
+            "max_prob": float(article["max_prob"]),
             "x": float(X_embedded[i, 0]),
             "y": float(X_embedded[i, 1]),
-            "topic_color": TOPIC_COLOR.get(topic, "#6b7280")
-        })
-
-    # ✅ 저장
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+            "topic_color": TOPIC_COLOR.get(article["topic"], "#6b7280")
+        }
+        for i, article in enumerate(filtered_articles)
+    )
+    previous_source = source_signature(input_path, resolve_records(output_path))
+    tsne_points = list(output)
+    write_records(output_path, tsne_points)
 
     print(f"✅ {company.upper()} t-SNE 저장 완료 → {output_path}")
+
+    # 🗄️ DB에 가져온 방송사면 좌표도 교체 (DB가 이미 파일보다 오래됐으면 건너뜀 → 웹은 파일 사용)
+    if os.path.exists(DB_PATH):
+        db = ArticleDB(DB_PATH)
+        if db.replace_tsne(company.upper(), tsne_points, previous_source, source_signature(input_path, output_path)) is None:
+            print(f"ℹ️ {company.upper()}: DB에 없거나 DB가 파일보다 오래됨 → 웹은 파일 사용 (python article_db.py {company.upper()})")
+        db.close()
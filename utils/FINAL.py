@@ -1,6 +1,10 @@
 import time
 import json
 import re
+import threading
+import queue
+import os
+import sys
 from datetime import datetime, timedelta
 import pytz
 
@@ -15,26 +19,23 @@ from webdriver_manager.chrome import ChromeDriverManager
 
 from bs4 import BeautifulSoup
 import yt_dlp
-from multiprocessing import Pool, cpu_count 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# 프로젝트 루트의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from text_cleaning import clean_title, clean_text_full # 제목/설명 전처리 (정규식 미리 컴파일)
+from record_io import write_records, strip_suffix # 결과는 한 줄에 영상 하나인 JSONL로 저장
 
 from langdetect import detect, DetectorFactory # 언어감지 알고리즘
 DetectorFactory.seed = 0 # 난수 생성기의 시드값을 0으로 고정, langdetext 라이브러리가 언어를 감지 시에 일관되고 예측 가능한 결과 반환하도록 보장
 
 BASE_YOUTUBE_URL = "https://www.youtube.com/"
 CHANNEL_INFO = {
-    "1": {"handle": "@ytnnews24", "filename": "YTN_VIDEO_DATA.json"},
-    "2": {"handle": "@newskbs", "filename": "KBS_VIDEO_DATA.json"},
-    "3": {"handle": "@sbsnews8", "filename": "SBS_VIDEO_DATA.json"}
+    "1": {"handle": "@ytnnews24", "filename": "YTN_VIDEO_DATA.jsonl"},
+    "2": {"handle": "@newskbs", "filename": "KBS_VIDEO_DATA.jsonl"},
+    "3": {"handle": "@sbsnews8", "filename": "SBS_VIDEO_DATA.jsonl"}
 }
-SELECTED_CHANNEL_CODE = "2" # 변경 시 방송사 유튜브 채널 URL 변경
-if SELECTED_CHANNEL_CODE in CHANNEL_INFO:
-    YOUTUBE_MAIN_URL = f"{BASE_YOUTUBE_URL}{CHANNEL_INFO[SELECTED_CHANNEL_CODE]['handle']}/videos"
-    OUTPUT_FILENAME = CHANNEL_INFO[SELECTED_CHANNEL_CODE]['filename']
-    print(f"선택된 채널: {CHANNEL_INFO[SELECTED_CHANNEL_CODE]['handle']}, 크롤링 URL: {YOUTUBE_MAIN_URL}, 저장 파일명: {OUTPUT_FILENAME}")
-else:
-    print(f"오류: 유효하지 않은 채널 코드 '{SELECTED_CHANNEL_CODE}' 입니다. 기본값으로 설정하거나 프로그램을 종료합니다.")
-    YOUTUBE_MAIN_URL = f"{BASE_YOUTUBE_URL}{CHANNEL_INFO['1']['handle']}/videos"
-    OUTPUT_FILENAME = CHANNEL_INFO['1']['filename']
+SELECTED_CHANNEL_CODES = list(CHANNEL_INFO) # 한 번 실행에 크롤링할 채널 코드 (기본: 전체)
 
 MIN_VIDEO_LENGTH_SECONDS = 60
 MAX_VIDEO_LENGTH_SECONDS = 300
@@ -42,147 +43,125 @@ MAX_VIDEO_AGE_HOURS = 24
 SCROLL_PAUSE_TIME = 2
 MAX_SCROLLS = 500
 KST = pytz.timezone('Asia/Seoul')
-filtered_video_urls_1st_stage = []
-final_video_data = []
-
-def clean_title(title): # title 전처리용
-    if not isinstance(title, str):
-        return ""
-
-    title = re.sub(r"\s*/\s*(KBS|SBS|YTN).*", "", title) 
-    title = re.sub(r"\([^)]*\)", "", title) 
-    title = re.sub(r"\[[^\]]*\]", "", title) 
-    title = re.sub(r"\{[^}]*\}", "", title) 
-    title = re.sub(r"【[^】]*】", "", title) 
-    title = re.sub(r'([가-힣ㅏ-ㅣ])\1{1,}', '', title) 
-    title = re.sub(r'[ㅋㅎㅠㅜ]{2,}', '', title) 
-    title = re.sub(r'앗|헉|윽|흥|풉|에구|읏|으음|아악|끼야|푸하하|하하하|히히히|헤헤헤|흐흐흐|낄낄|깔깔|콜록콜록|훌쩍|쉿', '', title) 
-    title = re.sub(r"[^\w\s가-힣.%]", " ", title) 
-    title = re.sub(r"[·•]{3,}|\.{3,}|…", " ", title) 
-    title = re.sub(r"\s+", " ", title) 
-
-    return title.strip()
-
-
-def clean_text_full(text): # description 전처리용
-    if not isinstance(text, str):
-        return ""
-    idx_ytn_info = text.find('※ \'당신의 제보가 뉴스가 됩니다\'')
-    if idx_ytn_info != -1:
-        text = text[:idx_ytn_info]
-    
-    idx_sbs_info = text.find('☞더 자세한 정보')
-    if idx_sbs_info != -1:
-        text = text[:idx_sbs_info]
-
-    match_news_end = re.search(r'(KBS\s*뉴스\s*[가-힣]{2,5}니다\.?)', text)
-    if match_news_end:
-        text = text[:match_news_end.start()] 
-        text = re.sub(r'\[[^\]]+:\s*["“][^"”]+["”]\s*\]', ' ', text) 
-        text = re.sub(r'[가-힣]{2,5}\s*기자(?:의)?\s*(?:보도(?:입니다)?|보돕니다)\.?', ' ', text) 
-        text = re.sub(r'\[\s*(?:리포트|앵커|취재|기자|특파원|논평|해설)\s*\]', ' ', text)
-        text = re.sub(r'\([^()]*\)', ' ', text) 
-        text = re.sub(r'\{[^{}]*\}', ' ', text) 
-        text = re.sub(r'\[[^\[\]]*\]', ' ', text) 
-        text = re.sub(r"#[\w가-힣]+", " ", text) 
-        text = re.sub(r'[^\w\s가-힣]', ' ', text) 
-        text = re.sub(r'([가-힣ㅏ-ㅣ])\1{1,}', '', text) 
-        text = re.sub(r'[ㅋㅎㅠㅜ]{2,}', '', text) 
-        text = re.sub(r'\s+', ' ', text).strip() 
-        
-        return text.strip() 
-
-    match_kbs_link = re.search(r'(KBS\s*기사\s*원문보기\s*[:：]\s*http[s]?://\S+)', text)
-    if match_kbs_link:
-        text = text[:match_kbs_link.start()] 
-        text = re.sub(r'\[[^\]]+:\s*["“][^"”]+["”]\s*\]', ' ', text) 
-        text = re.sub(r'[가-힣]{2,5}\s*기자(?:의)?\s*(?:보도(?:입니다)?|보돕니다)\.?', ' ', text) 
-        text = re.sub(r'\[\s*(?:리포트|앵커|취재|기자|특파원|논평|해설)\s*\]', ' ', text)
-        text = re.sub(r'\([^()]*\)', ' ', text) 
-        text = re.sub(r'\{[^{}]*\}', ' ', text) 
-        text = re.sub(r'\[[^\[\]]*\]', ' ', text) 
-        text = re.sub(r"#[\w가-힣]+", " ", text) 
-        text = re.sub(r'[^\w\s가-힣]', ' ', text) 
-        text = re.sub(r'([가-힣ㅏ-ㅣ])\1{1,}', '', text) 
-        text = re.sub(r'[ㅋㅎㅠㅜ]{2,}', '', text) 
-        text = re.sub(r'\s+', ' ', text).strip() 
-        
-        return text.strip() 
-
-    lines = text.splitlines()
-
-    cleaned_lines = []
-    common_junk_patterns = [
-        # 저작권 문구: 'Copyright', 'ⓒ', 'All rights reserved', '무단 전재', '재배포', 'AI학습' 등
-        r'^(?:Copyright\s*Ⓒ?\s*(?:KBS|SBS|YTN)\.?|ⓒ\s*(?:KBS|SBS|YTN))\s*\.?\s*All\s*rights\s*reserved\.?\s*(?:무단\s*전재(?:,)?\s*재배포\s*(?:및\s*(?:이용|AI학습\s*포함|AI학습\s*이용))?)?\s*(?:금지)?\s*$',
-        # 제보/연락처/소셜 미디어 정보 (전화번호, 이메일, 카톡, 홈페이지 등)
-        r'^\s*(?:홈페이지|애플리케이션|앱|카카오톡|페이스북|인스타그램|X|이메일|메일|문자|전화)[:：\s]*(?:[\'"]?(?:KBS|SBS|YTN)?\s*뉴스[\'"]?)?(?:.*(?:제보|친구\s*맺고\s*채팅|메시지\s*전송|@(?:sbs|kbs|ytn)\.co\.kr|누르고\s*\d+|.*-\d{3,4}-\d{4}|앱\s*설치|채널\s*추가|구독).*)?$',
-        # 기자/제작진 정보: (영상취재:이상욱), 촬영기자:xxx/영상편집:yyy, 영상편집 : xxx 디자인 : zzz, 촬영 : xxx
-        r'^\s*(?:영상취재|촬영기자|촬영|영상편집|편집|그래픽|디자인|화면제공|기자|앵커|특파원|기상캐스터|진행|리포터|논설위원|구성|제작|CG|자막뉴스)\s*[:：\|]?\s*(?:[^/\n]+(?:[/·]\s*[^/\n]+)*)?(?:\s*[:：]\s*.*)?$', # '|' 추가 및 뒤에 올 수 있는 이름 처리 강화
-        # 기자 이름+이메일/소속: YTN 유투권 (r2kwon@ytn.co.kr)
-        r'^\s*[A-Z]{2,4}\s*[가-힣]{2,4}\s*\([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\)\s*$',
-        # 짧은 기자 이름만 있는 경우 (일반 텍스트와 겹칠 수 있으므로 주의)
-        r'^\s*[가-힣]{2,4}\s*[기자앵커|특파원|기상캐스터]\s*$', # "이름 기자" 패턴 (단독 줄)
-        # 홍보/안내 문구 시작: ☞, ▶, ♨, ▣, ※ 등의 특수문자 시작
-        r'^(?:☞|▶|♨|#|▣|※)\s*(?:더\s*자세한\s*정보|트럼프\s*2기|기사\s*모아보기|지금\s*뜨거운\s*이슈|기사\s*원문|제보\s*하기|YTN\s*검색해\s*채널\s*추가|KBS제보\s*검색|당신의\s*제보가\s*뉴스가\s*됩니다|SBS뉴스\s*채널\s*구독|SBS뉴스\s*라이브|함께\s*토론하기|스프\s*구독|뉴스\s*채널\s*구독|채널\s*추가|클릭|보기|누르세요)?(?:.*(?:http[s]?://|n\.sbs\.co\.kr|news\.kbs\.co\.kr|ytn\.co\.kr|goo\.gl|premium\.sbs\.co\.kr|pf\.kakao\.com|www\.facebook\.com|www\.twitter\.com|www\.instagram\.com|ncd=\d+).*)?$', 
-        # 일반적인 URL 단독 줄 (http/https 없는 경우도 포함)
-        r'^\s*\b(?:[a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}(?:/[^\s]*)?\s*$',
-        # 완벽한 URL 단독 줄
-        r'^\s*http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+\s*$',
-        # 해시태그 단독 줄 (쉼표로 구분된 여러 해시태그 포함)
-        r'^\s*(?:#[\w가-힣\s]+(?:,\s*#[\w가-힣\s]+)*)\s*$',
-    ]
-    for line in lines:
-        stripped_line = line.strip()
-        is_junk = False
-        for pattern in common_junk_patterns:
-            if re.search(pattern, stripped_line, re.IGNORECASE):
-                is_junk = True
-                break
-        if is_junk:
-            continue
-        cleaned_lines.append(stripped_line) 
-    text = ' '.join(cleaned_lines) 
-
-    # 줄 결합 후 후처리 단계에서 잔여 패턴 제거 (가장 중요)
-    # YTN 기자/앵커의 끝맺음 문구 제거 강화
-    text = re.sub(r'^(?:대담\s*발췌\s*:\s*이선\s*디지털뉴스팀\s*에디터|\s*지금까지\s*(?:[가-힣]{2,5}부에서\s*)?YTN\s*[가-힣]{2,5}입니다\.?)\s*', ' ', text, flags=re.MULTILINE)
-    text = re.sub(r'YTN\s*[가-힣]{2,5}\s*입니다\.?', ' ', text) # "YTN 기자이름입니다."
-    text = re.sub(r'\<앵커\>|\<기자\>', ' ', text) # <앵커>, <기자> 제거
-    # 인터뷰 인용 구조 제거 ([인물명 직책 : "내용"])
-    text = re.sub(r'\[[^\]]+:\s*["“][^"”]+["”]\s*\]', ' ', text)
-    # 직업명 및 보도 관련 문구 제거 (황다예 기자의 보돕니다, [리포트] 등)
-    text = re.sub(r'[가-힣]{2,5}\s*기자(?:의)?\s*(?:보도(?:입니다)?|보돕니다)\.?', ' ', text)
-    text = re.sub(r'\[\s*(?:리포트|앵커|취재|기자|특파원|논평|해설)\s*\]', ' ', text)
-
-    text = re.sub(
-        r'(?:KBS|SBS|YTN)\s*(?:오톡|뉴스)?\s*(?:KBS제보|SBS뉴스|YTN 검색해)?\s*(?:검색)?\s*(?:전화)?\s*\d{2,4}[-\s]?\d{3,4}[-\s]?\d{4}\s*(?:홈페이지)?\s*https?://\S+\s*(?:이메일)?\s*[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[A-Z|a-z]{2,}\s*(?:Copyright\s*Ⓒ?\s*(?:KBS|SBS|YTN)\. All rights reserved\. 무단 전재, 재배포 및 이용\(AI 학습 포함\) 금지)?', 
-        ' ', text, flags=re.IGNORECASE
-    )
-    # 기자/앵커의 끝맺음 문구 (다른 방송사나, 첫 번째 if 블록에서 처리되지 않은 경우 대비)
-    text = re.sub(r'([가-힣]{2,7}(?:특파원|기자|앵커|리포터)?입니다\.?)', ' ', text)
-    # 이름: 발언 형식 (정규식 강화: 콜론 앞뒤 공백 및 다양한 문자 허용)
-    text = re.sub(r'[가-힣A-Z\s]{2,15}\s*[:：]\s*[가-힣\s]{2,200}', ' ', text)
-    # 괄호 안 내용 제거 (이전에 줄 단위에서 제거되지 않은 경우를 대비)
-    text = re.sub(r'\([^()]*\)', ' ', text)
-    text = re.sub(r'\{[^{}]*\}', ' ', text)
-    text = re.sub(r'\[[^\[\]]*\]', ' ', text) 
-    # 해시태그 제거 (줄 단위에서 제거되지 않은 경우를 대비)
-    text = re.sub(r"#[\w가-힣]+", " ", text)
-    # 숫자 및 단위 제거 (한글 단위 포함)
-    text = re.sub(r'\b\d{1,3}(?:,\d{3})*(?:\.\d+)?[가-힣a-zA-Z%℃]+\b', ' ', text)
-    text = re.sub(r'\b\d{1,3}(?:,\d{3})*(?:\.\d+)?\b', ' ', text)
-    text = re.sub(r'#\s*\d+', ' ', text) 
-    # 따옴표 및 불필요한 기호 제거
-    text = re.sub(r'["“”‘’\'`]', ' ', text)
-    text = re.sub(r'([가-힣ㅏ-ㅣ])\1{1,}', '', text) 
-    text = re.sub(r'[ㅋㅎㅠㅜ]{2,}', '', text) 
-    text = re.sub(r"[^\w\s가-힣]", " ", text) 
-    # 다중 공백을 단일 공백으로 변환하고 양 끝 공백 제거
-    text = re.sub(r'\s+', ' ', text).strip()
-    return text.strip()
-
-def initialize_webdriver(): # WebDriver 초기화
+FETCH_CONCURRENCY = 16 # 2단계 메타데이터 동시 요청 수 (I/O 작업이라 코어 수보다 크게)
+YDL_OPTS = {
+    'noplaylist': True,
+    'quiet': True,
+    'no_warnings': True,
+    'forcethumbnail': True,
+    'skip_download': True,
+}
+KNOWN_STREAK_STOP = 10 # 이미 수집한 영상이 연속으로 이만큼 나오면 스크롤 중단 (이후는 전부 수집된 구간)
+SEEN_RETENTION_DAYS = 7 # 이보다 오래된 기록은 정리 (24시간 필터 밖이라 다시 볼 일이 없음)
+EXTRACTION_MODE = "incremental" # "incremental": 새로 추가된 영상 타일만 브라우저에서 추출, "soup": 매 스크롤마다 전체 HTML 재파싱
+MAX_TILE_RETRIES = 2 # 아직 렌더링이 덜 된 타일(링크/길이/업로드시간 없음)을 다음 스크롤에서 다시 읽는 횟수
+DRIVER_POOL_SIZE = 3 # 1단계 동시 스크롤에 쓰는 headless Chrome 수 (채널 수보다 적으면 끝난 드라이버를 다음 채널에서 재사용)
+
+def get_channel_url(code): # 채널 코드 → 동영상 탭 URL
+    return f"{BASE_YOUTUBE_URL}{CHANNEL_INFO[code]['handle']}/videos"
+
+def seen_registry_filename(output_filename): # 이전 실행에서 수집한 영상 id 기록
+    return strip_suffix(output_filename).replace("_VIDEO_DATA", "_SEEN_VIDEOS") + ".json"
+
+def video_id_from_url(url): # https://www.youtube.com/watch?v=ID&... → ID
+    if not url or 'v=' not in url:
+        return None
+    return url.split('v=')[1].split('&')[0]
+
+class SeenVideoRegistry: # 실행 간에 공유되는 yt-dlp로 이미 확인한 영상 기록 {video_id: 마지막 메타데이터 수집 시각} (저장/제외 여부 무관)
+    def __init__(self, path):
+        self.path = path
+        self.videos = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.videos = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"수집 기록 파일 로딩 실패, 빈 기록으로 시작: {e}")
+        print(f"수집 기록: 이전에 수집한 영상 {len(self.videos)}개")
+
+    def __contains__(self, video_id):
+        return video_id in self.videos
+
+    def mark(self, video_id, fetched_at=None):
+        if video_id:
+            self.videos[video_id] = fetched_at or datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')
+
+    def save(self):
+        cutoff = (datetime.now(KST) - timedelta(days=SEEN_RETENTION_DAYS)).strftime('%Y-%m-%d %H:%M:%S')
+        self.videos = {vid: ts for vid, ts in self.videos.items() if ts >= cutoff}
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.videos, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path) # 쓰는 도중 중단되어도 기존 기록 유지
+
+VIDEO_TILE_SELECTOR = 'ytd-rich-item-renderer, ytd-video-renderer'
+LINK_SELECTOR = 'a#thumbnail'
+UPLOAD_TIME_SELECTOR = 'div#metadata-line span.inline-metadata-item:last-of-type'
+DURATION_SELECTOR = 'badge-shape.badge-shape-wiz--thumbnail-default div.badge-shape-wiz__text'
+
+# 브라우저 안에서 start 이후에 새로 붙은 타일(+재시도 대상)의 링크/업로드시간/길이만 뽑아서 반환
+EXTRACT_NEW_TILES_JS = """
+const start = arguments[0];
+const retry = arguments[1];
+const nodes = document.querySelectorAll(arguments[2]);
+const read = (i) => {
+    const n = nodes[i];
+    const link = n.querySelector(arguments[3]);
+    const time = n.querySelector(arguments[4]);
+    const duration = n.querySelector(arguments[5]);
+    return {
+        index: i,
+        href: link ? link.getAttribute('href') : null,
+        upload_time: time ? time.textContent.trim() : '',
+        duration: duration ? duration.textContent.trim() : null
+    };
+};
+const items = [];
+for (const i of retry) { if (i < start && i < nodes.length) items.push(read(i)); }
+for (let i = start; i < nodes.length; i++) items.push(read(i));
+return {total: nodes.length, items: items};
+"""
+
+def extract_tiles_from_soup(html): # 전체 HTML을 파싱해서 모든 타일 추출 (EXTRACTION_MODE = "soup")
+    soup = BeautifulSoup(html, 'html.parser')
+    tiles = []
+    for video in soup.select(VIDEO_TILE_SELECTOR):
+        link_tag = video.select_one(LINK_SELECTOR)
+        upload_time_element = video.select_one(UPLOAD_TIME_SELECTOR)
+        duration_div = video.select_one(DURATION_SELECTOR)
+        tiles.append({
+            "href": link_tag.get('href') if link_tag else None,
+            "upload_time": upload_time_element.get_text(strip=True) if upload_time_element else "",
+            "duration": duration_div.get_text(strip=True) if duration_div else None,
+        })
+    return tiles
+
+class IncrementalTileReader: # 지난 스크롤 이후 새로 추가된 타일만 추출 (EXTRACTION_MODE = "incremental")
+    def __init__(self, driver):
+        self.driver = driver
+        self.next_index = 0
+        self.total = 0
+        self.retries = {} # 렌더링 미완료 타일 인덱스 → 재시도 횟수
+
+    def read(self):
+        result = self.driver.execute_script(
+            EXTRACT_NEW_TILES_JS, self.next_index, list(self.retries),
+            VIDEO_TILE_SELECTOR, LINK_SELECTOR, UPLOAD_TIME_SELECTOR, DURATION_SELECTOR
+        )
+        self.total = result['total']
+        self.next_index = max(self.next_index, self.total)
+        tiles = result['items']
+        for tile in tiles:
+            index = tile['index']
+            incomplete = not (tile['href'] and tile['upload_time'] and tile['duration'])
+            if incomplete and self.retries.get(index, 0) < MAX_TILE_RETRIES:
+                self.retries[index] = self.retries.get(index, 0) + 1
+            else:
+                self.retries.pop(index, None)
+        return tiles
+
+def initialize_webdriver(driver_path=None): # WebDriver 초기화 (driver_path가 있으면 설치 생략)
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
@@ -192,7 +171,7 @@ def initialize_webdriver(): # WebDriver 초기화
     chrome_options.add_argument("--ignore-certificate-errors")
     chrome_options.add_argument("--incognito")
     try:
-        service = ChromeService(ChromeDriverManager().install())
+        service = ChromeService(driver_path or ChromeDriverManager().install())
         driver = webdriver.Chrome(service=service, options=chrome_options) # 
         print("WebDriver 초기화 완료.")
         return driver 
@@ -200,6 +179,48 @@ def initialize_webdriver(): # WebDriver 초기화
         print(f"WebDriver 초기화 실패: {e}")
         return None
 
+class WebDriverPool: # 1단계용 headless Chrome 풀 (동시 사용 수는 크롤링 스레드 수로 제한)
+    def __init__(self, size):
+        self.size = size
+        self.drivers = queue.Queue()
+        self.driver_path = None
+        try:
+            self.driver_path = ChromeDriverManager().install() # 채널마다 설치하지 않고 한 번만
+        except Exception as e:
+            print(f"ChromeDriver 설치 실패: {e}")
+
+    def acquire(self): # 쉬고 있는 드라이버가 있으면 재사용, 없으면 새로 생성
+        try:
+            return self.drivers.get_nowait()
+        except queue.Empty:
+            if self.driver_path is None:
+                return None
+            return initialize_webdriver(self.driver_path)
+
+    def release(self, driver, broken=False):
+        if broken: # 오류가 난 드라이버는 재사용하지 않음
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            return
+        self.drivers.put(driver)
+
+    def close(self):
+        closed = 0
+        while True:
+            try:
+                driver = self.drivers.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            closed += 1
+        if closed:
+            print(f"WebDriver {closed}개 종료")
+
 def parse_duration_to_seconds(duration_str):
     parts = list(map(int, duration_str.split(':')))
     if len(parts) == 3:
@@ -222,103 +243,154 @@ def is_within_hours(upload_time_str, max_hours):
         return days <= (max_hours // 24) 
     return False
 
-def is_english_video(title, description):
+HANGUL_PATTERN = re.compile(r'[가-힣ㄱ-ㅎㅏ-ㅣ]')
+LATIN_PATTERN = re.compile(r'[A-Za-z]')
+HANGUL_RATIO_THRESHOLD = 0.5 # 한글+라틴 문자 중 한글 비율이 이 이상이면 langdetect 없이 '영어 아님'으로 판정
+
+class LanguageGate: # 문자 비율로 명확한 경우를 먼저 판정하고, 애매한 경우만 langdetect 사용 (영상 id별 결과 캐시)
+    def __init__(self):
+        self.cache = {}
+        self.lock = threading.Lock() # 2단계 스레드들이 같이 사용
+        self.checked = 0
+        self.cache_hits = 0
+        self.fallbacks = 0
+
+    def is_english_text(self, text, min_length):
+        if not text or len(text.strip()) <= min_length:
+            return False
+        hangul = len(HANGUL_PATTERN.findall(text))
+        latin = len(LATIN_PATTERN.findall(text))
+        if hangul and hangul >= (hangul + latin) * HANGUL_RATIO_THRESHOLD: # 한글 위주 → 한국어
+            return False
+        if not latin: # 라틴 문자가 없으면 영어일 수 없음 (langdetect도 영어로 판정하지 않음)
+            return False
+        with self.lock:
+            self.fallbacks += 1
+        try:
+            return detect(text) == 'en'
+        except Exception:
+            return False
+
+    def is_english(self, title, description, video_id=None):
+        if video_id:
+            with self.lock:
+                if video_id in self.cache:
+                    self.cache_hits += 1
+                    return self.cache[video_id]
+        with self.lock:
+            self.checked += 1
+        # 제목과 설명이 모두 영어여야 영문 영상 → 제목이 영어가 아니면 설명은 검사 안 함
+        result = self.is_english_text(title, 5) and self.is_english_text(description, 20)
+        if video_id:
+            with self.lock:
+                self.cache[video_id] = result
+        return result
+
+    def report(self):
+        with self.lock:
+            print(f"언어 판정: {self.checked}건 (캐시 재사용 {self.cache_hits}건), langdetect 사용 {self.fallbacks}회")
+
+language_gate = LanguageGate()
+
+def is_english_video(title, description, video_id=None):
     if not title and not description:
         return False
-    title_is_english = False
-    description_is_english = False
-    try:
-        if title and len(title.strip()) > 5: 
-            if detect(title) == 'en':
-                title_is_english = True
-    except Exception:
-        pass 
-    try:
-        if description and len(description.strip()) > 20: 
-            if detect(description) == 'en':
-                description_is_english = True
-    except Exception:
-        pass 
-    return title_is_english and description_is_english
-
-def crawl_main_page_and_filter_videos(driver):
-    print("1단계 크롤링 시작: 메인 페이지 동영상 목록 필터링")
+    return language_gate.is_english(title, description, video_id)
+
+def crawl_main_page_and_filter_videos(driver, channel_url, registry=None, label=""):
+    prefix = f"[{label}] " if label else ""
+    candidates = []
+    print(prefix + "1단계 크롤링 시작: 메인 페이지 동영상 목록 필터링")
     try:
-        driver.get(YOUTUBE_MAIN_URL)
-        print(f"{YOUTUBE_MAIN_URL} 접속 완료.")
+        driver.get(channel_url)
+        print(f"{prefix}{channel_url} 접속 완료.")
         WebDriverWait(driver, 30).until(
             EC.presence_of_element_located((By.ID, "contents"))
         )
-        print("페이지 컨텐츠 로딩 완료.")
+        print(prefix + "페이지 컨텐츠 로딩 완료.")
     except TimeoutException:
-        print("페이지 컨텐츠 로딩 시간 초과. 네트워크 상태를 확인하거나 타임아웃을 늘리세요.")
-        return
+        print(prefix + "페이지 컨텐츠 로딩 시간 초과. 네트워크 상태를 확인하거나 타임아웃을 늘리세요.")
+        return candidates
     except WebDriverException as e:
-        print(f"유튜브 메인 페이지 접속 중 오류 발생: {e}")
-        return
+        print(f"{prefix}유튜브 메인 페이지 접속 중 오류 발생: {e}")
+        return candidates
 
     seen_video_ids = set()
     scroll_count = 0
     last_height = driver.execute_script("return document.documentElement.scrollHeight")
     stop_scrolling = False
     no_change_count = 0
+    known_streak = 0 # 연속으로 만난 기수집 영상 수
+    tile_reader = IncrementalTileReader(driver) if EXTRACTION_MODE == "incremental" else None
 
     while not stop_scrolling and scroll_count < MAX_SCROLLS:
-        print(f"\n스크롤 {scroll_count + 1}회 시작...")
+        print(f"\n{prefix}스크롤 {scroll_count + 1}회 시작...")
         driver.execute_script("window.scrollTo(0, document.documentElement.scrollHeight);")
         time.sleep(SCROLL_PAUSE_TIME + 1)
 
         new_height = driver.execute_script("return document.documentElement.scrollHeight")
         if new_height == last_height:
             no_change_count += 1
-            print(f"높이 변화 없음 (연속 {no_change_count}회).")
+            print(f"{prefix}높이 변화 없음 (연속 {no_change_count}회).")
             if no_change_count >= 3:
-                print("3회 연속 스크롤 높이 변화 없음. 더 이상 로드할 컨텐츠가 없거나 로딩이 매우 느림. 중단")
+                print(prefix + "3회 연속 스크롤 높이 변화 없음. 더 이상 로드할 컨텐츠가 없거나 로딩이 매우 느림. 중단")
                 break
         else:
             no_change_count = 0
         last_height = new_height
  
-        soup = BeautifulSoup(driver.page_source, 'html.parser') 
-        video_containers = soup.select('ytd-rich-item-renderer, ytd-video-renderer') # 스크롤된 페이지에서 영상 리스트 가져옴
-
-        if not video_containers:
-            print("동영상 컨테이너 요소를 찾을 수 없음. 셀렉터를 확인")
+        if tile_reader is not None: # 새로 추가된 타일만 브라우저에서 추출
+            video_tiles = tile_reader.read()
+            total_tiles = tile_reader.total
+        else: # 스크롤된 페이지 전체에서 영상 리스트 가져옴
+            video_tiles = extract_tiles_from_soup(driver.page_source)
+            total_tiles = len(video_tiles)
+
+        if not total_tiles:
+            print(prefix + "동영상 컨테이너 요소를 찾을 수 없음. 셀렉터를 확인")
             if no_change_count >= 3: break 
             continue # 스크롤 3회 이상 동안 변화 없으면 크롤링 중단
         current_scroll_videos_count = 0
         
-        for video in video_containers: # 개별적 각 영상 조건 검사
+        for video in video_tiles: # 개별적 각 영상 조건 검사
             try:
-                link_tag = video.select_one('a#thumbnail') 
-                if not link_tag or 'href' not in link_tag.attrs: continue
-                video_url_suffix = link_tag['href'] 
+                video_url_suffix = video["href"]
+                if not video_url_suffix: continue
                 if not video_url_suffix.startswith('/watch?v='): continue
                 video_id = video_url_suffix.split('v=')[1].split('&')[0] 
                 if video_id in seen_video_ids: continue # 유효하지 않은 링크, 이미 처리한 영상일 경우 건너뜀
                 
-                upload_time_element = video.select_one('div#metadata-line span.inline-metadata-item:last-of-type')
-                upload_time_str = upload_time_element.get_text(strip=True) if upload_time_element else ""
+                upload_time_str = video["upload_time"]
                 if not upload_time_str or "전" not in upload_time_str:  
                     continue # 업로드 시간 검사, 상대시간
                 if "일 전" in upload_time_str: 
                     days_ago = int(re.search(r'(\d+)', upload_time_str).group(1))
                     if days_ago >= (MAX_VIDEO_AGE_HOURS // 24):
-                        print("설정된 시간 초과영상발견, 1단계크롤링 종료")
+                        print(prefix + "설정된 시간 초과영상발견, 1단계크롤링 종료")
                         stop_scrolling = True # 설정 조건 벗어나면 스크롤 중단
                         break
                 
-                duration_div = video.select_one('badge-shape.badge-shape-wiz--thumbnail-default div.badge-shape-wiz__text')
-                if not duration_div:
+                duration_str = video["duration"]
+                if not duration_str:
                     continue
-                duration_str = duration_div.get_text(strip=True)
                 video_length_seconds = parse_duration_to_seconds(duration_str) 
                 if not (MIN_VIDEO_LENGTH_SECONDS <= video_length_seconds <= MAX_VIDEO_LENGTH_SECONDS):
                     continue # 영상 길이 검사 60 ~ 300 초 사이 일때만 통과
 
+                # 조건을 통과한 영상만 기수집 여부 확인 (조건에서 걸러지는 영상은 yt-dlp로 수집되지 않아 기록에 없으므로 연속 횟수에 영향 없음)
+                if registry is not None and video_id in registry: # 이전 실행에서 이미 수집한 영상
+                    seen_video_ids.add(video_id)
+                    known_streak += 1
+                    if known_streak >= KNOWN_STREAK_STOP:
+                        print(f"{prefix}이미 수집한 영상 {KNOWN_STREAK_STOP}개 연속 발견, 1단계크롤링 종료")
+                        stop_scrolling = True
+                        break
+                    continue
+                known_streak = 0
+
                 if video_url_suffix and upload_time_str: # 필터링된 영상 데이터 저장
                     full_url = f"{BASE_YOUTUBE_URL}{video_url_suffix}" 
-                    filtered_video_urls_1st_stage.append({
+                    candidates.append({
                         "url": full_url,
                         "upload_time_summary": upload_time_str,
                     }) 
@@ -330,146 +402,189 @@ def crawl_main_page_and_filter_videos(driver):
             except Exception as e:
                 continue
 
-        print(f"현재 스크롤에서 {current_scroll_videos_count}개의 유효 동영상 발견.")
+        print(f"{prefix}현재 스크롤에서 {current_scroll_videos_count}개의 유효 동영상 발견.")
         if stop_scrolling:
             break
 
         scroll_count += 1
         time.sleep(1)
 
-    print(f"\n1단계 크롤링 완료. 총 {len(filtered_video_urls_1st_stage)}개의 동영상 후보가 수집됨.")
-    unique_videos_dict = {video['url']: video for video in filtered_video_urls_1st_stage}
-    filtered_video_urls_1st_stage[:] = list(unique_videos_dict.values())
-    print(f"최종 1단계 필터링 후 {len(filtered_video_urls_1st_stage)}개의 동영상 후보.")
-
-def process_video_data(video_data_1st_stage):
-    ydl_opts = {
-        'noplaylist': True,
-        'quiet': True,
-        'no_warnings': True,
-        'forcethumbnail': True,
-        'skip_download': True,
+    print(f"\n{prefix}1단계 크롤링 완료. 총 {len(candidates)}개의 동영상 후보가 수집됨.")
+    unique_videos_dict = {video['url']: video for video in candidates}
+    candidates = list(unique_videos_dict.values())
+    print(f"{prefix}최종 1단계 필터링 후 {len(candidates)}개의 동영상 후보.")
+    return candidates
+
+_thread_local = threading.local()
+
+def get_thread_ydl(): # 워커 스레드마다 YoutubeDL 하나를 만들어 재사용
+    ydl = getattr(_thread_local, 'ydl', None)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(YDL_OPTS)
+        _thread_local.ydl = ydl
+    return ydl
+
+def extract_video_record(video_info, video_url): # yt-dlp 메타데이터 → 저장용 레코드 (네트워크 없이 테스트 가능)
+    title = video_info.get('title', '제목 없음') # 영상 제목 추출
+    description = video_info.get('description', '설명 없음') # 영상 프롬포트 추출
+    webpage_url = video_info.get('webpage_url', video_url) # 영상 웹 페이지 URL 추출
+    thumbnail = video_info.get('thumbnail', None) # 썸네일 링크 URL 추출
+    if 'thumbnails' in video_info and video_info['thumbnails']: # 여러 개의 썸네일 저장 목록 존재시
+        thumbnail = video_info['thumbnails'][-1].get('url', thumbnail) # 가장 마지막(고화질)썸네일 추출
+    view_count = video_info.get('view_count') # 조회수 추출
+
+    upload_date_kst_formatted = None # KST 업로드 날짜 초기화
+    if 'timestamp' in video_info and video_info['timestamp'] is not None:
+        dt_object_utc = datetime.fromtimestamp(video_info['timestamp'], tz=pytz.utc) # datetime 객체로 변환
+        kst_timezone = pytz.timezone('Asia/Seoul') 
+        dt_object_kst = dt_object_utc.astimezone(kst_timezone) # 한국표준시로 변환
+        upload_date_kst_formatted = dt_object_kst.strftime('%Y-%m-%d %H:%M:%S') # 포맷팅
+
+    now_kst = datetime.now(KST) # 작업 현재 시간
+    if upload_date_kst_formatted: # KST 시간 유효 시
+        try:
+            uploaded_dt_kst = KST.localize(datetime.strptime(upload_date_kst_formatted, '%Y-%m-%d %H:%M:%S'))
+            time_difference = now_kst - uploaded_dt_kst # 현재 시간, 업로드 시간 정확한 비교
+            if time_difference.total_seconds() >= MAX_VIDEO_AGE_HOURS * 3600: # 시간 초과시
+                print(f" -> '{upload_date_kst_formatted}'(KST) 영상은 {MAX_VIDEO_AGE_HOURS}시간 초과로 제외")
+                return None # 해당 영상 데이터 제거
+        except ValueError:
+            print(f" -> KST 업로드 시간 '{upload_date_kst_formatted}' 파싱 오류 필터링 않고 포함")
+    else:
+        print(f" -> YT-DLP에서 KST 업로드 시간 파싱 불가 필터링 않고 포함")
+
+    if is_english_video(title, description, video_id_from_url(webpage_url)):
+        print(f" -> 영문 영상 제외: '{title}'")
+        return None
+
+    cleaned_title_result = clean_title(title)
+    description = clean_text_full(description) 
+
+    return {
+        "title": title,
+        "cleaned_title": cleaned_title_result,
+        "upload_date_kst": upload_date_kst_formatted,
+        "description": description, # 이제 이 description은 전처리된 내용입니다.
+        "video_link": webpage_url,
+        "thumbnail_link": thumbnail,
+        "view_count": view_count 
     }
+
+def process_video_data(video_data_1st_stage, ydl=None): # (메타데이터 수집 시각, 레코드) 반환, 수집 실패면 시각 None / 제외된 영상이면 레코드 None
     video_url = video_data_1st_stage['url']
     print(f"워커: '{video_data_1st_stage.get('upload_time_summary', 'N/A')}' 동영상 상세 정보 크롤링 및 전처리 중: {video_url}")
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl: # yt-dlp 로 메타데이터 수집
-            video_info = ydl.extract_info(video_url, download=False)
-
-        title = video_info.get('title', '제목 없음') # 영상 제목 추출
-        description = video_info.get('description', '설명 없음') # 영상 프롬포트 추출
-        webpage_url = video_info.get('webpage_url', video_url) # 영상 웹 페이지 URL 추출
-        thumbnail = video_info.get('thumbnail', None) # 썸네일 링크 URL 추출
-        if 'thumbnails' in video_info and video_info['thumbnails']: # 여러 개의 썸네일 저장 목록 존재시
-            thumbnail = video_info['thumbnails'][-1].get('url', thumbnail) # 가장 마지막(고화질)썸네일 추출
-        view_count = video_info.get('view_count') # 조회수 추출
-
-        upload_date_kst_formatted = None # KST 업로드 날짜 초기화
-        if 'timestamp' in video_info and video_info['timestamp'] is not None:
-            dt_object_utc = datetime.fromtimestamp(video_info['timestamp'], tz=pytz.utc) # datetime 객체로 변환
-            kst_timezone = pytz.timezone('Asia/Seoul') 
-            dt_object_kst = dt_object_utc.astimezone(kst_timezone) # 한국표준시로 변환
-            upload_date_kst_formatted = dt_object_kst.strftime('%Y-%m-%d %H:%M:%S') # 포맷팅
-
-        now_kst = datetime.now(KST) # 작업 현재 시간
-        if upload_date_kst_formatted: # KST 시간 유효 시
-            try:
-                uploaded_dt_kst = KST.localize(datetime.strptime(upload_date_kst_formatted, '%Y-%m-%d %H:%M:%S'))
-                time_difference = now_kst - uploaded_dt_kst # 현재 시간, 업로드 시간 정확한 비교
-                if time_difference.total_seconds() >= MAX_VIDEO_AGE_HOURS * 3600: # 시간 초과시
-                    print(f" -> '{upload_date_kst_formatted}'(KST) 영상은 {MAX_VIDEO_AGE_HOURS}시간 초과로 제외")
-                    return None # 해당 영상 데이터 제거
-            except ValueError:
-                print(f" -> KST 업로드 시간 '{upload_date_kst_formatted}' 파싱 오류 필터링 않고 포함")
-        else:
-            print(f" -> YT-DLP에서 KST 업로드 시간 파싱 불가 필터링 않고 포함")
-
-        if is_english_video(title, description):
-            print(f" -> 영문 영상 제외: '{title}'")
-            return None
-
-        cleaned_title_result = clean_title(title)
-        description = clean_text_full(description) 
-
-        return {
-            "title": title,
-            "cleaned_title": cleaned_title_result,
-            "upload_date_kst": upload_date_kst_formatted,
-            "description": description, # 이제 이 description은 전처리된 내용입니다.
-            "video_link": webpage_url,
-            "thumbnail_link": thumbnail,
-            "view_count": view_count 
-        }
-
+        if ydl is None:
+            ydl = get_thread_ydl()
+        video_info = ydl.extract_info(video_url, download=False) # yt-dlp 로 메타데이터 수집
+        fetched_at = datetime.now(KST).strftime('%Y-%m-%d %H:%M:%S')
     except yt_dlp.utils.DownloadError as e:
         print(f"yt-dlp 오류 발생 (URL: {video_url}): {e}")
-        return None
+        return None, None
     except Exception as e:
         print(f"yt-dlp 처리 중 예상치 못한 오류 발생 (URL: {video_url}): {e}")
-        return None
-
+        return None, None
+    try:
+        return fetched_at, extract_video_record(video_info, video_url)
+    except Exception as e:
+        print(f"메타데이터 전처리 중 오류 발생 (URL: {video_url}): {e}")
+        return fetched_at, None
+
+def crawl_channel(code, driver_pool, registry): # 1단계: 풀에서 드라이버를 빌려 채널 하나 스크롤
+    handle = CHANNEL_INFO[code]['handle']
+    driver = driver_pool.acquire()
+    if driver is None:
+        print(f"[{handle}] WebDriver가 초기화되지 않아 1단계 크롤링을 실행할 수 없음")
+        return []
+    try:
+        videos = crawl_main_page_and_filter_videos(driver, get_channel_url(code), registry, handle)
+    except Exception as e:
+        print(f"[{handle}] 1단계 크롤링 중 오류 발생, 드라이버 폐기: {e}")
+        driver_pool.release(driver, broken=True)
+        return []
+    driver_pool.release(driver)
+    return [v for v in videos if video_id_from_url(v['url']) not in registry] # 이미 확인한 영상은 2단계에서 건너뜀
+
+def save_channel_output(output_filename, records, registry): # 최신순 정렬, id 부여 후 채널 파일 저장
+    records.sort( # 영상 데이터 정렬
+        key=lambda x: datetime.strptime(x['upload_date_kst'], '%Y-%m-%d %H:%M:%S') 
+        if x.get('upload_date_kst') else datetime.min, # 값이 없으면 datetime.min으로 과거로간주
+        reverse=True # 최신순 정렬
+    ) # upload_date_kst 값 존재 시 datetime 객체로 바꿔서 비교,
+    for i, item in enumerate(records):
+        item['id'] = i + 1 # 고유 id 부여
+    try:
+        output_data = ( # 저장될 데이터 형식 정의
+            {
+                "id": item.get("id"),
+                "title": item.get("title"),
+                "cleaned_title": item.get("cleaned_title"),
+                "upload_date_kst": item.get("upload_date_kst"),
+                "description": item.get("description"),
+                "video_link": item.get("video_link"),
+                "thumbnail_link": item.get("thumbnail_link"),
+                "view_count": item.get("view_count") 
+            } for item in records
+        )
+        write_records(output_filename, output_data) # 임시 파일에 쓴 뒤 교체 (중간에 죽어도 기존 파일 유지)
+        print(f"크롤링된 데이터가 '{output_filename}' 파일에 성공적으로 저장됨")
+        registry.save() # 저장에 성공했을 때만 이번 실행의 확인 기록 반영
+        print(f"수집 기록 갱신: '{registry.path}' ({len(registry.videos)}개)")
+    except Exception as e:
+        print(f"JSON 파일 저장 중 오류 발생: {e}")
+
+def crawl_channels(codes, driver_pool_size=DRIVER_POOL_SIZE, fetch_workers=FETCH_CONCURRENCY):
+    # 1단계는 채널별로 동시에 스크롤하고, 끝난 채널부터 2단계 요청을 하나의 공용 스레드 풀에 넣어서
+    # 다른 채널이 스크롤하는 동안에도 메타데이터 수집이 진행되도록 함
+    for code in codes:
+        if code not in CHANNEL_INFO:
+            print(f"오류: 유효하지 않은 채널 코드 '{code}' 입니다. 건너뜀")
+    codes = [code for code in codes if code in CHANNEL_INFO]
+    if not codes:
+        print("크롤링할 채널이 없음. 프로그램 종료")
+        return
+    for code in codes:
+        print(f"선택된 채널: {CHANNEL_INFO[code]['handle']}, 크롤링 URL: {get_channel_url(code)}, 저장 파일명: {CHANNEL_INFO[code]['filename']}")
 
-if __name__ == "__main__":
-    driver = initialize_webdriver() # WebDriver 초기화 함수 호출
+    registries = {code: SeenVideoRegistry(seen_registry_filename(CHANNEL_INFO[code]['filename'])) for code in codes} # 이전 실행 수집 기록
+    driver_pool = WebDriverPool(min(driver_pool_size, len(codes)))
+    fetches = {} # 1단계가 끝난 순서대로 {채널 코드: {2단계 future: video_id}}
+    try:
+        with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_executor:
+            with ThreadPoolExecutor(max_workers=driver_pool.size) as crawl_executor:
+                crawl_futures = {
+                    crawl_executor.submit(crawl_channel, code, driver_pool, registries[code]): code for code in codes
+                }
+                for future in as_completed(crawl_futures):
+                    code = crawl_futures[future]
+                    videos = future.result()
+                    print(f"\n[{CHANNEL_INFO[code]['handle']}] 2단계 크롤링 및 전처리 시작(동시 요청 {fetch_workers}개 공용): {len(videos)}개")
+                    fetches[code] = {fetch_executor.submit(process_video_data, video): video_id_from_url(video['url']) for video in videos}
+            driver_pool.close() # 1단계가 모두 끝나면 브라우저 정리 (2단계는 계속 진행)
+
+            for code, futures in fetches.items():
+                handle = CHANNEL_INFO[code]['handle']
+                registry = registries[code]
+                if not futures:
+                    print(f"[{handle}] 1단계 필터링 영상 없음 2단계 크롤링을 진행 못함")
+                    continue
+                records = []
+                for future in as_completed(futures): # 끝나는 순서대로 결과 수신
+                    fetched_at, detailed_info = future.result()
+                    if fetched_at: # 메타데이터를 받아온 영상은 제외(시간 초과/영문)됐어도 기록 → 다음 실행에서 다시 요청하지 않음
+                        registry.mark(futures[future], fetched_at)
+                    if detailed_info:
+                        records.append(detailed_info)
+                print(f"\n[{handle}] 총 {len(records)}개의 유효한 영상 상세 정보 및 전처리 완료.")
+                save_channel_output(CHANNEL_INFO[code]['filename'], records, registry)
+    finally:
+        driver_pool.close()
 
-    if driver: # Webdriver 초기화 성공 시
-        crawl_main_page_and_filter_videos(driver) # 1단계 메인 페이지 크롤링, 1차 필터링
-        driver.quit() # WebDriver 종료
-        print("WebDriver 종료")
-    else:
-        print("WebDriver가 초기화되지 않아 1단계 크롤링을 실행할 수 없음. 프로그램 종료")
-        exit()
 
-    print("\n2단계 크롤링 및 전처리 시작(병렬 처리)")
+if __name__ == "__main__":
     total_start_time = time.time() 
-
-    if filtered_video_urls_1st_stage: # 1단계 필터링 영상 URL 목록 존재 시
-        num_cores = cpu_count() # 시스템 CPU 코어 수 확인
-        num_workers = num_cores # 워커 수 설정
-        print(f"시스템 코어 수: {num_cores}, 설정된 워커 수: {num_workers}")
-
-        temp_final_data_before_id = [] # 최종 데이터 저장 위한 임시 리스트 초기화
-
-        with Pool(processes=num_workers) as pool:  # 지정된 수의 워커로 프로세스 풀 생성 
-            results = pool.map(process_video_data, filtered_video_urls_1st_stage)
-            # 각 URL에 대해 병렬로 process_video_data 함수 실행
-
-        for detailed_info in results: # 병렬 처리 결과 반복
-            if detailed_info: 
-                temp_final_data_before_id.append(detailed_info)
-
-        print(f"\n총 {len(temp_final_data_before_id)}개의 유효한 영상 상세 정보 및 전처리 완료.")
-
-        if temp_final_data_before_id: # 유효한 영상 데이터 존재 시
-            temp_final_data_before_id.sort( # 영상 데이터 정렬
-                key=lambda x: datetime.strptime(x['upload_date_kst'], '%Y-%m-%d %H:%M:%S') 
-                if x.get('upload_date_kst') else datetime.min, # 값이 없으면 datetime.min으로 과거로간주
-                reverse=True # 최신순 정렬
-            ) # upload_date_kst 값 존재 시 datetime 객체로 바꿔서 비교,
-            for i, item in enumerate(temp_final_data_before_id):
-                item['id'] = i + 1 # 고유 id 부여
-                final_video_data.append(item) # 최종 데이터 리스트에 추가
-        try:
-            with open(OUTPUT_FILENAME, 'w', encoding='utf-8') as f: # 지정된 파일명으로 쓰기 모드
-                output_data = [ # 저장될 데이터 형식 정의
-                    {
-                        "id": item.get("id"),
-                        "title": item.get("title"),
-                        "cleaned_title": item.get("cleaned_title"),
-                        "upload_date_kst": item.get("upload_date_kst"),
-                        "description": item.get("description"),
-                        "video_link": item.get("video_link"),
-                        "thumbnail_link": item.get("thumbnail_link"),
-                        "view_count": item.get("view_count") 
-                    } for item in final_video_data
-                ]
-                json.dump(output_data, f, ensure_ascii=False, indent=4) # JSON 형식으로 파일에 저장
-            print(f"크롤링된 데이터가 '{OUTPUT_FILENAME}' 파일에 성공적으로 저장됨")
-        except Exception as e:
-            print(f"JSON 파일 저장 중 오류 발생: {e}")
-    else:
-        print("1단계 필터링 영상 없음 2단계 크롤링을 진행 못함")
-
+    crawl_channels(SELECTED_CHANNEL_CODES)
     total_end_time = time.time()
     total_elapsed_time = total_end_time - total_start_time
+    language_gate.report()
     print(f"\n**전체 크롤링 작업 소요 시간**: {total_elapsed_time:.4f} 초")
\ No newline at end of file
@@ -1,12 +1,16 @@
 import os
-import json
+import sys
 import joblib
-from konlpy.tag import Mecab
 from typing import List
 
-# 📌 키워드 추출 함수 (MeCab 기반 단순 TF 방식)
-def extract_keywords(text: str, mecab: Mecab, top_k: int = 5) -> List[str]:
-    nouns = mecab.nouns(text)
+# 프로젝트 루트의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from news_classifier import NewsClassifier  # 모델이 __main__.NewsClassifier로 저장되어 있어 이 이름으로 찾음
+from tokenizer import TokenizerPool
+from record_io import RecordWriter, iter_batches, read_records, record_path, resolve_records
+
+# 📌 키워드 추출 함수 (MeCab 명사 기반 단순 TF 방식)
+def extract_keywords(nouns: List[str], top_k: int = 5) -> List[str]:
     freq = {}
     for noun in nouns:
         if len(noun) > 1:
@@ -14,66 +18,50 @@ def extract_keywords(text: str, mecab: Mecab, top_k: int = 5) -> List[str]:
     sorted_keywords = sorted(freq.items(), key=lambda x: x[1], reverse=True)
     return [kw for kw, _ in sorted_keywords[:top_k]]
 
-# 📌 모델 클래스 정의
-class NewsClassifier:
-    def __init__(self, model, vectorizer, label_encoder, threshold=0.5):
-        self.model = model
-        self.vectorizer = vectorizer
-        self.label_encoder = label_encoder
-        self.threshold = threshold
-
-    def predict(self, text):
-        X = self.vectorizer.transform([text])
-        probs = self.model.predict_proba(X)[0]
-        max_prob = max(probs)
-        pred_index = probs.argmax()
-        if max_prob < self.threshold:
-            return "기타"
-        return self.label_encoder.inverse_transform([pred_index])[0]
-
-    def predict_proba(self, text):
-        X = self.vectorizer.transform([text])
-        probs = self.model.predict_proba(X)[0]
-        return dict(zip(self.label_encoder.classes_, map(float, probs)))
-
 # 📁 경로 설정
 model_path = "/Users/sseung/Documents/study/python_class/project_root/model/news_classifier_plusnaver.pkl"
 input_base_path = "/Users/sseung/Documents/study/python_class/project_root/data/use/crawling"
 output_base_path = "/Users/sseung/Documents/study/python_class/project_root/data/use/crawling"
-
-# 📦 모델 로드
-model_obj = joblib.load(model_path)
-classifier = model_obj  # 이미 NewsClassifier 인스턴스로 저장되어 있음
-mecab = Mecab()
+token_cache_path = "/Users/sseung/Documents/study/python_class/project_root/data/cache/mecab_tokens.sqlite"  # 형태소 분석 캐시
 
 # 📰 언론사 목록
 companies = ["kbs", "sbs", "ytn"]
+BATCH_SIZE = 2000  # 한 번에 형태소 분석/분류하는 기사 수 (파일 전체를 메모리에 올리지 않음)
 
-# 🔁 각 언론사별 처리
-for company in companies:
-    input_path = os.path.join(input_base_path, f"{company}_updated.json")
-    output_path = os.path.join(output_base_path, f"{company}_processing_updated.json")
-
-    # 뉴스 데이터 로드
-    with open(input_path, "r", encoding="utf-8") as f:
-        news_data = json.load(f)
+if __name__ == "__main__":
+    # 📦 모델 로드
+    model_obj = joblib.load(model_path)
+    classifier = model_obj  # 이미 NewsClassifier 인스턴스로 저장되어 있음
 
-    # 🔍 분류 + 핵심어 추출
-    for article in news_data:
-        text = article.get("description", "") or article.get("title", "")
-        nouns = mecab.nouns(text)
-        filtered = " ".join([n for n in nouns if len(n) > 1])
+    # 🔠 MeCab 병렬 처리 풀 (코어 수만큼 워커, 이미 분석한 텍스트는 캐시에서)
+    with TokenizerPool(cache_path=token_cache_path) as tokenizer:
+        # 🔁 각 언론사별 처리
+        for company in companies:
+            input_path = resolve_records(os.path.join(input_base_path, f"{company}_updated"))
+            output_path = record_path(os.path.join(output_base_path, f"{company}_processing_updated"))
+            if input_path is None:
+                print(f"❌ {company.upper()} 입력 파일 없음. 건너뜁니다.")
+                continue
 
-        topic = classifier.predict(filtered)
-        prob_dict = classifier.predict_proba(filtered)
-        keywords = extract_keywords(text, mecab)
+            # 기사를 BATCH_SIZE개씩 읽어서 처리하고 바로 저장
+            with RecordWriter(output_path) as writer:
+                for news_data in iter_batches(read_records(input_path), BATCH_SIZE):
+                    # 🔍 명사 추출 + 핵심어 추출 (명사는 한 번만 추출해서 둘 다에 사용)
+                    texts = [article.get("description", "") or article.get("title", "") for article in news_data]
+                    filtered_texts = []
+                    keywords_list = []
+                    for nouns in tokenizer.nouns(texts):
+                        filtered_texts.append(" ".join([n for n in nouns if len(n) > 1]))
+                        keywords_list.append(extract_keywords(nouns))
 
-        article["topic"] = topic
-        article["probabilities"] = prob_dict
-        article["keywords"] = keywords
+                    # 🤖 분류: 배치 전체를 한 번에 벡터화/예측 (라벨과 확률을 한 번의 추론으로)
+                    results = classifier.classify_many(filtered_texts)
 
-    # 저장
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(news_data, f, ensure_ascii=False, indent=2)
+                    # 저장 직전에만 dict로 변환
+                    for article, result, keywords in zip(news_data, results, keywords_list):
+                        article["topic"] = result.label
+                        article["probabilities"] = result.probabilities()
+                        article["keywords"] = keywords
+                        writer.write(article)
 
-    print(f"✅ {company.upper()} 처리 완료 → {output_path}")
+            print(f"✅ {company.upper()} 처리 완료 → {output_path}")
@@ -1,11 +1,18 @@
 import os
+import sys
 import json
 from collections import Counter, defaultdict
-from konlpy.tag import Mecab
+
+# 프로젝트 루트의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tokenizer import TokenizerPool
+from record_io import committed_size, read_records, resolve_records
 
 # 기본 설정
 DATA_DIR = "/Users/sseung/Documents/study/python_class/project_root/data/use/crawling"
 OUTPUT_PATH = "/Users/sseung/Documents/study/python_class/project_root/data/use/hot_keyword/hot_keywords_by_company.json"
+STATE_PATH = "/Users/sseung/Documents/study/python_class/project_root/data/use/hot_keyword/hot_keyword_state.json"  # 누적 명사 빈도
+TOKEN_CACHE_PATH = "/Users/sseung/Documents/study/python_class/project_root/data/cache/mecab_tokens.sqlite"  # 형태소 분석 캐시
 BROADCASTERS = ["KBS", "SBS", "YTN"]
 TOPICS = ["IT_과학", "경제", "정치", "스포츠", "연예", "기타"]
 
@@ -16,24 +23,11 @@ stopwords = set([
     "같다", "그리고", "하지만", "그러나", "겁니다"
 ])
 
-mecab = Mecab()
-result = {b: {t: [] for t in TOPICS} for b in BROADCASTERS}
-
-for broadcaster in BROADCASTERS:
-    file_path = os.path.join(DATA_DIR, f"{broadcaster}_crawling_with_summary.json")
-    if not os.path.exists(file_path):
-        print(f"❌ {file_path} 없음. 건너뜁니다.")
-        continue
-
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            articles = json.load(f)
-    except Exception as e:
-        print(f"⚠️ {broadcaster} 파일 로딩 중 오류: {e}")
-        continue
-
-    topic_word_counts = defaultdict(Counter)
 
+def count_topic_nouns(articles, tokenizer, topic_word_counts):
+    # 토픽별 텍스트를 모은 뒤 형태소 분석은 풀에서 한꺼번에 처리, 기존 카운터에 누적
+    topics = []
+    texts = []
     for article in articles:
         try:
             topic = article.get("topic", "기타")
@@ -44,25 +38,107 @@ for broadcaster in BROADCASTERS:
             if not text.strip():
                 continue
 
-            nouns = [
-                word for word, tag in mecab.pos(text)
-                if tag.startswith("NN") and word not in stopwords and len(word) > 1
-            ]
-            topic_word_counts[topic].update(nouns)
+            topics.append(topic)
+            texts.append(text)
 
         except Exception as e:
             print(f"🛑 기사 분석 중 오류 발생 (ID: {article.get('id', 'N/A')}): {e}")
             continue
 
-    for topic in TOPICS:
-        result[broadcaster][topic] = [
-            word for word, _ in topic_word_counts[topic].most_common(10)
+    for topic, tagged in zip(topics, tokenizer.pos(texts)):
+        nouns = [
+            word for word, tag in tagged
+            if tag.startswith("NN") and word not in stopwords and len(word) > 1
         ]
+        topic_word_counts[topic].update(nouns)
+    return topic_word_counts
+
+
+def load_state():
+    # {방송사: {"inode": 아카이브 inode, "offset": 지난번에 읽은 커밋 크기, "records": 반영한 기사 수, "counts": {토픽: {단어: 빈도}}}}
+    if not os.path.exists(STATE_PATH):
+        return {}
+    try:
+        with open(STATE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ 상태 파일 로딩 실패, 처음부터 다시 셉니다: {e}")
+        return {}
+
+
+def save_state(state):
+    tmp_path = STATE_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp_path, STATE_PATH)
+
+
+def read_new_articles(file_path, prev):
+    # 🔁 utils/updated.py는 아카이브 끝에 추가만 하므로 지난번에 읽은 커밋 크기(offset)부터 새 기사만 읽음
+    # 파일이 교체됐거나(inode) 기록보다 작아졌으면 (아카이브 재생성) 처음부터 다시 셈 → resumed=False
+    # 반환: (새 기사의 분석에 필요한 필드, 다음 실행용 위치 {"inode", "offset"}, resumed)
+    st = os.stat(file_path)
+    end = committed_size(file_path)  # 병합 중인 꼬리는 제외
+    if end is None:
+        end = st.st_size
+    offset = prev.get("offset", 0)
+    resumed = prev.get("inode") == st.st_ino and offset <= end and not file_path.endswith(".json")
+    if not resumed:
+        offset = 0
 
-# 저장
-try:
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(result, f, indent=2, ensure_ascii=False)
-    print(f"✅ 핫 키워드 저장 완료: {OUTPUT_PATH}")
-except Exception as e:
-    print(f"❌ 저장 실패: {e}")
+    new_articles = []
+    for article in read_records(file_path, end, offset):
+        new_articles.append({
+            key: article[key] for key in ("id", "topic", "cleaned_title", "cleaned_description") if key in article
+        })
+    return new_articles, {"inode": st.st_ino, "offset": end}, resumed
+
+
+if __name__ == "__main__":
+    result = {b: {t: [] for t in TOPICS} for b in BROADCASTERS}
+    state = load_state()
+
+    with TokenizerPool(cache_path=TOKEN_CACHE_PATH) as tokenizer:
+        for broadcaster in BROADCASTERS:
+            file_path = resolve_records(os.path.join(DATA_DIR, f"{broadcaster}_crawling_with_summary"))
+            if file_path is None:
+                print(f"❌ {broadcaster} 기사 파일 없음. 건너뜁니다.")
+                continue
+
+            prev = state.get(broadcaster, {})
+            try:
+                new_articles, position, resumed = read_new_articles(file_path, prev)
+            except Exception as e:
+                print(f"⚠️ {broadcaster} 파일 로딩 중 오류: {e}")
+                continue
+            if not resumed and prev:
+                print(f"↩️ {broadcaster} 아카이브가 교체되거나 줄어듦 (재생성). 처음부터 다시 셉니다.")
+                prev = {}
+
+            topic_word_counts = defaultdict(Counter)
+            for topic, counts in prev.get("counts", {}).items():
+                topic_word_counts[topic].update(counts)
+
+            total = prev.get("records", 0) + len(new_articles)
+            print(f"🆕 {broadcaster}: 새 기사 {len(new_articles)}개 반영 (전체 {total}개)")
+            count_topic_nouns(new_articles, tokenizer, topic_word_counts)
+
+            state[broadcaster] = {
+                **position,
+                "records": total,
+                "counts": {topic: dict(counts) for topic, counts in topic_word_counts.items()},
+            }
+
+            for topic in TOPICS:
+                result[broadcaster][topic] = [
+                    word for word, _ in topic_word_counts[topic].most_common(10)
+                ]
+
+    # 저장
+    try:
+        save_state(state)
+        with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+        print(f"✅ 핫 키워드 저장 완료: {OUTPUT_PATH}")
+    except Exception as e:
+        print(f"❌ 저장 실패: {e}")
@@ -55,40 +55,45 @@
 # print(f"✅ 워드클라우드 생성 완료: {output_dir}")
     
 import os
+import sys
 import pandas as pd
-from konlpy.tag import Mecab
 from wordcloud import WordCloud
 from collections import defaultdict
 
-# 📂 데이터 불러오기
+# 프로젝트 루트의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tokenizer import TokenizerPool
+
+# 📂 데이터 경로
 data_path = "/Users/sseung/Documents/study/python_class/emer/test_result_from_json.csv"
-df = pd.read_csv(data_path)
-
-# 🧠 MeCab 명사 추출기
-mecab = Mecab()
-
-# ✅ 토픽별 텍스트 분류
-topic_texts = defaultdict(list)
-for _, row in df.iterrows():
-    topic = row.get("predicted_topic") or row.get("label")
-    text = row.get("text") or row.get("prompt")
-    if isinstance(text, str) and isinstance(topic, str):
-        topic_texts[topic].append(text)
-
-# ✅ 각 토픽별 단어 가중치만 출력
-for topic, texts in topic_texts.items():
-    combined = " ".join(texts)
-    nouns = mecab.nouns(combined)
-    filtered = [n for n in nouns if len(n) > 1]
-    final_text = " ".join(filtered)
-
-    wc = WordCloud(
-        font_path="/Library/Fonts/AppleGothic.ttf",  # Mac 기본 한글 폰트
-        background_color="white",
-        width=800,
-        height=400
-    ).generate(final_text)
-
-    print(f"\n📌 {topic} 토픽의 단어 가중치 (정규화된 값):")
-    for word, weight in wc.words_.items():
-        print(f"{word}: {weight:.4f}")
+token_cache_path = "/Users/sseung/Documents/study/python_class/project_root/data/cache/mecab_tokens.sqlite"  # 형태소 분석 캐시
+
+if __name__ == "__main__":
+    # 📂 데이터 불러오기
+    df = pd.read_csv(data_path)
+
+    # ✅ 토픽별 텍스트 분류
+    topic_texts = defaultdict(list)
+    for _, row in df.iterrows():
+        topic = row.get("predicted_topic") or row.get("label")
+        text = row.get("text") or row.get("prompt")
+        if isinstance(text, str) and isinstance(topic, str):
+            topic_texts[topic].append(text)
+
+    # 🧠 MeCab 명사 추출 (문서 단위로 병렬 처리 후 토픽별로 합침)
+    with TokenizerPool(cache_path=token_cache_path) as tokenizer:
+        # ✅ 각 토픽별 단어 가중치만 출력
+        for topic, texts in topic_texts.items():
+            filtered = [n for nouns in tokenizer.nouns(texts) for n in nouns if len(n) > 1]
+            final_text = " ".join(filtered)
+
+            wc = WordCloud(
+                font_path="/Library/Fonts/AppleGothic.ttf",  # Mac 기본 한글 폰트
+                background_color="white",
+                width=800,
+                height=400
+            ).generate(final_text)
+
+            print(f"\n📌 {topic} 토픽의 단어 가중치 (정규화된 값):")
+            for word, weight in wc.words_.items():
+                print(f"{word}: {weight:.4f}")
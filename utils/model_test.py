@@ -3,14 +3,19 @@ import json
 import pandas as pd
 import numpy as np
 import joblib
-from konlpy.tag import Mecab
+import sys
 from sklearn.metrics import classification_report
 
+# 프로젝트 루트의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tokenizer import TokenizerPool
+
 # ───────────────────────────────────────────────
 # 📁 경로 설정
 test_file = "/Users/sseung/Documents/study/python_class/project_root/data/news_combined.json"
 model_path = "/Users/sseung/Documents/study/python_class/project_root/model/news_classifier_allinone.pkl"
 output_path = "/Users/sseung/Documents/study/python_class/project_root/data/temp/test/test_result_from_json.csv"
+token_cache_path = "/Users/sseung/Documents/study/python_class/project_root/data/cache/mecab_tokens.sqlite"  # 형태소 분석 캐시
 
 # ───────────────────────────────────────────────
 # 🧠 분류기 클래스
@@ -36,47 +41,42 @@ class NewsClassifier:
         return dict(zip(self.label_encoder.classes_, probs))
 
 # ───────────────────────────────────────────────
-# 📦 모델 불러오기
-print("📦 모델 로드 중...")
-classifier = joblib.load(model_path)
-
-# 🔠 MeCab 로딩
-print("🔠 MeCab 로딩 중...")
-mecab = Mecab()
-
-def extract_nouns(text):
-    if not isinstance(text, str):
-        return []
-    return [n for n in mecab.nouns(text) if len(n) > 1]
+if __name__ == "__main__":
+    # 📦 모델 불러오기
+    print("📦 모델 로드 중...")
+    classifier = joblib.load(model_path)
 
-# 📂 테스트셋 로딩
-print("📂 테스트셋 로드 중...")
-test_df = pd.read_json(test_file)
+    # 📂 테스트셋 로딩
+    print("📂 테스트셋 로드 중...")
+    test_df = pd.read_json(test_file)
 
-# ✅ 컬럼 이름 확인 및 사용
-text_col = "text" if "text" in test_df.columns else "prompt"
-test_df["cleaned_title"] = test_df[text_col]
-test_df["cleaned_prompt"] = test_df[text_col]
+    # ✅ 컬럼 이름 확인 및 사용
+    text_col = "text" if "text" in test_df.columns else "prompt"
+    test_df["cleaned_title"] = test_df[text_col]
+    test_df["cleaned_prompt"] = test_df[text_col]
 
-# 🔧 명사 추출 및 결합
-print("🔧 명사 추출 중...")
-test_df["processed_text"] = (test_df["cleaned_title"] + " " + test_df["cleaned_prompt"]).apply(
-    lambda x: " ".join(extract_nouns(x))
-)
+    # 🔧 명사 추출 및 결합 (MeCab 병렬 처리)
+    print("🔧 명사 추출 중...")
+    combined = (test_df["cleaned_title"] + " " + test_df["cleaned_prompt"]).tolist()
+    texts = [x if isinstance(x, str) else "" for x in combined]
+    with TokenizerPool(cache_path=token_cache_path) as tokenizer:
+        test_df["processed_text"] = [
+            " ".join(n for n in nouns if len(n) > 1) for nouns in tokenizer.nouns(texts)
+        ]
 
-# 🤖 예측
-print("🤖 예측 중...")
-test_df["predicted_topic"] = test_df["processed_text"].apply(classifier.predict)
+    # 🤖 예측
+    print("🤖 예측 중...")
+    test_df["predicted_topic"] = test_df["processed_text"].apply(classifier.predict)
 
-# 📊 평가
-if "topic" in test_df.columns:
-    print("\n📊 테스트셋 분류 성능 평가:")
-    print(classification_report(test_df["topic"], test_df["predicted_topic"]))
-else:
-    print("\n🔍 라벨 없음 - 예측 결과:")
-    for i, row in test_df.iterrows():
-        print(f"[{i+1}] {row['cleaned_title']} → 예측: {row['predicted_topic']}")
+    # 📊 평가
+    if "topic" in test_df.columns:
+        print("\n📊 테스트셋 분류 성능 평가:")
+        print(classification_report(test_df["topic"], test_df["predicted_topic"]))
+    else:
+        print("\n🔍 라벨 없음 - 예측 결과:")
+        for i, row in test_df.iterrows():
+            print(f"[{i+1}] {row['cleaned_title']} → 예측: {row['predicted_topic']}")
 
-# 💾 결과 저장
-test_df.to_csv(output_path, index=False)
-print(f"\n✅ 결과 저장 완료: {output_path}")
+    # 💾 결과 저장
+    test_df.to_csv(output_path, index=False)
+    print(f"\n✅ 결과 저장 완료: {output_path}")
@@ -1,22 +1,70 @@
 import os
+import sys
 import json
-from openai import OpenAI
+import random
+import asyncio
+import time
+from openai import AsyncOpenAI, APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
 from dotenv import load_dotenv
-from tqdm import tqdm  
+from tqdm import tqdm
+
+# 프로젝트 루트의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from disk_cache import DiskCache
+from record_io import RecordWriter, iter_batches, read_records, record_path, resolve_records
 
 # 🔐 API 키 로딩
+# OPENAI_BASE_URL 환경변수를 주면 해당 주소로 요청 (로컬 스텁 서버로 테스트할 때 사용)
 load_dotenv()
-api_key = os.getenv("OPENAI_API_KEY")  
-client = OpenAI(api_key=api_key)
+api_key = os.getenv("OPENAI_API_KEY")
 
 
 # 📁 기본 경로 설정
 base_dir = "/Users/sseung/Documents/study/python_class/project_root/data/use/process"
 companies = ["kbs", "sbs", "ytn"]
+cache_path = "/Users/sseung/Documents/study/python_class/project_root/data/cache/summary_cache.sqlite"
 
-# 🧠 요약 함수
-def summarize_with_keywords(title, text, keywords):
-    prompt = f"""
+# 🧠 모델/프롬프트 설정 (프롬프트를 바꾸면 PROMPT_VERSION을 올려서 기존 캐시를 무효화)
+MODEL = "gpt-3.5-turbo"
+PROMPT_VERSION = 1
+SYSTEM_PROMPT = "너는 유능한 뉴스 요약가야. 사용자 핵심어 중심으로 요약해."
+CACHE_MAX_AGE_DAYS = 30  # 이 기간 동안 안 쓰인 요약은 캐시에서 삭제
+
+# ⚙️ 동시 요청/속도 제한 설정
+MAX_CONCURRENCY = 8          # 동시에 보내는 요청 수
+REQUESTS_PER_SECOND = 5      # 초당 요청 수 (토큰 버킷)
+MAX_RETRIES = 5              # 일시적 오류 재시도 횟수
+BACKOFF_BASE = 1.0           # 재시도 대기 기본값(초), 시도마다 2배
+BACKOFF_MAX = 30.0
+BATCH_SIZE = 500             # 한 번에 읽어서 요청하는 기사 수 (파일 전체를 메모리에 올리지 않음)
+
+# 재시도할 일시적 오류
+TRANSIENT_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+
+
+# 🪣 토큰 버킷: 초당 rate개씩 토큰이 차고, 요청마다 하나씩 사용
+class TokenBucket:
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def build_prompt(title, text, keywords):
+    return f"""
 다음은 뉴스 제목과 본문입니다.
 
 제목: {title}
@@ -27,40 +75,152 @@ def summarize_with_keywords(title, text, keywords):
 {', '.join(keywords)}
 """
 
-    try:
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[
-                {"role": "system", "content": "너는 유능한 뉴스 요약가야. 사용자 핵심어 중심으로 요약해."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.5,
-            max_tokens=300
+
+# 🧠 요약 함수
+async def summarize_with_keywords(client, semaphore, bucket, title, text, keywords):
+    prompt = build_prompt(title, text, keywords)
+
+    for attempt in range(MAX_RETRIES + 1):
+        async with semaphore:
+            await bucket.acquire()
+            try:
+                response = await client.chat.completions.create(
+                    model=MODEL,
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.5,
+                    max_tokens=300
+                )
+                return response.choices[0].message.content.strip()
+            except TRANSIENT_ERRORS as e:
+                if attempt == MAX_RETRIES:
+                    print(f"⚠️ 요약 실패 (재시도 {MAX_RETRIES}회 초과): {e}")
+                    return "요약 실패"
+                # 지수 백오프 + 지터 (여러 요청이 동시에 다시 몰리지 않도록)
+                delay = random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+            except Exception as e:
+                print(f"⚠️ 요약 실패: {e}")
+                return "요약 실패"
+        await asyncio.sleep(delay)
+
+
+def summary_cache_key(article):
+    # 프롬프트에 들어가는 값 + 모델/프롬프트 버전
+    return DiskCache.make_key(
+        PROMPT_VERSION, MODEL, SYSTEM_PROMPT,
+        article.get("title", ""),
+        article.get("description", ""),
+        article.get("keywords", []),
+    )
+
+
+def load_checkpoint(checkpoint_path):
+    # 체크포인트(JSONL)에서 성공한 요약만 {키: 요약}으로 복원, 실패한 건 다시 요청 대상
+    done = {}
+    if not checkpoint_path or not os.path.exists(checkpoint_path):
+        return done
+    with open(checkpoint_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # 중단되면서 잘린 마지막 줄
+            if record.get("failed"):
+                done.pop(record["key"], None)
+            else:
+                done[record["key"]] = record["summary"]
+    return done
+
+
+async def summarize_articles(client, articles, desc, cache=None, done=None, checkpoint=None):
+    # 체크포인트/캐시에 있는 요약은 그대로 쓰고, 나머지만 동시에 요청, 결과는 입력 순서대로 모음
+    # done: 체크포인트에서 복원한 {키: 요약} (main에서 언론사마다 한 번만 읽고 이번 결과로 계속 갱신)
+    # checkpoint: 추가 모드로 열린 체크포인트 파일
+    if done is None:
+        done = {}
+    keys = [summary_cache_key(article) for article in articles]
+    pending = [k for k in keys if k not in done]
+    cached = cache.get_many(pending) if cache is not None else {}
+    if len(pending) < len(keys):
+        print(f"↩️ 체크포인트에서 {len(keys) - len(pending)}개 복원, {len(pending)}개 남음")
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    bucket = TokenBucket(REQUESTS_PER_SECOND)
+    progress = tqdm(total=len(articles), initial=len(keys) - len(pending) + sum(k in cached for k in pending),
+                    desc=desc, ncols=80)
+
+    async def run(article, key):
+        if key in done:
+            return done[key]
+        if key in cached:
+            return cached[key]
+        summary = await summarize_with_keywords(
+            client, semaphore, bucket,
+            article.get("title", ""),
+            article.get("description", ""),
+            article.get("keywords", []),
         )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        print(f"⚠️ 요약 실패: {e}")
-        return "요약 실패"
-
-# 🔁 언론사별 처리
-for company in companies:
-    input_path = os.path.join(base_dir, f"{company}_processing_updated.json")
-    output_path = os.path.join(base_dir, f"{company.upper()}_processing_summary.json")
-
-    # JSON 열기
-    with open(input_path, "r", encoding="utf-8") as f:
-        articles = json.load(f)
-
-    # tqdm 진행바 추가
-    print(f"📡 {company.upper()} 기사 요약 시작...")
-    for article in tqdm(articles, desc=f"{company.upper()} 요약 중", ncols=80):
-        title = article.get("title", "")
-        text = article.get("description", "")
-        keywords = article.get("keywords", [])
-        article["summary"] = summarize_with_keywords(title, text, keywords)
-
-    # 저장
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(articles, f, ensure_ascii=False, indent=2)
-
-    print(f"✅ {company.upper()} 요약 완료 → {output_path}\n")
+        failed = summary == "요약 실패"
+        if cache is not None and not failed:
+            cache.set(key, summary)
+        if failed:
+            done.pop(key, None)
+        else:
+            done[key] = summary
+        if checkpoint is not None:
+            # 끝나는 대로 한 줄씩 추가 → 중간에 죽어도 완료된 건 다시 안 함
+            checkpoint.write(json.dumps({"key": key, "summary": summary, "failed": failed}, ensure_ascii=False) + "\n")
+            checkpoint.flush()
+        progress.update(1)
+        return summary
+
+    try:
+        return await asyncio.gather(*(run(article, key) for article, key in zip(articles, keys)))
+    finally:
+        progress.close()
+
+
+async def main():
+    client = AsyncOpenAI(api_key=api_key, max_retries=0)  # 재시도는 summarize_with_keywords에서 직접 처리
+    cache = DiskCache(cache_path, max_age_days=CACHE_MAX_AGE_DAYS)
+
+    # 🔁 언론사별 처리
+    for company in companies:
+        input_path = resolve_records(os.path.join(base_dir, f"{company}_processing_updated"))
+        output_path = record_path(os.path.join(base_dir, f"{company.upper()}_processing_summary"))
+        checkpoint_path = os.path.join(base_dir, f"{company.upper()}_summary_checkpoint.jsonl")
+        if input_path is None:
+            print(f"❌ {company.upper()} 입력 파일 없음. 건너뜁니다.")
+            continue
+
+        print(f"📡 {company.upper()} 기사 요약 시작...")
+        failed_count = 0
+        # 체크포인트는 언론사마다 한 번만 읽어서 모든 배치가 같이 사용
+        done = load_checkpoint(checkpoint_path)
+        # BATCH_SIZE개씩 읽어서 요약하고 바로 저장 (배치 안에서는 동시에 요청)
+        with RecordWriter(output_path) as writer, open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+            for batch_no, articles in enumerate(iter_batches(read_records(input_path), BATCH_SIZE), start=1):
+                summaries = await summarize_articles(client, articles, f"{company.upper()} 요약 중 #{batch_no}",
+                                                     cache, done, checkpoint)
+                for article, summary in zip(articles, summaries):
+                    article["summary"] = summary
+                    writer.write(article)
+                failed_count += summaries.count("요약 실패")
+
+        # 실패가 없으면 체크포인트 정리, 있으면 남겨서 다음 실행 때 실패한 기사만 다시 요청
+        if failed_count:
+            print(f"⚠️ {company.upper()} 요약 실패 {failed_count}개 → 다시 실행하면 실패한 기사만 재요청")
+        elif os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+
+        print(f"✅ {company.upper()} 요약 완료 → {output_path}\n")
+
+    stats = cache.stats()
+    print(f"💾 요약 캐시: 적중 {stats['hits']}건, 미적중 {stats['misses']}건 (적중률 {stats['hit_rate']:.1%})")
+    cache.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,30 +1,245 @@
+import os
+import sys
 import json
+import sqlite3
+from itertools import chain
 
-# 기존 및 신규 파일 경로
-original_path = "project_root/data/use/crawling/SBS_crawling_with_summary.json"      # 기존 뉴스 파일
-new_path = "project_root/data/use/process/SBS_processing_summary.json"       # 새로 추가할 뉴스 파일
-output_path = "project_root/data/use/crawling/SBS_crawling_with_summary.json"     # 저장할 병합된 파일
+# 프로젝트 루트의 공용 모듈 사용
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from record_io import (append_records, committed_size, meta_path, read_records, record_path, resolve_records,
+                       source_signature, strip_suffix, write_records)
+from article_db import ArticleDB
+from search_index import article_terms, terms_path
+from tokenizer import TokenizerPool
 
-# 파일 불러오기
-with open(original_path, "r", encoding="utf-8") as f:
-    original_data = json.load(f)
+# 기존 및 신규 파일 위치 (확장자는 .jsonl / .jsonl.gz / .json 중 있는 것 사용)
+crawling_dir = "project_root/data/use/crawling"     # 기존 뉴스 아카이브 {방송사}_crawling_with_summary
+process_dir = "project_root/data/use/process"       # 새로 추가할 뉴스 {방송사}_processing_summary
+db_path = "project_root/data/use/articles.sqlite"   # 웹 서버용 SQLite 저장소 (있으면 병합한 기사를 DB에도 추가)
+token_cache_path = "project_root/data/cache/mecab_tokens.sqlite"  # 형태소 분석 캐시 (검색용 명사 추출)
+BROADCASTERS = ["KBS", "SBS", "YTN"]
 
-with open(new_path, "r", encoding="utf-8") as f:
-    new_data = json.load(f)
+# 📎 아카이브 옆 사이드카 파일
+# - {이름}.meta.json: 마지막 id, 기사 수, 커밋된 아카이브/색인/명사 파일 크기, 아카이브 inode, 명사 파일에 들어 있는 기사 수
+# - {이름}.links: 아카이브에 있는 video_link 목록 (한 줄에 하나, 추가만 함)
+# - {이름}.terms.jsonl: 웹 검색용 기사별 MeCab 명사 (search_index.article_terms, 웹 서버는 MeCab 없이 이 파일만 읽음)
+# 새 기사는 아카이브 끝에 바로 추가하고, 메타에 크기를 기록해야 커밋됨
+# - 웹/다른 단계는 record_io.committed_size로 기록된 크기까지만 읽음 (추가 중인 꼬리는 안 보임)
+# - 추가 도중 죽어서 파일이 기록보다 크면 다음 실행에서 꼬리를 잘라내고 같은 새 파일을 다시 병합
+# - 메타가 없거나 다른 도구가 아카이브를 다시 쓴 경우 (record_io.committed_size가 None) 아카이브를 한 번 훑어서 다시 만듦
 
-# 기존 데이터의 마지막 id 값 확인
-existing_ids = [item.get("id", 0) for item in original_data if isinstance(item.get("id"), int)]
-max_id = max(existing_ids) if existing_ids else 0
 
-# 새 데이터에 id 재할당
-for i, article in enumerate(new_data, start=1):
-    article["id"] = max_id + i
+def sidecar_paths(archive_path):
+    return meta_path(archive_path), strip_suffix(archive_path) + ".links"
 
-# 병합
-merged_data = original_data + new_data
 
-# 저장
-with open(output_path, "w", encoding="utf-8") as f:
-    json.dump(merged_data, f, ensure_ascii=False, indent=2)
+def file_size(path):
+    return os.path.getsize(path) if os.path.exists(path) else 0
 
-print(f"✅ 병합 완료: 총 {len(merged_data)}개 → {output_path}")
+
+def truncate(path, size):
+    if file_size(path) > size:
+        with open(path, "r+b") as f:
+            f.truncate(size)
+
+
+def save_meta(meta_path, meta):
+    tmp_path = meta_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False)
+    os.replace(tmp_path, meta_path)
+
+
+def load_meta(archive_path):
+    meta_path, links_path = sidecar_paths(archive_path)
+    if os.path.exists(meta_path):
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            archive_tail = file_size(archive_path) - meta["archive_size"]
+            links_tail = file_size(links_path) - meta["links_size"]
+            if committed_size(archive_path) == meta["archive_size"] and links_tail >= 0:
+                if archive_tail or links_tail:
+                    print(f"✂️ {archive_path} 커밋되지 않은 꼬리 {archive_tail}바이트 잘라냄 (지난 병합이 중간에 멈춤)")
+                    truncate(archive_path, meta["archive_size"])
+                    truncate(links_path, meta["links_size"])
+                truncate(terms_path(archive_path), meta.get("terms_size", 0))
+                return meta
+            print(f"↩️ {archive_path} 사이드카가 아카이브와 맞지 않음. 다시 만듭니다.")
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"⚠️ 사이드카 로딩 실패, 다시 만듭니다: {e}")
+    return rebuild_meta(archive_path)
+
+
+def rebuild_meta(archive_path):
+    # 아카이브를 한 줄씩 읽어서 마지막 id와 video_link 색인 재생성
+    meta_path, links_path = sidecar_paths(archive_path)
+    if archive_path.endswith(".jsonl") and os.path.exists(archive_path):
+        truncate(archive_path, complete_lines_size(archive_path))
+    last_id = 0
+    records = 0
+    tmp_path = links_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as links:
+        if os.path.exists(archive_path):
+            for item in read_records(archive_path):
+                records += 1
+                if isinstance(item.get("id"), int):
+                    last_id = max(last_id, item["id"])
+                if item.get("video_link"):
+                    links.write(item["video_link"] + "\n")
+    os.replace(tmp_path, links_path)
+    meta = archive_meta(archive_path, links_path, last_id, records, None)  # 명사 파일은 다음 병합에서 다시 씀
+    save_meta(meta_path, meta)
+    return meta
+
+
+def archive_meta(archive_path, links_path, last_id, records, terms_records):
+    return {
+        "last_id": last_id,
+        "records": records,
+        "archive_size": file_size(archive_path),
+        "archive_inode": os.stat(archive_path).st_ino if os.path.exists(archive_path) else None,
+        "links_size": file_size(links_path),
+        "terms_records": terms_records,
+        "terms_size": file_size(terms_path(archive_path)),
+    }
+
+
+def complete_lines_size(path):
+    # 마지막 줄바꿈까지의 크기 (메타 없이 죽은 경우 끝에 남은 반쪽 줄 제외)
+    size = file_size(path)
+    with open(path, "rb") as f:
+        while size > 0:
+            start = max(0, size - 65536)
+            f.seek(start)
+            newline = f.read(size - start).rfind(b"\n")
+            if newline != -1:
+                return start + newline + 1
+            size = start
+    return 0
+
+
+def load_links(links_path):
+    if not os.path.exists(links_path):
+        return set()
+    with open(links_path, "r", encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+def update_terms(archive_path, meta, added):
+    # 🔎 검색용 명사 파일: 메타 커밋 전에 써서 웹이 새 기사를 볼 때는 이미 명사가 있음
+    # - 명사 파일이 아카이브를 따라오고 있으면 새 기사만 분석해서 추가,
+    #   아니면 (처음 실행 / 아카이브를 다시 만듦 / 지난번에 건너뜀) 아카이브 전체를 분석해서 다시 씀
+    # - MeCab이 없거나 분석에 실패하면 건너뜀 (그동안 웹은 제목 단어 + 핵심어로 색인) → 다음 실행에서 다시 시도
+    # 반환: 명사 파일에 들어 있는 기사 수 (메타의 terms_records)
+    path = terms_path(archive_path)
+    try:
+        with TokenizerPool(processes=1, cache_path=token_cache_path) as tokenizer:
+            if meta.get("terms_records") == meta["records"] and os.path.exists(path):
+                append_records(path, article_terms(tokenizer, added))
+            else:
+                archived = read_records(archive_path, meta["archive_size"]) if os.path.exists(archive_path) else []
+                count = write_records(path, article_terms(tokenizer, chain(archived, added)))
+                print(f"🔎 검색용 명사 파일 다시 만듦: {count}개 → {path}")
+    except Exception as e:
+        truncate(path, meta.get("terms_size", 0))
+        print(f"⚠️ 검색용 명사 파일 갱신 건너뜀 (웹은 제목 단어/핵심어로 검색): {e}")
+        return meta.get("terms_records")
+    return meta["records"] + len(added)
+
+
+def sync_db(broadcaster, articles, previous_source, source):
+    # 아카이브에 붙인 기사를 DB에도 추가 (실패해도 아카이브는 이미 커밋됨 → 서명이 달라서 웹은 파일을 읽음)
+    if not os.path.exists(db_path):
+        return
+    db = ArticleDB(db_path)
+    try:
+        count = db.append_articles(broadcaster, articles, previous_source, source)
+    except sqlite3.Error as e:
+        print(f"⚠️ {broadcaster} DB 추가 실패, 웹은 파일을 사용합니다: {e}")
+        return
+    finally:
+        db.close()
+    if count is None:
+        print(f"ℹ️ {broadcaster}: DB에 없거나 DB가 아카이브보다 오래됨 → 웹은 파일 사용 (python article_db.py {broadcaster})")
+    else:
+        print(f"🗄️ {broadcaster}: DB에도 {count}개 추가 → {db_path}")
+
+
+def merge(broadcaster):
+    new_path = resolve_records(os.path.join(process_dir, f"{broadcaster}_processing_summary"))
+    if new_path is None:
+        print(f"❌ {broadcaster} 새 뉴스 파일 없음. 건너뜁니다.")
+        return
+
+    archive_base = os.path.join(crawling_dir, f"{broadcaster}_crawling_with_summary")
+    archive_path = resolve_records(archive_base) or record_path(archive_base)
+    if archive_path.endswith(".json"):
+        # 예전 JSON 배열 아카이브는 JSONL로 한 번 옮김 (이후로는 추가만, 같은 이름의 .jsonl이 우선 사용됨)
+        legacy_path = archive_path
+        archive_path = record_path(legacy_path)
+        count = write_records(archive_path, read_records(legacy_path))
+        print(f"📦 {legacy_path} → {archive_path} 변환 ({count}개)")
+
+    meta = load_meta(archive_path)
+    meta_path, links_path = sidecar_paths(archive_path)
+    known_links = load_links(links_path)
+
+    added_links = []
+    added = []
+    skipped = 0
+
+    def new_records():
+        # video_link가 이미 아카이브에 있거나 이번 파일 안에서 중복이면 건너뛰고, 나머지는 id를 이어서 부여
+        # (크롤러가 만든 기사는 모두 video_link가 있음, 없는 기사는 구분할 방법이 없어서 그대로 추가)
+        nonlocal skipped
+        next_id = meta["last_id"]
+        for article in read_records(new_path):
+            link = article.get("video_link")
+            if link and link in known_links:
+                skipped += 1
+                continue
+            if link:
+                known_links.add(link)
+                added_links.append(link)
+            next_id += 1
+            article["id"] = next_id
+            added.append(article)
+            yield article
+
+    # 아카이브 끝에 새 기사만 바로 추가 (기존 기사는 복사/파싱/직렬화하지 않음)
+    # → 메타를 저장하기 전까지는 읽는 쪽에서 committed_size 뒤의 꼬리로 무시됨
+    committed = meta["archive_size"]
+    existed = os.path.exists(archive_path)
+    tsne_path = resolve_records(os.path.join(crawling_dir, f"{broadcaster}_tsne"))
+    previous_source = source_signature(archive_path, tsne_path)
+    try:
+        appended = append_records(archive_path, new_records())
+    except Exception:
+        truncate(archive_path, committed)
+        raise
+    if not appended:
+        truncate(archive_path, committed)  # gzip은 아무것도 안 써도 빈 멤버 헤더가 붙음
+        if not existed:
+            os.remove(archive_path)
+        print(f"✅ {broadcaster}: 새로 추가할 기사 없음 (중복 {skipped}개) → {archive_path}")
+        if meta.get("terms_records") != meta["records"]:
+            # 지난번에 명사 파일을 못 만들었으면 이번에 따라잡음
+            terms_records = update_terms(archive_path, meta, [])
+            save_meta(meta_path, archive_meta(archive_path, links_path, meta["last_id"], meta["records"], terms_records))
+        return
+
+    # 사이드카 갱신: 메타 저장이 커밋 (그 전에 죽으면 다음 실행에서 아카이브/색인/명사 파일 꼬리를 잘라내고 다시 병합)
+    terms_records = update_terms(archive_path, meta, added)
+    with open(links_path, "a", encoding="utf-8") as f:
+        for link in added_links:
+            f.write(link + "\n")
+    meta = archive_meta(archive_path, links_path, meta["last_id"] + appended, meta["records"] + appended, terms_records)
+    save_meta(meta_path, meta)
+    print(f"✅ {broadcaster} 병합 완료: {appended}개 추가 (중복 {skipped}개 제외), 총 {meta['records']}개 → {archive_path}")
+    sync_db(broadcaster, added, previous_source, source_signature(archive_path, tsne_path))
+
+
+if __name__ == "__main__":
+    for broadcaster in BROADCASTERS:
+        merge(broadcaster)